@@ -8,7 +8,7 @@ from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.crew_agent_executor import CrewAgentExecutor
-from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.knowledge import Knowledge, query_knowledge_sources
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.utils.knowledge_utils import extract_knowledge_context
 from crewai.lite_agent import LiteAgent, LiteAgentOutput
@@ -25,6 +25,11 @@ from crewai.utilities.agent_utils import (
     parse_tools,
     render_text_description_and_args,
 )
+from crewai.utilities.cancellation import (
+    ExecutionCancelledError,
+    ExecutionTimeoutError,
+    run_with_timeout,
+)
 from crewai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
 from crewai.utilities.converter import generate_model_description
 from crewai.utilities.events.agent_events import (
@@ -69,6 +74,8 @@ class Agent(BaseAgent):
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
             verbose: Whether the agent execution should be in verbose mode.
             allow_delegation: Whether the agent is allowed to delegate tasks to other agents.
+            parallel_delegation: Whether the agent can delegate several tasks to coworkers at once.
+            max_concurrent_delegations: Maximum number of delegated tasks this agent runs at the same time.
             tools: Tools at agents disposal
             step_callback: Callback to be executed after each step of the agent execution.
             knowledge_sources: Knowledge sources for the agent.
@@ -76,6 +83,13 @@ class Agent(BaseAgent):
     """
 
     _times_executed: int = PrivateAttr(default=0)
+    _executor_setup: Optional[
+        Tuple[Tuple[Any, ...], List[Any], Dict[str, str], List[str]]
+    ] = PrivateAttr(default=None)
+    _delegation_tools_cache: Optional[Tuple[Tuple[Any, ...], List[BaseTool]]] = (
+        PrivateAttr(default=None)
+    )
+    _multimodal_tools: Optional[List[BaseTool]] = PrivateAttr(default=None)
     max_execution_time: Optional[int] = Field(
         default=None,
         description="Maximum execution time for an agent to execute a task",
@@ -140,6 +154,10 @@ class Agent(BaseAgent):
         default=None,
         description="Maximum number of reasoning attempts before executing the task. If None, will try until ready.",
     )
+    cache_reasoning_plans: bool = Field(
+        default=False,
+        description="Whether reasoning plans are reused for identical tasks, tools and agent settings across kickoffs.",
+    )
     embedder: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Embedder configuration for the agent.",
@@ -167,6 +185,15 @@ class Agent(BaseAgent):
     guardrail_max_retries: int = Field(
         default=3, description="Maximum number of retries when guardrail fails"
     )
+    parallel_delegation: bool = Field(
+        default=False,
+        description="Whether the agent can delegate several tasks to coworkers at once. Only used when allow_delegation is True.",
+    )
+    max_concurrent_delegations: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of tasks delegated to this agent in parallel that it runs at the same time.",
+    )
 
     @model_validator(mode="before")
     def validate_from_repository(cls, v):
@@ -260,10 +287,14 @@ class Agent(BaseAgent):
                     AgentReasoningOutput,
                 )
 
-                reasoning_handler = AgentReasoning(task=task, agent=self)
-                reasoning_output: AgentReasoningOutput = (
-                    reasoning_handler.handle_agent_reasoning()
-                )
+                # The crew may have reasoned about the task up front
+                reasoning_output: Optional[AgentReasoningOutput] = None
+                if task._reasoning is not None and task._reasoning[0] is self:
+                    reasoning_output = task._reasoning[1]
+                task._reasoning = None
+                if reasoning_output is None:
+                    reasoning_handler = AgentReasoning(task=task, agent=self)
+                    reasoning_output = reasoning_handler.handle_agent_reasoning()
 
                 # Add the reasoning plan to the task description
                 task.description += f"\n\nReasoning Plan:\n{reasoning_output.plan.plan}"
@@ -306,13 +337,14 @@ class Agent(BaseAgent):
             )
 
         if self._is_any_available_memory():
-            crewai_event_bus.emit(
-                self,
-                event=MemoryRetrievalStartedEvent(
-                    task_id=str(task.id) if task else None,
-                    source_type="agent",
-                ),
-            )
+            if crewai_event_bus.has_handlers(MemoryRetrievalStartedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=MemoryRetrievalStartedEvent(
+                        task_id=str(task.id) if task else None,
+                        source_type="agent",
+                    ),
+                )
 
             start_time = time.time()
             contextual_memory = ContextualMemory(
@@ -327,15 +359,16 @@ class Agent(BaseAgent):
             if memory.strip() != "":
                 task_prompt += self.i18n.slice("memory").format(memory=memory)
 
-            crewai_event_bus.emit(
-                self,
-                event=MemoryRetrievalCompletedEvent(
-                    task_id=str(task.id) if task else None,
-                    memory_content=memory,
-                    retrieval_time_ms=(time.time() - start_time) * 1000,
-                    source_type="agent",
-                ),
-            )
+            if crewai_event_bus.has_handlers(MemoryRetrievalCompletedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=MemoryRetrievalCompletedEvent(
+                        task_id=str(task.id) if task else None,
+                        memory_content=memory,
+                        retrieval_time_ms=(time.time() - start_time) * 1000,
+                        source_type="agent",
+                    ),
+                )
         knowledge_config = (
             self.knowledge_config.model_dump() if self.knowledge_config else {}
         )
@@ -353,28 +386,29 @@ class Agent(BaseAgent):
                     task_prompt
                 )
                 if self.knowledge_search_query:
-                    # Quering agent specific knowledge
+                    # Querying agent and crew knowledge together
+                    knowledge_bases = {}
                     if self.knowledge:
-                        agent_knowledge_snippets = self.knowledge.query(
-                            [self.knowledge_search_query], **knowledge_config
-                        )
-                        if agent_knowledge_snippets:
-                            self.agent_knowledge_context = extract_knowledge_context(
-                                agent_knowledge_snippets
-                            )
-                            if self.agent_knowledge_context:
-                                task_prompt += self.agent_knowledge_context
-
-                    # Quering crew specific knowledge
-                    knowledge_snippets = self.crew.query_knowledge(
-                        [self.knowledge_search_query], **knowledge_config
+                        knowledge_bases["agent"] = self.knowledge
+                    if self.crew and self.crew.knowledge:
+                        knowledge_bases["crew"] = self.crew.knowledge
+                    knowledge_snippets = query_knowledge_sources(
+                        knowledge_bases,
+                        [self.knowledge_search_query],
+                        **knowledge_config,
+                    )
+
+                    self.agent_knowledge_context = extract_knowledge_context(
+                        [s for s in knowledge_snippets if s["knowledge"] == "agent"]
+                    )
+                    if self.agent_knowledge_context:
+                        task_prompt += self.agent_knowledge_context
+
+                    self.crew_knowledge_context = extract_knowledge_context(
+                        [s for s in knowledge_snippets if s["knowledge"] == "crew"]
                     )
-                    if knowledge_snippets:
-                        self.crew_knowledge_context = extract_knowledge_context(
-                            knowledge_snippets
-                        )
-                        if self.crew_knowledge_context:
-                            task_prompt += self.crew_knowledge_context
+                    if self.crew_knowledge_context:
+                        task_prompt += self.crew_knowledge_context
 
                     crewai_event_bus.emit(
                         self,
@@ -412,15 +446,16 @@ class Agent(BaseAgent):
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
         try:
-            crewai_event_bus.emit(
-                self,
-                event=AgentExecutionStartedEvent(
-                    agent=self,
-                    tools=self.tools,
-                    task_prompt=task_prompt,
-                    task=task,
-                ),
-            )
+            if crewai_event_bus.has_handlers(AgentExecutionStartedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=AgentExecutionStartedEvent(
+                        agent=self,
+                        tools=self.tools,
+                        task_prompt=task_prompt,
+                        task=task,
+                    ),
+                )
 
             # Determine execution method based on timeout setting
             if self.max_execution_time is not None:
@@ -437,8 +472,8 @@ class Agent(BaseAgent):
             else:
                 result = self._execute_without_timeout(task_prompt, task)
 
-        except TimeoutError as e:
-            # Propagate TimeoutError without retry
+        except (TimeoutError, ExecutionCancelledError) as e:
+            # Propagate timeouts and cancellation without retry
             crewai_event_bus.emit(
                 self,
                 event=AgentExecutionErrorEvent(
@@ -482,10 +517,11 @@ class Agent(BaseAgent):
         for tool_result in self.tools_results:  # type: ignore # Item "None" of "list[Any] | None" has no attribute "__iter__" (not iterable)
             if tool_result.get("result_as_answer", False):
                 result = tool_result["result"]
-        crewai_event_bus.emit(
-            self,
-            event=AgentExecutionCompletedEvent(agent=self, task=task, output=result),
-        )
+        if crewai_event_bus.has_handlers(AgentExecutionCompletedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionCompletedEvent(agent=self, task=task, output=result),
+            )
         return result
 
     def _execute_with_timeout(self, task_prompt: str, task: Task, timeout: int) -> str:
@@ -503,23 +539,23 @@ class Agent(BaseAgent):
             TimeoutError: If execution exceeds the timeout.
             RuntimeError: If execution fails for other reasons.
         """
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                self._execute_without_timeout, task_prompt=task_prompt, task=task
+        try:
+            return run_with_timeout(
+                self._execute_without_timeout,
+                timeout,
+                task_prompt=task_prompt,
+                task=task,
             )
-
-            try:
-                return future.result(timeout=timeout)
-            except concurrent.futures.TimeoutError:
-                future.cancel()
-                raise TimeoutError(
-                    f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
-                )
-            except Exception as e:
-                future.cancel()
-                raise RuntimeError(f"Task execution failed: {str(e)}")
+        except ExecutionTimeoutError:
+            # The worker's cancellation token is already cancelled, so it stops
+            # at its next LLM or tool call instead of running on in the background.
+            raise TimeoutError(
+                f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
+            )
+        except ExecutionCancelledError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Task execution failed: {str(e)}")
 
     def _execute_without_timeout(self, task_prompt: str, task: Task) -> str:
         """Execute a task without a timeout.
@@ -540,33 +576,85 @@ class Agent(BaseAgent):
             }
         )["output"]
 
+    def repair_task_output(self, task: Task, feedback: str) -> Optional[str]:
+        """Ask for a corrected final answer to the task the agent just executed.
+
+        The feedback is appended to the conversation of the last execution, so
+        reasoning, memory and knowledge retrieval are not repeated and the
+        agent keeps the tool results it already has.
+
+        Args:
+            task: Task whose output failed validation.
+            feedback: Message explaining why the output was rejected.
+
+        Returns:
+            The corrected output, or None if the conversation of the task's
+            execution is no longer available.
+        """
+        executor = self.agent_executor
+        if executor is None or executor.task is not task or not executor.messages:
+            return None
+
+        if self.max_execution_time is not None:
+            try:
+                result = run_with_timeout(
+                    executor.repair, self.max_execution_time, feedback=feedback
+                )["output"]
+            except ExecutionTimeoutError:
+                raise TimeoutError(
+                    f"Repairing the output of task '{task.description}' timed out after {self.max_execution_time} seconds."
+                )
+        else:
+            result = executor.repair(feedback)["output"]
+
+        if crewai_event_bus.has_handlers(AgentExecutionCompletedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionCompletedEvent(agent=self, task=task, output=result),
+            )
+        return result
+
     def create_agent_executor(
         self, tools: Optional[List[BaseTool]] = None, task=None
     ) -> None:
         """Create an agent executor for the agent.
 
+        Parsing the tools and rendering the prompt only depend on the toolset,
+        the templates and the agent's settings, so they are cached and reused
+        as long as their fingerprint matches. A new executor is still built on
+        every call, so concurrent tasks never share conversation state.
+
         Returns:
             An instance of the CrewAgentExecutor class.
         """
         raw_tools: List[BaseTool] = tools or self.tools or []
-        parsed_tools = parse_tools(raw_tools)
+        fingerprint = self._executor_fingerprint_for(raw_tools)
 
-        prompt = Prompts(
-            agent=self,
-            has_tools=len(raw_tools) > 0,
-            i18n=self.i18n,
-            use_system_prompt=self.use_system_prompt,
-            system_template=self.system_template,
-            prompt_template=self.prompt_template,
-            response_template=self.response_template,
-        ).task_execution()
+        if self._executor_setup is not None and self._executor_setup[0] == fingerprint:
+            _, parsed_tools, prompt, stop_words = self._executor_setup
+            for structured_tool, tool in zip(parsed_tools, raw_tools):
+                structured_tool.current_usage_count = tool.current_usage_count
+        else:
+            parsed_tools = parse_tools(raw_tools)
 
-        stop_words = [self.i18n.slice("observation")]
+            prompt = Prompts(
+                agent=self,
+                has_tools=len(raw_tools) > 0,
+                i18n=self.i18n,
+                use_system_prompt=self.use_system_prompt,
+                system_template=self.system_template,
+                prompt_template=self.prompt_template,
+                response_template=self.response_template,
+            ).task_execution()
+
+            stop_words = [self.i18n.slice("observation")]
+
+            if self.response_template:
+                stop_words.append(
+                    self.response_template.split("{{ .Response }}")[1].strip()
+                )
 
-        if self.response_template:
-            stop_words.append(
-                self.response_template.split("{{ .Response }}")[1].strip()
-            )
+            self._executor_setup = (fingerprint, parsed_tools, prompt, stop_words)
 
         self.agent_executor = CrewAgentExecutor(
             llm=self.llm,
@@ -576,7 +664,7 @@ class Agent(BaseAgent):
             tools=parsed_tools,
             prompt=prompt,
             original_tools=raw_tools,
-            stop_words=stop_words,
+            stop_words=list(stop_words),
             max_iter=self.max_iter,
             tools_handler=self.tools_handler,
             tools_names=get_tool_names(parsed_tools),
@@ -590,15 +678,45 @@ class Agent(BaseAgent):
             callbacks=[TokenCalcHandler(self._token_process)],
         )
 
+    def _executor_fingerprint_for(self, tools: List[BaseTool]) -> Tuple[Any, ...]:
+        """Identify everything the parsed tools and rendered prompt depend on.
+
+        Objects are compared by identity; the cached setup keeps the tools
+        referenced, so their ids stay valid while it is cached.
+        """
+        return (
+            tuple((id(tool), tool.name, tool.description) for tool in tools),
+            self.role,
+            self.goal,
+            self.backstory,
+            self.i18n.prompt_file,
+            self.use_system_prompt,
+            self.system_template,
+            self.prompt_template,
+            self.response_template,
+        )
+
     def get_delegation_tools(self, agents: List[BaseAgent]):
-        agent_tools = AgentTools(agents=agents)
+        key = (
+            tuple((id(agent), agent.role) for agent in agents),
+            self.parallel_delegation,
+        )
+        if self._delegation_tools_cache and self._delegation_tools_cache[0] == key:
+            return self._delegation_tools_cache[1]
+
+        agent_tools = AgentTools(
+            agents=agents, parallel_delegation=self.parallel_delegation
+        )
         tools = agent_tools.tools()
+        self._delegation_tools_cache = (key, tools)
         return tools
 
     def get_multimodal_tools(self) -> Sequence[BaseTool]:
         from crewai.tools.agent_tools.add_image_tool import AddImageTool
 
-        return [AddImageTool()]
+        if self._multimodal_tools is None:
+            self._multimodal_tools = [AddImageTool()]
+        return self._multimodal_tools
 
     def get_code_execution_tools(self):
         try:
@@ -257,6 +257,14 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    def repair_task_output(self, task: Any, feedback: str) -> Optional[str]:
+        """Ask for a corrected final answer without executing the task again.
+
+        Agents that cannot continue their last execution return None, and the
+        task is executed again instead.
+        """
+        return None
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
@@ -8,7 +10,7 @@ from crewai.agents.parser import (
     OutputParserException,
 )
 from crewai.agents.tools_handler import ToolsHandler
-from crewai.llm import BaseLLM
+from crewai.llm import LLM, BaseLLM
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_types import ToolResult
@@ -26,6 +28,7 @@ from crewai.utilities.agent_utils import (
     is_context_length_exceeded,
     process_llm_response,
 )
+from crewai.utilities.cancellation import ExecutionCancelledError, check_cancelled
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
 from crewai.utilities.logger import Logger
 from crewai.utilities.tool_utils import execute_tool_and_check_finality
@@ -118,6 +121,8 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 color="red",
             )
             raise
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             handle_unknown_error(self._printer, e)
             if e.__class__.__module__.startswith("litellm"):
@@ -134,14 +139,33 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._create_external_memory(formatted_answer)
         return {"output": formatted_answer.output}
 
+    def repair(self, feedback: str) -> Dict[str, Any]:
+        """Continue the last conversation to get a corrected final answer.
+
+        The feedback is sent after the rejected final answer, so the agent
+        keeps its earlier reasoning and tool results and can still use tools
+        if it needs to. The repair gets its own max_iter budget, as the
+        execution it continues may have used up the previous one.
+        """
+        self._append_message(feedback, role="user")
+        self.iterations = 0
+        formatted_answer = self._invoke_loop()
+
+        self._create_short_term_memory(formatted_answer)
+        self._create_long_term_memory(formatted_answer)
+        self._create_external_memory(formatted_answer)
+        return {"output": formatted_answer.output}
+
     def _invoke_loop(self) -> AgentFinish:
         """
         Main loop to invoke the agent's thought process until it reaches a conclusion
         or the maximum number of iterations is reached.
         """
         formatted_answer = None
+        response_format = self._native_response_format()
         while not isinstance(formatted_answer, AgentFinish):
             try:
+                check_cancelled()
                 if has_reached_max_iterations(self.iterations, self.max_iter):
                     formatted_answer = handle_max_iterations_exceeded(
                         formatted_answer,
@@ -159,9 +183,20 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     messages=self.messages,
                     callbacks=self.callbacks,
                     printer=self._printer,
-                    from_task=self.task
+                    from_task=self.task,
+                    stop_on_complete_action=True,
+                    response_format=response_format,
                 )
-                formatted_answer = process_llm_response(answer, self.use_stop_words)
+                if response_format is not None:
+                    # The answer is the JSON document itself; the task validates
+                    # it and only falls back to its converter if that fails.
+                    formatted_answer = AgentFinish(
+                        thought="", output=answer, text=answer
+                    )
+                else:
+                    formatted_answer = process_llm_response(
+                        answer, self.use_stop_words
+                    )
 
                 if isinstance(formatted_answer, AgentAction):
                     # Extract agent fingerprint if available
@@ -205,6 +240,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     printer=self._printer,
                 )
 
+            except ExecutionCancelledError:
+                raise
+
             except Exception as e:
                 if e.__class__.__module__.startswith("litellm"):
                     # Do not retry on litellm errors
@@ -233,6 +271,22 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    def _native_response_format(self) -> Optional[Type[BaseModel]]:
+        """Return the model to request natively for the final answer, if any.
+
+        Only tasks opting into native structured output qualify, and only when
+        the agent has no tools, so that every turn is the final answer, and the
+        LLM supports JSON schema response formats.
+        """
+        if not getattr(self.task, "native_structured_output", False):
+            return None
+        model = self.task.output_pydantic or self.task.output_json
+        if model is None or self.tools or not isinstance(self.llm, LLM):
+            return None
+        if self.llm.response_format is not None:
+            return None
+        return model if self.llm.supports_response_schema() else None
+
     def _handle_agent_action(
         self, formatted_answer: AgentAction, tool_result: ToolResult
     ) -> Union[AgentAction, AgentFinish]:
@@ -167,3 +167,90 @@ class CrewAgentParser:
             return tool_input
 
         return str(result)
+
+
+class StreamingCrewAgentParser:
+    """Incrementally scans a streamed ReAct completion for a finished tool call.
+
+    Chunks are passed to :meth:`feed` as they arrive. As soon as the text
+    contains an ``Action Input:`` whose JSON object or array is balanced,
+    :meth:`feed` returns the completion up to the end of that JSON value, so
+    the caller can stop generation and dispatch the tool without waiting for
+    the model to reach a stop word. Tool inputs that are not JSON, and final
+    answers, have no detectable end and are left to run to completion.
+
+    Each character is scanned once, so feeding a whole completion costs
+    linear time regardless of chunk size.
+    """
+
+    _ACTION_INPUT_PATTERN = re.compile(r"Action\s*\d*\s*Input\s*\d*\s*:")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._search_from = 0
+        self._json_start: Optional[int] = None
+        self._scan_at = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Add a chunk and return the finished completion if a tool call is complete."""
+        if self._done:
+            return None
+        checked = max(0, len(self.text) - len(FINAL_ANSWER_ACTION))
+        self.text += chunk
+
+        if FINAL_ANSWER_ACTION in self.text[checked:]:
+            # parse() prefers a final answer over an action; keep streaming.
+            self._done = True
+            return None
+
+        if self._json_start is None and not self._find_json_start():
+            return None
+        return self._scan_json()
+
+    def _find_json_start(self) -> bool:
+        # Keep enough overlap to match a marker split across chunks.
+        match = self._ACTION_INPUT_PATTERN.search(
+            self.text, max(0, self._search_from - 32)
+        )
+        if match is None:
+            self._search_from = len(self.text)
+            return False
+        self._search_from = match.end()
+
+        rest = self.text[match.end() :]
+        stripped = rest.lstrip()
+        if not stripped:
+            return False
+        if stripped[0] not in "{[":
+            self._done = True
+            return False
+        self._json_start = match.end() + len(rest) - len(stripped)
+        self._scan_at = self._json_start
+        return True
+
+    def _scan_json(self) -> Optional[str]:
+        text = self.text
+        for index in range(self._scan_at, len(text)):
+            char = text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    return text[: index + 1]
+        self._scan_at = len(text)
+        return None
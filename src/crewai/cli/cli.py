@@ -110,13 +110,20 @@ def replay(task_id: str) -> None:
 
 
 @crewai.command()
-def log_tasks_outputs() -> None:
+@click.option(
+    "-k",
+    "--kickoff-id",
+    type=str,
+    default=None,
+    help="Show the task outputs of this kickoff instead of the latest one",
+)
+def log_tasks_outputs(kickoff_id: Optional[str]) -> None:
     """
     Retrieve your latest crew.kickoff() task outputs.
     """
     try:
         storage = KickoffTaskOutputsSQLiteStorage()
-        tasks = storage.load()
+        tasks = storage.load(kickoff_id)
 
         if not tasks:
             click.echo(
@@ -124,6 +131,7 @@ def log_tasks_outputs() -> None:
             )
             return
 
+        click.echo(f"Kickoff: {tasks[0]['kickoff_id']}")
         for index, task in enumerate(tasks, 1):
             click.echo(f"Task {index}: {task['task_id']}")
             click.echo(f"Description: {task['expected_output']}")
@@ -1,9 +1,10 @@
 import asyncio
+import contextvars
 import json
 import re
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy as shallow_copy
 from hashlib import md5
 from typing import (
@@ -12,6 +13,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -57,6 +59,7 @@ from crewai.tools.agent_tools.agent_tools import AgentTools
 from crewai.tools.base_tool import BaseTool, Tool
 from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities import I18N, FileHandler, Logger, RPMController
+from crewai.utilities.cancellation import cancellation_scope, check_cancelled
 from crewai.utilities.constants import NOT_SPECIFIED, TRAINING_DATA_FILE
 from crewai.utilities.evaluators.crew_evaluator_handler import CrewEvaluator
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -94,6 +97,7 @@ class Crew(FlowTrackable, BaseModel):
         agents: List of agents part of this crew.
         manager_llm: The language model that will run manager agent.
         manager_agent: Custom agent that will be used as manager.
+        parallel_delegation: Whether the manager can delegate several tasks to coworkers at once.
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
         cache: Whether the crew should use a cache to store the results of the tools execution.
@@ -108,6 +112,8 @@ class Crew(FlowTrackable, BaseModel):
         step_callback: Callback to be executed after each step for every agents execution.
         share_crew: Whether you want to share the complete crew information and execution with crewAI to make the library better, and allow us to train models.
         planning: Plan the crew execution and add the plan to the crew.
+        cache_planning: Whether crew plans are reused across kickoffs with identical tasks.
+        parallel_reasoning: Whether agents reason about their tasks concurrently before the first task runs.
         chat_llm: The language model used for orchestrating chat interactions with the crew.
         security_config: Security configuration for the crew, including fingerprinting.
     """
@@ -181,6 +187,10 @@ class Crew(FlowTrackable, BaseModel):
     manager_agent: Optional[BaseAgent] = Field(
         description="Custom agent that will be used as manager.", default=None
     )
+    parallel_delegation: bool = Field(
+        default=False,
+        description="Whether the manager agent can delegate several tasks to coworkers at once in hierarchical processes.",
+    )
     function_calling_llm: Optional[Union[str, InstanceOf[LLM], Any]] = Field(
         description="Language model that will run the agent.", default=None
     )
@@ -225,6 +235,14 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Language model that will run the AgentPlanner if planning is True.",
     )
+    cache_planning: bool = Field(
+        default=False,
+        description="Whether the crew plan is reused across kickoffs when the tasks, agents and tools are unchanged.",
+    )
+    parallel_reasoning: bool = Field(
+        default=False,
+        description="Whether agents with reasoning enabled plan all their tasks concurrently before the first task runs, overlapping with crew planning.",
+    )
     task_execution_output_json_files: Optional[List[str]] = Field(
         default=None,
         description="List of file paths for task execution JSON files.",
@@ -334,8 +352,39 @@ class Crew(FlowTrackable, BaseModel):
             self._initialize_default_memories()
             self._initialize_user_memory()
 
+        self._configure_write_behind_memories()
+
         return self
 
+    def _configure_write_behind_memories(self) -> None:
+        """Queue short-term, entity and long-term memory saves when configured.
+
+        Enabled with ``memory_config={"write_behind": True}`` or a dict of
+        ``batch_size`` and ``flush_interval`` options.
+        """
+        write_behind = (self.memory_config or {}).get("write_behind")
+        if not write_behind:
+            return
+
+        options = write_behind if isinstance(write_behind, dict) else {}
+        for memory in (
+            self._short_term_memory,
+            self._entity_memory,
+            self._long_term_memory,
+        ):
+            if memory is not None:
+                memory.enable_write_behind(**options)
+
+    def flush_memories(self) -> None:
+        """Write any memory saves still queued by write-behind storage."""
+        for memory in (
+            self._short_term_memory,
+            self._entity_memory,
+            self._long_term_memory,
+        ):
+            if memory is not None:
+                memory.flush()
+
     @model_validator(mode="after")
     def create_crew_knowledge(self) -> "Crew":
         """Create the knowledge for the crew."""
@@ -638,7 +687,7 @@ class Crew(FlowTrackable, BaseModel):
             )
 
             # Starts the crew to work on its assigned tasks.
-            self._task_output_handler.reset()
+            self._task_output_handler.start_kickoff()
             self._logging_color = "bold_purple"
 
             if inputs is not None:
@@ -662,8 +711,13 @@ class Crew(FlowTrackable, BaseModel):
 
                 agent.create_agent_executor()
 
+            self._clear_reasoning()
+            reasoning = self._start_reasoning()
+
             if self.planning:
-                self._handle_crew_planning()
+                self._handle_crew_planning(reasoning)
+            else:
+                self._finish_reasoning(reasoning)
 
             if self.process == Process.sequential:
                 result = self._run_sequential_process()
@@ -687,6 +741,7 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
         finally:
+            self.flush_memories()
             detach(token)
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
@@ -707,12 +762,20 @@ class Crew(FlowTrackable, BaseModel):
             results.append(output)
 
         self.usage_metrics = total_usage_metrics
-        self._task_output_handler.reset()
         return results
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
-        """Asynchronous kickoff method to start the crew execution."""
-        return await asyncio.to_thread(self.kickoff, inputs)
+        """Asynchronous kickoff method to start the crew execution.
+
+        Cancelling the awaiting task also cancels the crew, so its agents stop
+        at their next LLM or tool call instead of running on in the background.
+        """
+        with cancellation_scope() as token:
+            try:
+                return await asyncio.to_thread(self.kickoff, inputs)
+            except asyncio.CancelledError:
+                token.cancel("Crew kickoff was cancelled")
+                raise
 
     async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
         crew_copies = [self.copy() for _ in inputs]
@@ -733,19 +796,79 @@ class Crew(FlowTrackable, BaseModel):
                 total_usage_metrics.add_usage_metrics(crew.usage_metrics)
 
         self.usage_metrics = total_usage_metrics
-        self._task_output_handler.reset()
         return results
 
-    def _handle_crew_planning(self):
-        """Handles the Crew planning."""
+    def _handle_crew_planning(
+        self, reasoning: Sequence[Tuple[Task, "Future[Any]"]] = ()
+    ):
+        """Handles the Crew planning.
+
+        Reasoning started up front is finished before the plan is added to
+        the task descriptions, so it never sees a half-updated task.
+        """
         self._logger.log("info", "Planning the crew execution")
         result = CrewPlanner(
-            tasks=self.tasks, planning_agent_llm=self.planning_llm
+            tasks=self.tasks,
+            planning_agent_llm=self.planning_llm,
+            cache=self.cache_planning,
         )._handle_crew_planning()
+        self._finish_reasoning(reasoning)
 
         for task, step_plan in zip(self.tasks, result.list_of_plans_per_task):
             task.description += step_plan.plan
 
+    def _clear_reasoning(self) -> None:
+        """Drop plans made up front by an earlier run that never used them."""
+        for task in self.tasks:
+            task._reasoning = None
+
+    def _start_reasoning(self) -> List[Tuple[Task, "Future[Any]"]]:
+        """Start reasoning about every task whose agent reasons, concurrently.
+
+        Only used with parallel_reasoning in sequential processes, where each
+        task's agent is known up front. The reasoning prompt only depends on
+        the task and its agent, not on the output of earlier tasks, so the
+        tasks can be reasoned about independently.
+        """
+        if not self.parallel_reasoning or self.process != Process.sequential:
+            return []
+        tasks = [
+            task
+            for task in self.tasks
+            if isinstance(task.agent, Agent) and task.agent.reasoning
+        ]
+        if not tasks:
+            return []
+
+        from crewai.utilities.reasoning_handler import AgentReasoning
+
+        def reason(task: Task) -> Any:
+            return AgentReasoning(
+                task=task, agent=task.agent  # type: ignore[arg-type]
+            ).handle_agent_reasoning()
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(tasks), thread_name_prefix="crewai-reasoning"
+        )
+        try:
+            return [
+                (task, executor.submit(contextvars.copy_context().run, reason, task))
+                for task in tasks
+            ]
+        finally:
+            executor.shutdown(wait=False)
+
+    def _finish_reasoning(
+        self, reasoning: Sequence[Tuple[Task, "Future[Any]"]]
+    ) -> None:
+        """Hand the plans made up front to the agents that will execute the tasks."""
+        for task, future in reasoning:
+            try:
+                task._reasoning = (task.agent, future.result())  # type: ignore[assignment]
+            except Exception as e:
+                # The agent reasons again when it executes the task.
+                self._logger.log("error", f"Error during reasoning process: {e}")
+
     def _store_execution_log(
         self,
         task: Task,
@@ -788,6 +911,10 @@ class Crew(FlowTrackable, BaseModel):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
             self.manager_agent.allow_delegation = True
+            if self.parallel_delegation and hasattr(
+                self.manager_agent, "parallel_delegation"
+            ):
+                self.manager_agent.parallel_delegation = True
             manager = self.manager_agent
             if manager.tools is not None and len(manager.tools) > 0:
                 self._logger.log(
@@ -801,8 +928,11 @@ class Crew(FlowTrackable, BaseModel):
                 role=i18n.retrieve("hierarchical_manager_agent", "role"),
                 goal=i18n.retrieve("hierarchical_manager_agent", "goal"),
                 backstory=i18n.retrieve("hierarchical_manager_agent", "backstory"),
-                tools=AgentTools(agents=self.agents).tools(),
+                tools=AgentTools(
+                    agents=self.agents, parallel_delegation=self.parallel_delegation
+                ).tools(),
                 allow_delegation=True,
+                parallel_delegation=self.parallel_delegation,
                 llm=self.manager_llm,
                 verbose=self.verbose,
             )
@@ -830,6 +960,7 @@ class Crew(FlowTrackable, BaseModel):
         last_sync_output: Optional[TaskOutput] = None
 
         for task_index, task in enumerate(tasks):
+            check_cancelled()
             if start_index is not None and task_index < start_index:
                 if task.output:
                     if task.async_execution:
@@ -1103,33 +1234,31 @@ class Crew(FlowTrackable, BaseModel):
             )
         return task_outputs
 
-    def _find_task_index(
-        self, task_id: str, stored_outputs: List[Any]
-    ) -> Optional[int]:
-        return next(
-            (
-                index
-                for (index, d) in enumerate(stored_outputs)
-                if d["task_id"] == str(task_id)
-            ),
-            None,
-        )
-
     def replay(
-        self, task_id: str, inputs: Optional[Dict[str, Any]] = None
+        self,
+        task_id: str,
+        inputs: Optional[Dict[str, Any]] = None,
+        kickoff_id: Optional[str] = None,
     ) -> CrewOutput:
-        stored_outputs = self._task_output_handler.load()
-        if not stored_outputs:
-            raise ValueError(f"Task with id {task_id} not found in the crew's tasks.")
+        """Re-run the crew starting from a task of a previous kickoff.
 
-        start_index = self._find_task_index(task_id, stored_outputs)
+        Only the stored outputs that can reach the replayed tasks as context
+        are read back, so the cost does not grow with the length of the run.
 
-        if start_index is None:
+        Args:
+            task_id: ID of the task to replay from.
+            inputs: Inputs for the replay. Defaults to the inputs of the kickoff.
+            kickoff_id: Kickoff to replay. Defaults to the most recent kickoff
+                that ran the task.
+        """
+        stored = self._task_output_handler.find(task_id, kickoff_id)
+        if stored is None:
             raise ValueError(f"Task with id {task_id} not found in the crew's tasks.")
 
-        replay_inputs = (
-            inputs if inputs is not None else stored_outputs[start_index]["inputs"]
-        )
+        start_index = stored["task_index"]
+        self._task_output_handler.use_kickoff(stored["kickoff_id"])
+
+        replay_inputs = inputs if inputs is not None else stored["inputs"]
         self._inputs = replay_inputs
 
         if replay_inputs:
@@ -1138,10 +1267,10 @@ class Crew(FlowTrackable, BaseModel):
         if self.process == Process.hierarchical:
             self._create_manager_agent()
 
-        for i in range(start_index):
-            stored_output = stored_outputs[i][
-                "output"
-            ]  # for adding context to the task
+        stored_outputs = self._task_output_handler.load_outputs(
+            stored["kickoff_id"], self._replay_context_indexes(start_index)
+        )
+        for i, stored_output in stored_outputs.items():
             task_output = TaskOutput(
                 description=stored_output["description"],
                 agent=stored_output["agent"],
@@ -1152,10 +1281,34 @@ class Crew(FlowTrackable, BaseModel):
             )
             self.tasks[i].output = task_output
 
+        self._clear_reasoning()
         self._logging_color = "bold_blue"
         result = self._execute_tasks(self.tasks, start_index, True)
         return result
 
+    def _replay_context_indexes(self, start_index: int) -> Set[int]:
+        """Indexes of the tasks before ``start_index`` whose outputs a replay needs.
+
+        These are the last synchronous task and the asynchronous tasks after
+        it, which form the implicit context of the first replayed task, plus
+        any task explicitly used as context by a replayed task.
+        """
+        indexes: Set[int] = set()
+        for index in range(start_index - 1, -1, -1):
+            indexes.add(index)
+            if not self.tasks[index].async_execution:
+                break
+
+        positions = {id(task): i for i, task in enumerate(self.tasks[:start_index])}
+        for task in self.tasks[start_index:]:
+            if isinstance(task.context, list):
+                indexes.update(
+                    positions[id(context_task)]
+                    for context_task in task.context
+                    if id(context_task) in positions
+                )
+        return indexes
+
     def query_knowledge(
         self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
     ) -> Union[List[Dict[str, Any]], None]:
@@ -24,6 +24,8 @@ from crewai.evaluation.metrics.tools_metrics import (
     ToolInvocationEvaluator
 )
 
+from crewai.evaluation.trace_store import TraceStore
+
 from crewai.evaluation.evaluation_listener import (
     EvaluationTraceCallback,
     create_evaluation_callbacks
@@ -46,6 +48,7 @@ __all__ = [
     "ToolSelectionEvaluator",
     "ParameterExtractionEvaluator",
     "ToolInvocationEvaluator",
+    "TraceStore",
     "EvaluationTraceCallback",
     "create_evaluation_callbacks",
     "AgentEvaluator",
@@ -1,12 +1,19 @@
+import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from collections.abc import Sequence
 
 from crewai.agent import Agent
 from crewai.task import Task
+from crewai.evaluation.trace_store import TraceStore
 from crewai.utilities.events.base_event_listener import BaseEventListener
 from crewai.utilities.events.crewai_event_bus import CrewAIEventsBus
+from crewai.utilities.events.crew_events import (
+    CrewKickoffStartedEvent,
+    CrewKickoffCompletedEvent,
+    CrewKickoffFailedEvent
+)
 from crewai.utilities.events.agent_events import (
     AgentExecutionStartedEvent,
     AgentExecutionCompletedEvent
@@ -29,6 +36,9 @@ class EvaluationTraceCallback(BaseEventListener):
     This listener attaches to the event bus to collect detailed information
     about the execution process, including agent steps, tool uses, knowledge
     retrievals, and final output - all for use in agent evaluation.
+
+    Traces are held in a bounded :class:`TraceStore`; use :meth:`configure_store`
+    to change its retention or enable spilling evicted traces to SQLite.
     """
 
     _instance = None
@@ -42,12 +52,42 @@ class EvaluationTraceCallback(BaseEventListener):
     def __init__(self):
         if not hasattr(self, "_initialized") or not self._initialized:
             super().__init__()
-            self.traces = {}
+            self.traces = TraceStore()
+            self.current_kickoff_id: Optional[str] = None
             self.current_agent_id = None
             self.current_task_id = None
             self._initialized = True
 
+    def configure_store(
+        self,
+        max_traces: Optional[int] = 1000,
+        ttl_seconds: Optional[float] = None,
+        spill_path: Optional[str] = None,
+    ) -> None:
+        """Replace the trace store with one using the given retention settings.
+
+        Args:
+            max_traces: Maximum number of traces kept in memory, or None for no limit.
+            ttl_seconds: Age after which traces are evicted from memory, or None.
+            spill_path: SQLite file receiving evicted traces, or None to drop them.
+        """
+        self.traces = TraceStore(
+            max_traces=max_traces, ttl_seconds=ttl_seconds, spill_path=spill_path
+        )
+
     def setup_listeners(self, event_bus: CrewAIEventsBus):
+        @event_bus.on(CrewKickoffStartedEvent)
+        def on_crew_started(source, event: CrewKickoffStartedEvent):
+            self.current_kickoff_id = str(uuid.uuid4())
+
+        @event_bus.on(CrewKickoffCompletedEvent)
+        def on_crew_completed(source, event: CrewKickoffCompletedEvent):
+            self.current_kickoff_id = None
+
+        @event_bus.on(CrewKickoffFailedEvent)
+        def on_crew_failed(source, event: CrewKickoffFailedEvent):
+            self.current_kickoff_id = None
+
         @event_bus.on(AgentExecutionStartedEvent)
         def on_agent_started(source, event: AgentExecutionStartedEvent):
             self.on_agent_start(event.agent, event.task)
@@ -88,14 +128,22 @@ class EvaluationTraceCallback(BaseEventListener):
         def on_llm_call_completed(source, event: LLMCallCompletedEvent):
             self.on_llm_call_end(event.messages, event.response)
 
+    def _trace_key(self, agent_id: Any, task_id: Any) -> str:
+        """Return the key of an agent's trace for a task in the current kickoff."""
+        trace_key = f"{agent_id}_{task_id}"
+        if self.current_kickoff_id:
+            trace_key = f"{trace_key}_{self.current_kickoff_id}"
+        return trace_key
+
     def on_agent_start(self, agent: Agent, task: Task):
         self.current_agent_id = agent.id
         self.current_task_id = task.id
 
-        trace_key = f"{agent.id}_{task.id}"
+        trace_key = self._trace_key(agent.id, task.id)
         self.traces[trace_key] = {
             "agent_id": agent.id,
             "task_id": task.id,
+            "kickoff_id": self.current_kickoff_id,
             "tool_uses": [],
             "llm_calls": [],
             "start_time": datetime.now(),
@@ -103,7 +151,7 @@ class EvaluationTraceCallback(BaseEventListener):
         }
 
     def on_agent_finish(self, agent: Agent, task: Task, output: Any):
-        trace_key = f"{agent.id}_{task.id}"
+        trace_key = self._trace_key(agent.id, task.id)
         if trace_key in self.traces:
             self.traces[trace_key]["final_output"] = output
             self.traces[trace_key]["end_time"] = datetime.now()
@@ -116,7 +164,7 @@ class EvaluationTraceCallback(BaseEventListener):
         if not self.current_agent_id or not self.current_task_id:
             return
 
-        trace_key = f"{self.current_agent_id}_{self.current_task_id}"
+        trace_key = self._trace_key(self.current_agent_id, self.current_task_id)
         if trace_key in self.traces:
             tool_use = {
                 "tool": tool_name,
@@ -137,7 +185,7 @@ class EvaluationTraceCallback(BaseEventListener):
         if not self.current_agent_id or not self.current_task_id:
             return
 
-        trace_key = f"{self.current_agent_id}_{self.current_task_id}"
+        trace_key = self._trace_key(self.current_agent_id, self.current_task_id)
         if trace_key not in self.traces:
             return
 
@@ -153,7 +201,7 @@ class EvaluationTraceCallback(BaseEventListener):
         if not self.current_agent_id or not self.current_task_id:
             return
 
-        trace_key = f"{self.current_agent_id}_{self.current_task_id}"
+        trace_key = self._trace_key(self.current_agent_id, self.current_task_id)
         if trace_key not in self.traces:
             return
 
@@ -181,9 +229,24 @@ class EvaluationTraceCallback(BaseEventListener):
         if hasattr(self, "current_llm_call"):
             self.current_llm_call = {}
 
-    def get_trace(self, agent_id: str, task_id: str) -> Optional[Dict[str, Any]]:
-        trace_key = f"{agent_id}_{task_id}"
-        return self.traces.get(trace_key)
+    def get_trace(
+        self, agent_id: str, task_id: str, kickoff_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return an agent's trace for a task.
+
+        Without ``kickoff_id``, the trace of the latest kickoff is returned.
+        """
+        if kickoff_id is None:
+            return self.traces.latest(agent_id=agent_id, task_id=task_id)
+        return self.traces.get(f"{agent_id}_{task_id}_{kickoff_id}")
+
+    def get_traces(
+        self,
+        agent_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        kickoff_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.traces.find(agent_id=agent_id, task_id=task_id, kickoff_id=kickoff_id)
 
 
 def create_evaluation_callbacks() -> EvaluationTraceCallback:
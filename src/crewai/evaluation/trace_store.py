@@ -0,0 +1,312 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from crewai.utilities.serialization import to_serializable
+
+logger = logging.getLogger(__name__)
+
+_INDEXED_FIELDS = ("agent_id", "task_id", "kickoff_id")
+
+
+class TraceStore:
+    """Bounded, indexed store for evaluation traces.
+
+    Traces are kept in memory in least-recently-used order. When ``max_traces``
+    is exceeded, or a trace is older than ``ttl_seconds``, it is evicted from
+    memory. If ``spill_path`` is set, evicted traces are serialized into a
+    SQLite database instead of being dropped, so they stay available to
+    :meth:`get` and :meth:`find` without being held in RAM.
+
+    Traces are indexed by ``agent_id``, ``task_id`` and ``kickoff_id``.
+    Reading a spilled trace with ``store[key]`` moves it back into memory, so
+    changes made to the returned trace are kept.
+    """
+
+    def __init__(
+        self,
+        max_traces: Optional[int] = 1000,
+        ttl_seconds: Optional[float] = None,
+        spill_path: Optional[str] = None,
+    ) -> None:
+        if max_traces is not None and max_traces < 1:
+            raise ValueError("max_traces must be a positive integer or None")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive or None")
+
+        self.max_traces = max_traces
+        self.ttl_seconds = ttl_seconds
+        self.spill_path = spill_path
+
+        self._traces: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._created_at: Dict[str, float] = {}
+        self._indexes: Dict[str, Dict[str, set[str]]] = {
+            field: {} for field in _INDEXED_FIELDS
+        }
+        self._lock = threading.RLock()
+
+        if self.spill_path:
+            self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        with sqlite3.connect(self.spill_path) as conn:  # type: ignore[arg-type]
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS evaluation_traces (
+                    trace_key TEXT PRIMARY KEY,
+                    agent_id TEXT,
+                    task_id TEXT,
+                    kickoff_id TEXT,
+                    created_at REAL,
+                    trace JSON
+                )
+                """
+            )
+            for field in _INDEXED_FIELDS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_evaluation_traces_{field} "  # nosec
+                    f"ON evaluation_traces ({field})"
+                )
+            conn.commit()
+
+    def __setitem__(self, trace_key: str, trace: Dict[str, Any]) -> None:
+        self.put(trace_key, trace)
+
+    def __getitem__(self, trace_key: str) -> Dict[str, Any]:
+        trace = self.get(trace_key, restore=True)
+        if trace is None:
+            raise KeyError(trace_key)
+        return trace
+
+    def __contains__(self, trace_key: object) -> bool:
+        with self._lock:
+            self._evict_expired()
+            if trace_key in self._traces:
+                return True
+        if not self.spill_path or not isinstance(trace_key, str):
+            return False
+        return bool(self._query_spill("trace_key = ?", (trace_key,)))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._traces)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._traces))
+
+    def put(self, trace_key: str, trace: Dict[str, Any]) -> None:
+        """Store a trace, evicting the oldest ones if the store is full."""
+        with self._lock:
+            if trace_key in self._traces:
+                self._unindex(trace_key, self._traces[trace_key])
+            self._traces[trace_key] = trace
+            self._traces.move_to_end(trace_key)
+            # Re-insert so _created_at stays ordered oldest first
+            self._created_at.pop(trace_key, None)
+            self._created_at[trace_key] = time.monotonic()
+            self._index(trace_key, trace)
+
+            self._evict_expired()
+            if self.max_traces is not None:
+                while len(self._traces) > self.max_traces:
+                    oldest_key = next(iter(self._traces))
+                    self._evict(oldest_key)
+
+    def get(self, trace_key: str, restore: bool = False) -> Optional[Dict[str, Any]]:
+        """Return a trace by key, looking in the spill database on a miss.
+
+        Traces read back from the spill database contain their JSON-serialized
+        form rather than the original objects.
+
+        Args:
+            trace_key: Key the trace was stored under.
+            restore: Whether a spilled trace is moved back into memory, so
+                changes to it are kept. Otherwise a detached copy is returned.
+        """
+        with self._lock:
+            self._evict_expired()
+            if trace_key in self._traces:
+                self._traces.move_to_end(trace_key)
+                return self._traces[trace_key]
+
+            if not self.spill_path:
+                return None
+            rows = self._query_spill("trace_key = ?", (trace_key,))
+            if not rows:
+                return None
+            trace = rows[0][1]
+            if restore:
+                self._delete_spilled(trace_key)
+                self.put(trace_key, trace)
+            return trace
+
+    def latest(
+        self,
+        agent_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        kickoff_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the most recently stored trace matching the given identifiers."""
+        filters = self._filters(agent_id, task_id, kickoff_id)
+        with self._lock:
+            self._evict_expired()
+            keys = self._matching_keys(filters)
+            if keys:
+                return self._traces[max(keys, key=self._created_at.__getitem__)]
+
+        if not self.spill_path:
+            return None
+        where = " AND ".join(f"{field} = ?" for field in filters) or "1 = 1"
+        rows = self._query_spill(where, tuple(filters.values()), latest_only=True)
+        return rows[0][1] if rows else None
+
+    def find(
+        self,
+        agent_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        kickoff_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return all traces matching the given identifiers.
+
+        In-memory traces come first, followed by spilled traces, each group
+        ordered from oldest to newest.
+        """
+        filters = self._filters(agent_id, task_id, kickoff_id)
+
+        with self._lock:
+            self._evict_expired()
+            keys = self._matching_keys(filters)
+            results = [self._traces[key] for key in self._traces if key in keys]
+
+        if self.spill_path:
+            where = " AND ".join(f"{field} = ?" for field in filters) or "1 = 1"
+            results.extend(
+                trace
+                for key, trace in self._query_spill(where, tuple(filters.values()))
+                if key not in keys
+            )
+        return results
+
+    def clear(self) -> None:
+        """Remove every trace from memory and from the spill database."""
+        with self._lock:
+            self._traces.clear()
+            self._created_at.clear()
+            for index in self._indexes.values():
+                index.clear()
+            if self.spill_path:
+                with sqlite3.connect(self.spill_path) as conn:
+                    conn.execute("DELETE FROM evaluation_traces")
+                    conn.commit()
+
+    @staticmethod
+    def _filters(
+        agent_id: Optional[str], task_id: Optional[str], kickoff_id: Optional[str]
+    ) -> Dict[str, str]:
+        filters = {
+            "agent_id": agent_id,
+            "task_id": task_id,
+            "kickoff_id": kickoff_id,
+        }
+        return {field: str(value) for field, value in filters.items() if value}
+
+    def _matching_keys(self, filters: Dict[str, str]) -> set[str]:
+        """Return the keys of the in-memory traces matching the filters."""
+        keys: Optional[set[str]] = None
+        for field, value in filters.items():
+            matches = self._indexes[field].get(value, set())
+            keys = set(matches) if keys is None else keys & matches
+        if keys is None:
+            keys = set(self._traces)
+        return keys & set(self._traces)
+
+    def _index(self, trace_key: str, trace: Dict[str, Any]) -> None:
+        for field in _INDEXED_FIELDS:
+            value = trace.get(field)
+            if value:
+                self._indexes[field].setdefault(str(value), set()).add(trace_key)
+
+    def _unindex(self, trace_key: str, trace: Dict[str, Any]) -> None:
+        for field in _INDEXED_FIELDS:
+            value = trace.get(field)
+            if not value:
+                continue
+            keys = self._indexes[field].get(str(value))
+            if keys is not None:
+                keys.discard(trace_key)
+                if not keys:
+                    del self._indexes[field][str(value)]
+
+    def _evict_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        cutoff = time.monotonic() - self.ttl_seconds
+        # _created_at is in insertion order, so expired traces come first
+        while self._created_at:
+            key, created_at = next(iter(self._created_at.items()))
+            if created_at >= cutoff:
+                break
+            self._evict(key)
+
+    def _evict(self, trace_key: str) -> None:
+        trace = self._traces.pop(trace_key)
+        self._created_at.pop(trace_key, None)
+        self._unindex(trace_key, trace)
+        if self.spill_path:
+            self._spill(trace_key, trace)
+
+    def _spill(self, trace_key: str, trace: Dict[str, Any]) -> None:
+        try:
+            with sqlite3.connect(self.spill_path) as conn:  # type: ignore[arg-type]
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO evaluation_traces
+                    (trace_key, agent_id, task_id, kickoff_id, created_at, trace)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        trace_key,
+                        _optional_str(trace.get("agent_id")),
+                        _optional_str(trace.get("task_id")),
+                        _optional_str(trace.get("kickoff_id")),
+                        time.time(),
+                        json.dumps(to_serializable(trace, max_depth=10)),
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error spilling evaluation trace {trace_key}: {e}")
+
+    def _delete_spilled(self, trace_key: str) -> None:
+        try:
+            with sqlite3.connect(self.spill_path) as conn:  # type: ignore[arg-type]
+                conn.execute(
+                    "DELETE FROM evaluation_traces WHERE trace_key = ?", (trace_key,)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error restoring evaluation trace {trace_key}: {e}")
+
+    def _query_spill(
+        self, where: str, params: tuple, latest_only: bool = False
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        order = "ORDER BY created_at DESC LIMIT 1" if latest_only else "ORDER BY created_at"
+        try:
+            with sqlite3.connect(self.spill_path) as conn:  # type: ignore[arg-type]
+                cursor = conn.execute(
+                    f"SELECT trace_key, trace FROM evaluation_traces WHERE {where} {order}",  # nosec
+                    params,
+                )
+                return [(row[0], json.loads(row[1])) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Error loading spilled evaluation traces: {e}")
+            return []
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    return str(value) if value else None
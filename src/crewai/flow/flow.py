@@ -2,6 +2,7 @@ import asyncio
 import copy
 import inspect
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -22,6 +23,11 @@ from pydantic import BaseModel, Field, ValidationError
 from crewai.flow.flow_visualizer import plot_flow
 from crewai.flow.persistence.base import FlowPersistence
 from crewai.flow.utils import get_possible_return_constants
+from crewai.utilities.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    check_cancelled,
+)
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.flow_events import (
     FlowCreatedEvent,
@@ -95,7 +101,11 @@ def ensure_state_type(state: Any, expected_type: Type[StateT]) -> StateT:
     raise TypeError(f"Invalid expected_type: {expected_type}")
 
 
-def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
+def start(
+    condition: Optional[Union[str, dict, Callable]] = None,
+    timeout: Optional[float] = None,
+    run_in_process: bool = False,
+) -> Callable:
     """
     Marks a method as a flow's starting point.
 
@@ -111,6 +121,12 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this start
         Default is None, meaning unconditional start.
+    timeout : Optional[float], optional
+        Maximum number of seconds the method may run before it fails with
+        ``asyncio.TimeoutError``. Overrides ``Flow.method_timeout``.
+    run_in_process : bool, optional
+        Run the method in the flow's process pool instead of on the event
+        loop. See ``Flow`` for the constraints this places on the method.
 
     Returns
     -------
@@ -139,6 +155,10 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
 
     def decorator(func):
         func.__is_start_method__ = True
+        if timeout is not None:
+            func.__flow_timeout__ = timeout
+        if run_in_process:
+            func.__flow_run_in_process__ = True
         if condition is not None:
             if isinstance(condition, str):
                 func.__trigger_methods__ = [condition]
@@ -162,7 +182,11 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
     return decorator
 
 
-def listen(condition: Union[str, dict, Callable]) -> Callable:
+def listen(
+    condition: Union[str, dict, Callable],
+    timeout: Optional[float] = None,
+    run_in_process: bool = False,
+) -> Callable:
     """
     Creates a listener that executes when specified conditions are met.
 
@@ -177,6 +201,12 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
         - str: Name of a method that triggers this listener
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this listener
+    timeout : Optional[float], optional
+        Maximum number of seconds the listener may run before it fails with
+        ``asyncio.TimeoutError``. Overrides ``Flow.method_timeout``.
+    run_in_process : bool, optional
+        Run the listener in the flow's process pool instead of on the event
+        loop. See ``Flow`` for the constraints this places on the method.
 
     Returns
     -------
@@ -200,6 +230,10 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
     """
 
     def decorator(func):
+        if timeout is not None:
+            func.__flow_timeout__ = timeout
+        if run_in_process:
+            func.__flow_run_in_process__ = True
         if isinstance(condition, str):
             func.__trigger_methods__ = [condition]
             func.__condition_type__ = "OR"
@@ -222,7 +256,11 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
     return decorator
 
 
-def router(condition: Union[str, dict, Callable]) -> Callable:
+def router(
+    condition: Union[str, dict, Callable],
+    timeout: Optional[float] = None,
+    run_in_process: bool = False,
+) -> Callable:
     """
     Creates a routing method that directs flow execution based on conditions.
 
@@ -238,6 +276,12 @@ def router(condition: Union[str, dict, Callable]) -> Callable:
         - str: Name of a method that triggers this router
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this router
+    timeout : Optional[float], optional
+        Maximum number of seconds the router may run before it fails with
+        ``asyncio.TimeoutError``. Overrides ``Flow.method_timeout``.
+    run_in_process : bool, optional
+        Run the router in the flow's process pool instead of on the event
+        loop. See ``Flow`` for the constraints this places on the method.
 
     Returns
     -------
@@ -266,6 +310,10 @@ def router(condition: Union[str, dict, Callable]) -> Callable:
 
     def decorator(func):
         func.__is_router__ = True
+        if timeout is not None:
+            func.__flow_timeout__ = timeout
+        if run_in_process:
+            func.__flow_run_in_process__ = True
         if isinstance(condition, str):
             func.__trigger_methods__ = [condition]
             func.__condition_type__ = "OR"
@@ -388,6 +436,8 @@ class FlowMeta(type):
         listeners = {}
         router_paths = {}
         routers = set()
+        method_timeouts = {}
+        process_methods = set()
 
         for attr_name, attr_value in dct.items():
             # Check for any flow-related attributes
@@ -401,6 +451,12 @@ class FlowMeta(type):
                 if hasattr(attr_value, "__is_start_method__"):
                     start_methods.append(attr_name)
 
+                if hasattr(attr_value, "__flow_timeout__"):
+                    method_timeouts[attr_name] = attr_value.__flow_timeout__
+
+                if getattr(attr_value, "__flow_run_in_process__", False):
+                    process_methods.add(attr_name)
+
                 # Register listeners and routers
                 if hasattr(attr_value, "__trigger_methods__"):
                     methods = attr_value.__trigger_methods__
@@ -420,6 +476,19 @@ class FlowMeta(type):
         setattr(cls, "_listeners", listeners)
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
+        setattr(cls, "_method_timeouts", method_timeouts)
+        setattr(cls, "_process_methods", process_methods)
+
+        # Compile the trigger -> listeners index once per class so dispatch
+        # does not have to scan every listener after each method completes.
+        router_triggers: Dict[str, List[str]] = {}
+        listener_triggers: Dict[str, List[str]] = {}
+        for listener_name, (_, methods) in listeners.items():
+            index = router_triggers if listener_name in routers else listener_triggers
+            for method in dict.fromkeys(methods):
+                index.setdefault(method, []).append(listener_name)
+        setattr(cls, "_router_triggers", router_triggers)
+        setattr(cls, "_listener_triggers", listener_triggers)
 
         return cls
 
@@ -427,7 +496,19 @@ class FlowMeta(type):
 class Flow(Generic[T], metaclass=FlowMeta):
     """Base class for all flows.
 
-    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel."""
+    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel.
+
+    Subclasses may set ``max_listener_concurrency`` to cap how many listeners
+    run at the same time, and ``method_timeout`` to bound how long any flow
+    method may run. Per-method timeouts can also be passed to the @start,
+    @listen and @router decorators.
+
+    Methods decorated with ``run_in_process=True`` run in a process pool of
+    ``process_pool_workers`` workers, so CPU-bound steps are not limited by
+    the GIL. The flow class must be importable at module level, the method
+    only has access to ``self.state``, and its arguments, state and return
+    value must be picklable. State changes made in the worker are merged back
+    field by field when the method returns."""
 
     _printer = Printer()
 
@@ -435,7 +516,14 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _router_triggers: Dict[str, List[str]] = {}
+    _listener_triggers: Dict[str, List[str]] = {}
+    _method_timeouts: Dict[str, float] = {}
+    _process_methods: Set[str] = set()
     initial_state: Union[Type[T], T, None] = None
+    max_listener_concurrency: Optional[int] = None
+    method_timeout: Optional[float] = None
+    process_pool_workers: Optional[int] = None
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -461,6 +549,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
         self._pending_and_listeners: Dict[str, Set[str]] = {}
         self._method_outputs: List[Any] = []  # List to store all method outputs
         self._persistence: Optional[FlowPersistence] = persistence
+        self._listener_semaphore: Optional[asyncio.Semaphore] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._cancellation_token: Optional[CancellationToken] = None
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -780,11 +871,28 @@ class Flow(Generic[T], metaclass=FlowMeta):
         if inputs is not None and "id" not in inputs:
             self._initialize_state(inputs)
 
-        tasks = [
-            self._execute_start_method(start_method)
-            for start_method in self._start_methods
-        ]
-        await asyncio.gather(*tasks)
+        # Created per kickoff so the semaphore belongs to the running event loop
+        if self.max_listener_concurrency:
+            self._listener_semaphore = asyncio.Semaphore(self.max_listener_concurrency)
+
+        try:
+            # Tasks and worker threads copy the current context, so every
+            # method, crew and agent started by this kickoff sees the token.
+            with cancellation_scope() as self._cancellation_token:
+                tasks = [
+                    self._execute_start_method(start_method)
+                    for start_method in self._start_methods
+                ]
+                await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # Stop work running in threads, which asyncio cannot interrupt.
+            if self._cancellation_token is not None:
+                self._cancellation_token.cancel("Flow kickoff was cancelled")
+            raise
+        finally:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
 
         final_output = self._method_outputs[-1] if self._method_outputs else None
 
@@ -799,6 +907,22 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         return final_output
 
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """
+        Cancel the running kickoff.
+
+        Methods that have not started yet are skipped, and crews and agents
+        running inside flow methods stop at their next LLM or tool call by
+        raising ``ExecutionCancelledError``.
+
+        Parameters
+        ----------
+        reason : Optional[str]
+            Why the flow was cancelled, included in the raised error.
+        """
+        if self._cancellation_token is not None:
+            self._cancellation_token.cancel(reason or "Flow was cancelled")
+
     async def _execute_start_method(self, start_method_name: str) -> None:
         """
         Executes a flow's start method and its triggered listeners.
@@ -825,6 +949,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
     async def _execute_method(
         self, method_name: str, method: Callable, *args: Any, **kwargs: Any
     ) -> Any:
+        check_cancelled()
         try:
             dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
                 kwargs or {}
@@ -840,11 +965,32 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 ),
             )
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+            timeout = self._method_timeouts.get(method_name, self.method_timeout)
+            with cancellation_scope() as method_token:
+                try:
+                    if method_name in self._process_methods:
+                        result = await asyncio.wait_for(
+                            self._execute_in_process(method_name, *args, **kwargs),
+                            timeout,
+                        )
+                    elif asyncio.iscoroutinefunction(method):
+                        result = await asyncio.wait_for(
+                            method(*args, **kwargs), timeout
+                        )
+                    elif timeout is not None:
+                        # Synchronous methods can only be bounded from a worker thread.
+                        result = await asyncio.wait_for(
+                            asyncio.to_thread(method, *args, **kwargs), timeout
+                        )
+                    else:
+                        result = method(*args, **kwargs)
+                except asyncio.TimeoutError:
+                    # The worker thread keeps running after wait_for gives up;
+                    # cancel it so agents inside stop at their next checkpoint.
+                    method_token.cancel(
+                        f"Flow method '{method_name}' timed out after {timeout} seconds"
+                    )
+                    raise
 
             self._method_outputs.append(result)
             self._method_execution_counts[method_name] = (
@@ -875,6 +1021,35 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    async def _execute_in_process(
+        self, method_name: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Runs a flow method in the process pool and merges its state changes."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_pool_workers
+            )
+
+        loop = asyncio.get_running_loop()
+        result, changes, removed = await loop.run_in_executor(
+            self._process_pool,
+            _run_flow_method_in_process,
+            type(self),
+            method_name,
+            _state_fields(self._state),
+            args,
+            kwargs,
+        )
+
+        if isinstance(self._state, dict):
+            for key in removed:
+                self._state.pop(key, None)
+            self._state.update(changes)
+        else:
+            for key, value in changes.items():
+                setattr(self._state, key, value)
+        return result
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -895,7 +1070,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
         -----
         - Routers are executed sequentially to maintain flow control
         - Each router's result becomes a new trigger_method
-        - Normal listeners are executed in parallel for efficiency
+        - Normal listeners are executed in parallel for efficiency, bounded by
+          max_listener_concurrency when set
         - Listeners can receive the trigger method's result as a parameter
         """
         # First, handle routers repeatedly until no router triggers anymore
@@ -962,28 +1138,24 @@ class Flow(Generic[T], metaclass=FlowMeta):
           * OR: Triggers if any condition is met
           * AND: Triggers only when all conditions are met
         - Maintains state for AND conditions using _pending_and_listeners
+        - Only visits listeners indexed under trigger_method by FlowMeta
         - Separates router and normal listener evaluation
         """
+        index = self._router_triggers if router_only else self._listener_triggers
         triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
-                continue
+        for listener_name in index.get(trigger_method, ()):
+            condition_type, methods = self._listeners[listener_name]
 
             if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
+                triggered.append(listener_name)
             elif condition_type == "AND":
                 # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
+                pending = self._pending_and_listeners.setdefault(
+                    listener_name, set(methods)
+                )
+                pending.discard(trigger_method)
 
-                if not self._pending_and_listeners[listener_name]:
+                if not pending:
                     # All required methods have been executed
                     triggered.append(listener_name)
                     # Reset pending methods for this listener
@@ -1026,12 +1198,18 @@ class Flow(Generic[T], metaclass=FlowMeta):
             params = list(sig.parameters.values())
             method_params = [p for p in params if p.name != "self"]
 
-            if method_params:
+            args = (result,) if method_params else ()
+            if self._listener_semaphore is not None:
+                # Only the method itself holds a slot; its own listeners are
+                # dispatched after release so nested fan-out cannot deadlock.
+                async with self._listener_semaphore:
+                    listener_result = await self._execute_method(
+                        listener_name, method, *args
+                    )
+            else:
                 listener_result = await self._execute_method(
-                    listener_name, method, result
+                    listener_name, method, *args
                 )
-            else:
-                listener_result = await self._execute_method(listener_name, method)
 
             # Execute listeners (and possibly routers) of this listener
             await self._execute_listeners(listener_name, listener_result)
@@ -1080,3 +1258,48 @@ class Flow(Generic[T], metaclass=FlowMeta):
             ),
         )
         plot_flow(self, filename)
+
+
+def _state_fields(state: Any) -> Dict[str, Any]:
+    if isinstance(state, BaseModel):
+        return {name: getattr(state, name) for name in type(state).model_fields}
+    return dict(state)
+
+
+def _run_flow_method_in_process(
+    flow_class: Type[Flow],
+    method_name: str,
+    state_fields: Dict[str, Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+) -> tuple[Any, Dict[str, Any], List[str]]:
+    """Runs a flow method inside a process pool worker.
+
+    The flow is rebuilt without calling ``__init__`` so no events are emitted
+    from the worker, and its state is rebuilt from the parent's state fields
+    because generated state classes cannot be pickled. Returns the method
+    result together with the state fields that changed and the dict keys that
+    were removed.
+    """
+    flow = flow_class.__new__(flow_class)
+    flow._state = flow._create_initial_state()
+    if isinstance(flow._state, dict):
+        flow._state.clear()
+        flow._state.update(state_fields)
+    else:
+        for key, value in state_fields.items():
+            setattr(flow._state, key, value)
+    before = copy.deepcopy(state_fields)
+
+    result = getattr(flow, method_name)(*args, **kwargs)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+
+    after = _state_fields(flow._state)
+    changes = {
+        key: value
+        for key, value in after.items()
+        if key not in before or before[key] != value
+    }
+    removed = [key for key in before if key not in after]
+    return result, changes, removed
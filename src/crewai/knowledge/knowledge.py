@@ -1,5 +1,7 @@
+import hashlib
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -16,6 +18,7 @@ class Knowledge(BaseModel):
         sources: List[BaseKnowledgeSource] = Field(default_factory=list)
         storage: Optional[KnowledgeStorage] = Field(default=None)
         embedder: Optional[Dict[str, Any]] = None
+        vector_backend: Optional[str] = None
     """
 
     sources: List[BaseKnowledgeSource] = Field(default_factory=list)
@@ -30,6 +33,7 @@ class Knowledge(BaseModel):
         sources: List[BaseKnowledgeSource],
         embedder: Optional[Dict[str, Any]] = None,
         storage: Optional[KnowledgeStorage] = None,
+        vector_backend: Optional[str] = None,
         **data,
     ):
         super().__init__(**data)
@@ -37,7 +41,9 @@ class Knowledge(BaseModel):
             self.storage = storage
         else:
             self.storage = KnowledgeStorage(
-                embedder=embedder, collection_name=collection_name
+                embedder=embedder,
+                collection_name=collection_name,
+                backend=vector_backend,
             )
         self.sources = sources
         self.storage.initialize_knowledge_storage()
@@ -63,6 +69,8 @@ class Knowledge(BaseModel):
         return results
 
     def add_sources(self):
+        if isinstance(self.storage, KnowledgeStorage):
+            self.storage.remove_missing_files()
         try:
             for source in self.sources:
                 source.storage = self.storage
@@ -75,3 +83,61 @@ class Knowledge(BaseModel):
             self.storage.reset()
         else:
             raise ValueError("Storage is not initialized.")
+
+
+def query_knowledge_sources(
+    knowledge: Mapping[str, Knowledge],
+    query: List[str],
+    results_limit: int = 3,
+    score_threshold: float = 0.35,
+) -> List[Dict[str, Any]]:
+    """
+    Query several knowledge bases at once and merge their results.
+
+    The knowledge bases are searched concurrently. Their results are ranked
+    together by score, chunks with the same text are only kept once, and the
+    best ``results_limit`` results are returned. Each result is tagged with
+    the name its knowledge base was given under ``"knowledge"``.
+
+    Args:
+        knowledge: Knowledge bases to query, keyed by name, e.g. "agent" and
+            "crew".
+        query: The query to search for.
+        results_limit: Number of results to return across all knowledge bases.
+        score_threshold: Minimum score of a result.
+    """
+
+    def search(item):
+        name, knowledge_base = item
+        results = knowledge_base.query(
+            query, results_limit=results_limit, score_threshold=score_threshold
+        )
+        return [{**result, "knowledge": name} for result in results]
+
+    items = list(knowledge.items())
+    if len(items) > 1:
+        with ThreadPoolExecutor(
+            max_workers=len(items), thread_name_prefix="crewai-knowledge"
+        ) as executor:
+            searched = list(executor.map(search, items))
+    else:
+        searched = [search(item) for item in items]
+
+    # Storages return the nearest chunks first, with the lowest score.
+    ranked = sorted(
+        (result for results in searched for result in results),
+        key=lambda result: result["score"],
+    )
+    merged: List[Dict[str, Any]] = []
+    seen = set()
+    for result in ranked:
+        chunk_hash = hashlib.sha256(
+            str(result.get("context", "")).encode("utf-8")
+        ).hexdigest()
+        if chunk_hash in seen:
+            continue
+        seen.add(chunk_hash)
+        merged.append(result)
+        if len(merged) == results_limit:
+            break
+    return merged
@@ -1,17 +1,30 @@
+import hashlib
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pydantic import Field, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
-from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage, document_id
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.errors import DatabaseOperationError
 from crewai.utilities.logger import Logger
 
+# Chunks sent to the storage per save, so files are embedded in bounded
+# batches instead of all at once.
+_SAVE_BATCH_SIZE = 256
+
 
 class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
-    """Base class for knowledge sources that load content from files."""
+    """Base class for knowledge sources that load content from files.
+
+    Content is loaded when the source is added to a ``KnowledgeStorage``,
+    and only for files that are new or changed since they were last ingested
+    into its collection with the same chunking, embedder and vector backend,
+    according to the storage's file manifest. Subclasses that implement their
+    own ``add()`` load all files up front instead.
+    """
 
     _logger: Logger = Logger(verbose=True)
     file_path: Optional[Union[Path, List[Path], str, List[str]]] = Field(
@@ -21,7 +34,8 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     file_paths: Optional[Union[Path, List[Path], str, List[str]]] = Field(
         default_factory=list, description="The path to the file"
     )
-    content: Dict[Path, str] = Field(init=False, default_factory=dict)
+    # Loaded content per file; see ``_file_text`` for how it becomes text
+    content: Dict[Path, Any] = Field(init=False, default_factory=dict)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
 
@@ -40,13 +54,14 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         return v
 
     def model_post_init(self, _):
-        """Post-initialization method to load content."""
+        """Post-initialization method to validate paths and load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if type(self).add is not BaseFileKnowledgeSource.add:
+            self.content = self.load_content()
 
     @abstractmethod
-    def load_content(self) -> Dict[Path, str]:
+    def load_content(self) -> Dict[Path, Any]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
         pass
 
@@ -67,6 +82,191 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
+    def add(self) -> None:
+        """
+        Load and chunk the files that changed since they were last ingested,
+        compute embeddings, and save them in batches. Chunks the changed files
+        produced before are removed from the storage.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        records = self._load_file_records()
+        fingerprint = (
+            f"{type(self).__name__}:{self.chunk_size}:{self.chunk_overlap}"
+        )
+        if isinstance(self.storage, KnowledgeStorage):
+            fingerprint += f":{self.storage.ingestion_fingerprint()}"
+        changed: Dict[Path, Dict[str, Any]] = {}
+        unchanged: List[Dict[str, Any]] = []
+        for path in self.safe_file_paths:
+            state = self._file_state(path, records.get(str(path.resolve())))
+            if state.get("fingerprint") == fingerprint:
+                unchanged.append(state)
+            else:
+                changed[path] = {**state, "fingerprint": fingerprint}
+
+        # Records of unchanged files are saved again in case only their
+        # modification time moved, so the next run skips hashing them.
+        touched = [
+            state
+            for state in unchanged
+            if state["mtime_ns"] != records[state["file_path"]]["mtime_ns"]
+        ]
+        self.content = {}
+        new_records = []
+        batch: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for path, state in changed.items():
+            chunk_ids = []
+            for chunk, metadata in self._iter_file_chunks(path):
+                chunk_ids.append(document_id(chunk))
+                batch.append((chunk, metadata))
+                if len(batch) >= _SAVE_BATCH_SIZE:
+                    self._save_batch(batch)
+                    batch = []
+            new_records.append({**state, "chunk_ids": list(dict.fromkeys(chunk_ids))})
+
+        if batch:
+            self._save_batch(batch)
+        self._save_file_records(records, new_records, touched)
+
+    def _iter_file_chunks(
+        self, path: Path
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Yield the chunks of one file together with their metadata.
+
+        By default the file is read whole through ``load_content()``, and its
+        content and chunks are kept on the source. Sources that can read
+        their files incrementally override this to stream them.
+        """
+        content = self._load_files([path])
+        self.content.update(content)
+        for value in content.values():
+            for chunk in self._chunk_text(self._file_text(value)):
+                self.chunks.append(chunk)
+                yield chunk, None
+
+    def _iter_record_chunks(
+        self, path: Path, records: Iterable[str]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Pack consecutive records into chunks of up to ``chunk_size``.
+
+        Records are never split across chunks unless a single record is
+        larger than ``chunk_size``, in which case it is split on its own. The
+        metadata of each chunk names the file and the range of records it
+        holds, so searches can be filtered by them.
+        """
+        parts: List[str] = []
+        size = 0
+        first = 0
+
+        def metadata(start: int, end: int) -> Dict[str, Any]:
+            return {"source": str(path), "record_start": start, "record_end": end}
+
+        for index, record in enumerate(records):
+            if parts and size + len(record) > self.chunk_size:
+                yield "".join(parts), metadata(first, index - 1)
+                parts, size = [], 0
+            if len(record) > self.chunk_size:
+                for chunk in self._chunk_text(record):
+                    yield chunk, metadata(index, index)
+                continue
+            if not parts:
+                first = index
+            parts.append(record)
+            size += len(record)
+        if parts:
+            yield "".join(parts), metadata(first, first + len(parts) - 1)
+
+    def _save_batch(self, batch: List[Tuple[str, Optional[Dict[str, Any]]]]) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        metadatas = [metadata for _, metadata in batch]
+        self.storage.save(
+            [chunk for chunk, _ in batch],
+            None if all(m is None for m in metadatas) else metadatas,  # type: ignore[arg-type]
+        )
+
+    def _file_text(self, content: Any) -> str:
+        """Return the text to chunk for the loaded content of one file."""
+        return content
+
+    def _load_files(self, paths: List[Path]) -> Dict[Path, Any]:
+        """Run ``load_content()`` for the given subset of the source's files."""
+        all_paths = self.safe_file_paths
+        self.safe_file_paths = paths
+        try:
+            return self.load_content()
+        finally:
+            self.safe_file_paths = all_paths
+
+    def _file_state(
+        self, path: Path, record: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Describe a file, reusing the manifest record if it did not change.
+
+        The content is only hashed when the size or modification time differ
+        from the record. The returned dict carries the record's fingerprint
+        and chunk IDs only if the file is unchanged.
+        """
+        stat = path.stat()
+        state: Dict[str, Any] = {
+            "file_path": str(path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if record and (record["size"], record["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return {**record, **state}
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        state["content_hash"] = digest.hexdigest()
+        if record and record["content_hash"] == state["content_hash"]:
+            return {**record, **state}
+        return state
+
+    def _load_file_records(self) -> Dict[str, Dict[str, Any]]:
+        if not isinstance(self.storage, KnowledgeStorage):
+            return {}
+        try:
+            return self.storage.load_file_records()
+        except DatabaseOperationError as e:
+            self._logger.log(
+                "warning",
+                f"Knowledge file manifest unavailable, ingesting all files: {e}",
+                color="yellow",
+            )
+            return {}
+
+    def _save_file_records(
+        self,
+        previous: Dict[str, Dict[str, Any]],
+        records: List[Dict[str, Any]],
+        touched: List[Dict[str, Any]],
+    ) -> None:
+        if not isinstance(self.storage, KnowledgeStorage):
+            return
+        new_ids = [chunk_id for record in records for chunk_id in record["chunk_ids"]]
+        try:
+            self.storage.remove_files(
+                [
+                    record["file_path"]
+                    for record in records
+                    if record["file_path"] in previous
+                ],
+                keep_ids=new_ids,
+            )
+            self.storage.save_file_records(records + touched)
+        except DatabaseOperationError as e:
+            self._logger.log(
+                "warning", f"Could not update knowledge file manifest: {e}", color="yellow"
+            )
+
     def _save_documents(self):
         """Save the documents to the storage."""
         if self.storage:
@@ -1,11 +1,18 @@
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Iterator, List, Optional, Union
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 try:
     from docling.datamodel.base_models import InputFormat
     from docling.document_converter import DocumentConverter
-    from docling.exceptions import ConversionError
     from docling_core.transforms.chunker.hierarchical_chunker import HierarchicalChunker
     from docling_core.types.doc.document import DoclingDocument
 
@@ -18,11 +25,40 @@ from pydantic import Field
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
+from crewai.utilities.paths import db_storage_path
+
+# Converters of a worker process by configuration, built on first use.
+_worker_converters: Dict[str, "DocumentConverter"] = {}
+
+
+def _convert_in_worker(
+    source: str,
+    allowed_formats: List["InputFormat"],
+    format_options: Dict["InputFormat", Any],
+    config_key: str,
+) -> str:
+    """Convert one document in a worker process and return it as JSON."""
+    converter = _worker_converters.get(config_key)
+    if converter is None:
+        converter = DocumentConverter(
+            allowed_formats=allowed_formats, format_options=format_options
+        )
+        _worker_converters[config_key] = converter
+    return converter.convert(source).document.model_dump_json()
 
 
 class CrewDoclingSource(BaseKnowledgeSource):
     """Default Source class for converting documents to markdown or json
     This will auto support PDF, DOCX, and TXT, XLSX, Images, and HTML files without any additional dependencies and follows the docling package as the source of truth.
+
+    Documents are converted when the source is added, and the chunks of each
+    document are saved as soon as it is converted. With ``max_workers`` above
+    one, documents are converted in that many worker processes, each with its
+    own converter accepting the same formats as ``document_converter``, and
+    ``conversion_timeout`` limits how long a document may take. Documents that
+    fail to convert, or crash their worker, are logged, listed in
+    ``failed_file_paths`` and skipped. Converted local files are cached on
+    disk by the hash of their content and the converter's configuration.
     """
 
     def __init__(self, *args, **kwargs):
@@ -40,6 +76,23 @@ class CrewDoclingSource(BaseKnowledgeSource):
     chunks: List[str] = Field(default_factory=list)
     safe_file_paths: List[Union[Path, str]] = Field(default_factory=list)
     content: List["DoclingDocument"] = Field(default_factory=list)
+    max_workers: int = Field(
+        default=1,
+        description="Number of processes converting documents. With 1, documents are converted in this process with document_converter.",
+    )
+    conversion_timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds a document may take to convert in a worker process before it is skipped",
+    )
+    cache_conversions: bool = Field(
+        default=True,
+        description="Whether converted local files are cached on disk by content hash",
+    )
+    cache_dir: Optional[Union[Path, str]] = Field(
+        default=None,
+        description="Directory of the conversion cache. Defaults to docling_cache in the knowledge storage directory.",
+    )
+    failed_file_paths: List[Union[Path, str]] = Field(default_factory=list)
     document_converter: "DocumentConverter" = Field(
         default_factory=lambda: DocumentConverter(
             allowed_formats=[
@@ -64,33 +117,241 @@ class CrewDoclingSource(BaseKnowledgeSource):
             )
             self.file_paths = self.file_path
         self.safe_file_paths = self.validate_content()
-        self.content = self._load_content()
 
-    def _load_content(self) -> List["DoclingDocument"]:
+    def add(self) -> None:
+        for doc in self._iter_documents():
+            new_chunks = list(self._chunk_doc(doc))
+            if not new_chunks:
+                continue
+            self.chunks.extend(new_chunks)
+            if self.storage:
+                self.storage.save(new_chunks)
+            else:
+                raise ValueError("No storage found to save documents.")
+
+    def _iter_documents(self) -> Iterator["DoclingDocument"]:
+        """Yield the documents of the source in the order they are converted."""
+        self.failed_file_paths = []
+        pending: List[Tuple[Union[Path, str], Optional[Path]]] = []
+        for source in self.safe_file_paths:
+            cache_path = self._cache_path(source)
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                yield cached
+            else:
+                pending.append((source, cache_path))
+
+        cache_paths = dict(pending)
+        if self.max_workers > 1 and len(pending) > 1:
+            converted = self._convert_in_processes([source for source, _ in pending])
+        else:
+            converted = self._convert_in_process([source for source, _ in pending])
+        for source, doc_json in converted:
+            doc = DoclingDocument.model_validate_json(doc_json)
+            self._write_cache(cache_paths[source], doc_json)
+            yield doc
+
+    def _convert_in_process(
+        self, sources: List[Union[Path, str]]
+    ) -> Iterator[Tuple[Union[Path, str], str]]:
+        for source in sources:
+            try:
+                result = self.document_converter.convert(source)
+            except Exception as e:
+                self._conversion_failed(source, e)
+                continue
+            yield source, result.document.model_dump_json()
+
+    def _convert_in_processes(
+        self, sources: List[Union[Path, str]]
+    ) -> Iterator[Tuple[Union[Path, str], str]]:
+        """Convert documents in worker processes, yielding them as they finish.
+
+        Only ``max_workers`` documents are submitted at a time, so each one
+        starts converting when it is submitted and its timeout can be measured
+        from then. Worker processes cannot be interrupted, so when a document
+        times out the pool is terminated and the documents that were still
+        converting are resubmitted to a new pool.
+
+        When a worker crashes, every running document fails with it. The
+        pool is replaced and those documents are converted again one at a
+        time, so only the one that crashes its worker again is skipped.
+        """
+        allowed_formats = list(self.document_converter.allowed_formats)
+        format_options = dict(self.document_converter.format_to_options)
+        config_key = self._converter_key()
+        queue: Deque[Union[Path, str]] = deque(sources)
+        # Documents that were running when a worker crashed, converted alone
+        suspects: Deque[Union[Path, str]] = deque()
+        while queue or suspects:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            running: Dict[Future, Tuple[Union[Path, str], float]] = {}
+            restart = False
+            try:
+                while (queue or suspects or running) and not restart:
+                    pending = suspects if suspects else queue
+                    limit = 1 if suspects else self.max_workers
+                    while pending and len(running) < limit:
+                        source = pending.popleft()
+                        try:
+                            future = executor.submit(
+                                _convert_in_worker,
+                                str(source),
+                                allowed_formats,
+                                format_options,
+                                config_key,
+                            )
+                        except BrokenProcessPool:
+                            pending.appendleft(source)
+                            restart = not running
+                            break
+                        running[future] = (source, time.monotonic())
+                    if restart:
+                        break
+
+                    timeout = None
+                    if self.conversion_timeout is not None:
+                        first_started = min(started for _, started in running.values())
+                        timeout = max(
+                            0.0,
+                            first_started + self.conversion_timeout - time.monotonic(),
+                        )
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                    crashed: List[Union[Path, str]] = []
+                    crash: Optional[BaseException] = None
+                    for future in done:
+                        source, _ = running.pop(future)
+                        try:
+                            doc_json = future.result()
+                        except BrokenProcessPool as e:
+                            crashed.append(source)
+                            crash = e
+                            continue
+                        except Exception as e:
+                            self._conversion_failed(source, e)
+                            continue
+                        yield source, doc_json
+
+                    if crashed:
+                        crashed.extend(source for source, _ in running.values())
+                        running.clear()
+                        if len(crashed) == 1:
+                            self._conversion_failed(crashed[0], crash)  # type: ignore[arg-type]
+                        else:
+                            suspects.extend(crashed)
+                        restart = True
+                    elif not done:
+                        now = time.monotonic()
+                        for future, (source, started) in list(running.items()):
+                            if now - started >= self.conversion_timeout:  # type: ignore[operator]
+                                running.pop(future)
+                                self._conversion_failed(
+                                    source,
+                                    TimeoutError(
+                                        f"conversion took longer than {self.conversion_timeout} seconds"
+                                    ),
+                                )
+                        pending.extendleft(
+                            reversed([source for source, _ in running.values()])
+                        )
+                        running.clear()
+                        restart = True
+            finally:
+                self._shutdown_pool(executor, terminate=restart or bool(running))
+
+    @staticmethod
+    def _shutdown_pool(executor: ProcessPoolExecutor, terminate: bool) -> None:
+        if terminate:
+            # ProcessPoolExecutor has no public way to stop a running task.
+            processes: Dict[Any, Any] = getattr(executor, "_processes", None) or {}
+            for process in list(processes.values()):
+                process.terminate()
+        executor.shutdown(wait=not terminate, cancel_futures=True)
+
+    def _conversion_failed(
+        self, source: Union[Path, str], error: BaseException
+    ) -> None:
+        self.failed_file_paths.append(source)
+        self._logger.log(
+            "error",
+            f"Error converting {source}: {error}. Supported formats: {self.document_converter.allowed_formats}",
+            "red",
+        )
+
+    def _cache_path(self, source: Union[Path, str]) -> Optional[Path]:
+        """Return where the conversion of a local file is cached, if it is."""
+        if not self.cache_conversions or (
+            isinstance(source, str) and source.startswith(("http://", "https://"))
+        ):
+            return None
+        digest = hashlib.sha256()
         try:
-            return self._convert_source_to_docling_documents()
-        except ConversionError as e:
-            self._logger.log(
-                "error",
-                f"Error loading content: {e}. Supported formats: {self.document_converter.allowed_formats}",
-                "red",
+            with open(source, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        except OSError:
+            return None
+        cache_dir = Path(
+            self.cache_dir
+            or Path(db_storage_path()) / KNOWLEDGE_DIRECTORY / "docling_cache"
+        )
+        digest.update(self._converter_key().encode("utf-8"))
+        return cache_dir / f"{digest.hexdigest()}.json"
+
+    def _converter_key(self) -> str:
+        """Return a hash of everything about the converter that changes its output."""
+        try:
+            docling_version = version("docling")
+        except PackageNotFoundError:
+            docling_version = None
+        options = {
+            str(input_format): {
+                "pipeline": getattr(option, "pipeline_cls", None),
+                "backend": getattr(option, "backend", None),
+                "options": self._dump_options(getattr(option, "pipeline_options", None)),
+            }
+            for input_format, option in self.document_converter.format_to_options.items()
+        }
+        config = {
+            "docling": docling_version,
+            "formats": sorted(str(f) for f in self.document_converter.allowed_formats),
+            "options": options,
+        }
+        return hashlib.sha256(
+            json.dumps(config, default=str, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _dump_options(options: Any) -> Any:
+        if options is None:
+            return None
+        try:
+            return options.model_dump(mode="json")
+        except Exception:
+            return repr(options)
+
+    def _read_cache(self, cache_path: Optional[Path]) -> Optional["DoclingDocument"]:
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            return DoclingDocument.model_validate_json(
+                cache_path.read_text(encoding="utf-8")
             )
-            raise e
         except Exception as e:
-            self._logger.log("error", f"Error loading content: {e}")
-            raise e
+            self._logger.log("warning", f"Ignoring unreadable cache {cache_path}: {e}")
+            return None
 
-    def add(self) -> None:
-        if self.content is None:
+    def _write_cache(self, cache_path: Optional[Path], doc_json: str) -> None:
+        if cache_path is None:
             return
-        for doc in self.content:
-            new_chunks_iterable = self._chunk_doc(doc)
-            self.chunks.extend(list(new_chunks_iterable))
-        self._save_documents()
-
-    def _convert_source_to_docling_documents(self) -> List["DoclingDocument"]:
-        conv_results_iter = self.document_converter.convert_all(self.safe_file_paths)
-        return [result.document for result in conv_results_iter]
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(doc_json, encoding="utf-8")
+            os.replace(temporary, cache_path)
+        except OSError as e:
+            self._logger.log("warning", f"Could not cache conversion {cache_path}: {e}")
 
     def _chunk_doc(self, doc: "DoclingDocument") -> Iterator[str]:
         chunker = HierarchicalChunker()
@@ -1,36 +1,36 @@
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
 class CSVKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries CSV file content using embeddings."""
+    """A knowledge source that stores and queries CSV file content using embeddings.
+
+    Files are streamed row by row when added, so their size does not matter.
+    Rows are packed into chunks without being split, and each chunk's
+    metadata holds the file and the range of rows in it.
+    """
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess CSV file content."""
         content_dict = {}
         for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
+            with open(file_path, "r", encoding="utf-8", newline="") as csvfile:
+                content_dict[file_path] = "".join(self._iter_rows(csvfile))
         return content_dict
 
-    def add(self) -> None:
-        """
-        Add CSV file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+    def _iter_file_chunks(
+        self, path: Path
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        with open(path, "r", encoding="utf-8", newline="") as csvfile:
+            yield from self._iter_record_chunks(path, self._iter_rows(csvfile))
+
+    @staticmethod
+    def _iter_rows(csvfile) -> Iterator[str]:
+        for row in csv.reader(csvfile):
+            yield " ".join(row) + "\n"
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
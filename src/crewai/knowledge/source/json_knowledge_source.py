@@ -1,12 +1,22 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
+_READ_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+
 
 class JSONKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries JSON file content using embeddings."""
+    """A knowledge source that stores and queries JSON file content using embeddings.
+
+    Files whose top level is an array are streamed item by item when added,
+    as are JSON Lines files and other files holding a sequence of JSON
+    values. Each item is a record: records are packed into chunks without
+    being split, and each chunk's metadata holds the file and the range of
+    records in it.
+    """
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess JSON file content."""
@@ -18,31 +28,36 @@ class JSONKnowledgeSource(BaseFileKnowledgeSource):
             content[path] = self._json_to_text(data)
         return content
 
+    def _iter_file_chunks(
+        self, path: Path
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        with open(path, "r", encoding="utf-8") as json_file:
+            records = (
+                self._json_to_text(record) + "\n"
+                for record in _iter_json_records(json_file)
+            )
+            yield from self._iter_record_chunks(path, records)
+
     def _json_to_text(self, data: Any, level: int = 0) -> str:
         """Recursively convert JSON data to a text representation."""
-        text = ""
+        parts: List[str] = []
+        self._write_json_text(data, level, parts)
+        return "".join(parts)
+
+    def _write_json_text(self, data: Any, level: int, parts: List[str]) -> None:
         indent = "  " * level
         if isinstance(data, dict):
             for key, value in data.items():
-                text += f"{indent}{key}: {self._json_to_text(value, level + 1)}\n"
+                parts.append(f"{indent}{key}: ")
+                self._write_json_text(value, level + 1, parts)
+                parts.append("\n")
         elif isinstance(data, list):
             for item in data:
-                text += f"{indent}- {self._json_to_text(item, level + 1)}\n"
+                parts.append(f"{indent}- ")
+                self._write_json_text(item, level + 1, parts)
+                parts.append("\n")
         else:
-            text += f"{str(data)}"
-        return text
-
-    def add(self) -> None:
-        """
-        Add JSON file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+            parts.append(str(data))
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
@@ -50,3 +65,81 @@ class JSONKnowledgeSource(BaseFileKnowledgeSource):
             text[i : i + self.chunk_size]
             for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
         ]
+
+
+def _iter_json_records(file: IO[str]) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, or each top-level value.
+
+    Only the record being decoded is held in memory. The buffer grows
+    geometrically while a record is incomplete, so large records are
+    decoded in linear time. A top-level array must be the only value in the
+    file, as with ``json.load``.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill(size: int) -> None:
+        nonlocal buffer, pos, eof
+        block = file.read(size)
+        buffer = buffer[pos:] + block
+        pos = 0
+        eof = not block
+
+    def peek() -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if eof:
+                return ""
+            fill(_READ_SIZE)
+
+    def error(message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, buffer, pos)
+
+    def decode() -> Any:
+        nonlocal pos
+        while True:
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill(max(_READ_SIZE, len(buffer) - pos))
+                continue
+            # A number at the end of the buffer may continue in the next block.
+            if end == len(buffer) and not eof:
+                fill(max(_READ_SIZE, len(buffer) - pos))
+                continue
+            pos = end
+            return record
+
+    if peek() != "[":
+        while peek():
+            yield decode()
+        return
+
+    pos += 1
+    if peek() == "]":
+        pos += 1
+    else:
+        while True:
+            if peek() in ",]":
+                raise error("Expecting value")
+            yield decode()
+            separator = peek()
+            if separator == "]":
+                pos += 1
+                break
+            if separator != ",":
+                raise error(
+                    "Unterminated array" if not separator else "Expecting ',' delimiter"
+                )
+            pos += 1
+    if peek():
+        raise error("Extra data")
@@ -35,16 +35,6 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
                 "pdfplumber is not installed. Please install it with: pip install pdfplumber"
             )
 
-    def add(self) -> None:
-        """
-        Add PDF file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
         return [
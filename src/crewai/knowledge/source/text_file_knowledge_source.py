@@ -16,16 +16,6 @@ class TextFileKnowledgeSource(BaseFileKnowledgeSource):
                 content[path] = f.read()
         return content
 
-    def add(self) -> None:
-        """
-        Add text file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
         return [
@@ -0,0 +1,161 @@
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.errors import DatabaseError, DatabaseOperationError
+from crewai.utilities.paths import db_storage_path
+
+logger = logging.getLogger(__name__)
+
+
+class KnowledgeFileManifestSQLiteStorage:
+    """
+    SQLite storage recording which files were ingested into which knowledge
+    collection.
+
+    Each record holds the size, modification time and content hash a file had
+    when it was ingested, a fingerprint of the settings it was chunked with,
+    and the IDs of the chunks it produced, so unchanged files can be skipped
+    and the chunks of changed or deleted files can be removed.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        if db_path is None:
+            directory = Path(db_storage_path()) / KNOWLEDGE_DIRECTORY
+            directory.mkdir(parents=True, exist_ok=True)
+            db_path = str(directory / "file_manifest.db")
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Create the knowledge_files table if it does not exist.
+
+        Raises:
+            DatabaseOperationError: If database initialization fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS knowledge_files (
+                        collection_name TEXT NOT NULL,
+                        file_path TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        mtime_ns INTEGER NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        chunk_ids JSON NOT NULL,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (collection_name, file_path)
+                    )
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def load(self, collection_name: str) -> Dict[str, Dict[str, Any]]:
+        """Return the records of a collection, keyed by file path.
+
+        Raises:
+            DatabaseOperationError: If loading the records fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT file_path, size, mtime_ns, content_hash, fingerprint, chunk_ids
+                    FROM knowledge_files
+                    WHERE collection_name = ?
+                """,
+                    (collection_name,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            error_msg = f"Error loading knowledge file manifest: {e}"
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+        return {
+            row[0]: {
+                "file_path": row[0],
+                "size": row[1],
+                "mtime_ns": row[2],
+                "content_hash": row[3],
+                "fingerprint": row[4],
+                "chunk_ids": json.loads(row[5]),
+            }
+            for row in rows
+        }
+
+    def save(self, collection_name: str, records: Iterable[Dict[str, Any]]) -> None:
+        """Insert or replace the records of the given files.
+
+        Args:
+            collection_name: Collection the files were ingested into.
+            records: Dicts with file_path, size, mtime_ns, content_hash,
+                fingerprint and chunk_ids keys.
+
+        Raises:
+            DatabaseOperationError: If saving the records fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO knowledge_files
+                    (collection_name, file_path, size, mtime_ns, content_hash,
+                     fingerprint, chunk_ids)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    [
+                        (
+                            collection_name,
+                            record["file_path"],
+                            record["size"],
+                            record["mtime_ns"],
+                            record["content_hash"],
+                            record["fingerprint"],
+                            json.dumps(record["chunk_ids"]),
+                        )
+                        for record in records
+                    ],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = f"Error saving knowledge file manifest: {e}"
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def delete(
+        self, collection_name: str, file_paths: Optional[List[str]] = None
+    ) -> None:
+        """Delete the records of the given files, or of the whole collection.
+
+        Raises:
+            DatabaseOperationError: If deleting the records fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                if file_paths is None:
+                    conn.execute(
+                        "DELETE FROM knowledge_files WHERE collection_name = ?",
+                        (collection_name,),
+                    )
+                else:
+                    conn.executemany(
+                        """
+                        DELETE FROM knowledge_files
+                        WHERE collection_name = ? AND file_path = ?
+                    """,
+                        [(collection_name, path) for path in file_paths],
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = f"Error deleting knowledge file manifest: {e}"
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
@@ -13,11 +13,20 @@ from chromadb.api.types import OneOrMany
 from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_file_manifest_storage import (
+    KnowledgeFileManifestSQLiteStorage,
+)
 from crewai.utilities import EmbeddingConfigurator
 from crewai.utilities.chromadb import sanitize_collection_name
+from crewai.utilities.embedding_configurator import embedding_namespace
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.vector_index import (
+    CHROMADB_BACKEND,
+    create_vector_collection,
+    resolve_vector_backend,
+)
 
 
 @contextlib.contextmanager
@@ -37,10 +46,22 @@ def suppress_logging(
     logger.setLevel(original_level)
 
 
+def document_id(document: str) -> str:
+    """Return the ID a document is stored under: the SHA-256 of its text."""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Documents are stored in ChromaDB by default. Pass ``backend="local"`` (or
+    set ``CREWAI_VECTOR_BACKEND=local``) to use a ``LocalVectorIndex`` instead,
+    or the name of a backend added with ``register_vector_backend``.
+
+    The files ingested into the collection are tracked in a file manifest so
+    file knowledge sources can skip files that did not change.
     """
 
     collection: Optional[chromadb.Collection] = None
@@ -51,8 +72,11 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         self,
         embedder: Optional[Dict[str, Any]] = None,
         collection_name: Optional[str] = None,
+        backend: Optional[str] = None,
     ):
         self.collection_name = collection_name
+        self.backend = resolve_vector_backend(backend)
+        self._file_manifest: Optional[KnowledgeFileManifestSQLiteStorage] = None
         self._set_embedder_config(embedder)
 
     def search(
@@ -85,6 +109,20 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
     def initialize_knowledge_storage(self):
         base_path = os.path.join(db_storage_path(), "knowledge")
+        collection_name = self._full_collection_name()
+
+        if self.backend != CHROMADB_BACKEND:
+            self.collection = create_vector_collection(  # type: ignore[assignment]
+                self.backend,
+                os.path.join(
+                    base_path,
+                    f"{self.backend}_index",
+                    sanitize_collection_name(collection_name),
+                ),
+                self.embedder,
+            )
+            return
+
         chroma_client = chromadb.PersistentClient(
             path=base_path,
             settings=Settings(allow_reset=True),
@@ -93,11 +131,6 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         self.app = chroma_client
 
         try:
-            collection_name = (
-                f"knowledge_{self.collection_name}"
-                if self.collection_name
-                else "knowledge"
-            )
             if self.app:
                 self.collection = self.app.get_or_create_collection(
                     name=sanitize_collection_name(collection_name),
@@ -110,6 +143,12 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
     def reset(self):
         base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
+        if self.backend != CHROMADB_BACKEND:
+            if self.collection is not None:
+                self.collection.reset()  # type: ignore[attr-defined]
+            self.file_manifest.delete(self._full_collection_name())
+            return
+
         if not self.app:
             self.app = chromadb.PersistentClient(
                 path=base_path,
@@ -117,9 +156,85 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             )
 
         self.app.reset()
+        # Removes the file manifest along with the Chroma files.
         shutil.rmtree(base_path)
         self.app = None
         self.collection = None
+        self._file_manifest = None
+
+    def delete(self, ids: List[str]) -> None:
+        """Delete the documents with the given IDs from the collection."""
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        if ids:
+            self.collection.delete(ids=ids)
+
+    @property
+    def file_manifest(self) -> KnowledgeFileManifestSQLiteStorage:
+        if self._file_manifest is None:
+            self._file_manifest = KnowledgeFileManifestSQLiteStorage()
+        return self._file_manifest
+
+    def load_file_records(self) -> Dict[str, Dict[str, Any]]:
+        """Return the manifest records of the files ingested into the collection.
+
+        Records are dropped when the collection is empty, since they would
+        otherwise stop files from being ingested again after the vector store
+        was cleared by other means than ``reset()``.
+        """
+        collection_name = self._full_collection_name()
+        if not self.collection or self.collection.count() == 0:
+            self.file_manifest.delete(collection_name)
+            return {}
+        return self.file_manifest.load(collection_name)
+
+    def save_file_records(self, records: List[Dict[str, Any]]) -> None:
+        """Record files as ingested into the collection."""
+        self.file_manifest.save(self._full_collection_name(), records)
+
+    def remove_files(
+        self, file_paths: List[str], keep_ids: Optional[List[str]] = None
+    ) -> None:
+        """Delete the chunks of the given files and their manifest records.
+
+        Chunks that another file in the collection also produced, or that are
+        listed in ``keep_ids``, are kept.
+        """
+        if not file_paths:
+            return
+        records = self.load_file_records()
+        removed = set(file_paths)
+        kept = set(keep_ids or [])
+        for path, record in records.items():
+            if path not in removed:
+                kept.update(record["chunk_ids"])
+        stale_ids = {
+            chunk_id
+            for path in file_paths
+            for chunk_id in records.get(path, {}).get("chunk_ids", [])
+            if chunk_id not in kept
+        }
+        self.delete(sorted(stale_ids))
+        self.file_manifest.delete(self._full_collection_name(), file_paths)
+
+    def remove_missing_files(self) -> None:
+        """Purge the chunks of files that were deleted since they were ingested."""
+        self.remove_files(
+            [path for path in self.load_file_records() if not os.path.exists(path)]
+        )
+
+    def ingestion_fingerprint(self) -> str:
+        """Identify how documents are embedded and stored in this collection.
+
+        Files ingested under another fingerprint must be ingested again, as
+        their vectors come from another model or live in another backend.
+        """
+        return f"{self.backend}:{self.embedding_namespace}"
+
+    def _full_collection_name(self) -> str:
+        return (
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
 
     def save(
         self,
@@ -135,7 +250,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
             # Generate IDs and create a mapping of id -> (document, metadata)
             for idx, doc in enumerate(documents):
-                doc_id = hashlib.sha256(doc.encode("utf-8")).hexdigest()
+                doc_id = document_id(doc)
                 doc_metadata = None
                 if metadata is not None:
                     if isinstance(metadata, list):
@@ -180,15 +295,6 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
-    def _create_default_embedding_function(self):
-        from chromadb.utils.embedding_functions.openai_embedding_function import (
-            OpenAIEmbeddingFunction,
-        )
-
-        return OpenAIEmbeddingFunction(
-            api_key=os.getenv("OPENAI_API_KEY"), model_name="text-embedding-3-small"
-        )
-
     def _set_embedder_config(self, embedder: Optional[Dict[str, Any]] = None) -> None:
         """Set the embedding configuration for the knowledge storage.
 
@@ -196,8 +302,5 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
         """
-        self.embedder = (
-            EmbeddingConfigurator().configure_embedder(embedder)
-            if embedder
-            else self._create_default_embedding_function()
-        )
+        self.embedder = EmbeddingConfigurator().configure_embedder(embedder or None)
+        self.embedding_namespace = embedding_namespace(embedder or None)
@@ -532,6 +532,7 @@ class LiteAgent(FlowTrackable, BaseModel):
                         callbacks=self._callbacks,
                         printer=self._printer,
                         from_agent=self,
+                        stop_on_complete_action=True,
                     )
 
                     # Emit LLM call completed event
@@ -8,6 +8,7 @@ from collections import defaultdict
 from contextlib import contextmanager
 from typing import (
     Any,
+    Callable,
     DefaultDict,
     Dict,
     List,
@@ -20,7 +21,7 @@ from typing import (
 )
 from datetime import datetime
 from dotenv import load_dotenv
-from litellm.types.utils import ChatCompletionDeltaToolCall
+from litellm.types.utils import ChatCompletionDeltaToolCall, Usage
 from pydantic import BaseModel, Field
 
 from crewai.utilities.events.llm_events import (
@@ -52,7 +53,12 @@ import io
 from typing import TextIO
 
 from crewai.llms.base_llm import BaseLLM
-from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.cancellation import (
+    ExecutionCancelledError,
+    check_cancelled,
+    current_cancellation_token,
+)
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
@@ -286,6 +292,19 @@ class AccumulatedToolArgs(BaseModel):
     function: FunctionArgs = Field(default_factory=FunctionArgs)
 
 
+def _with_cache_control(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of ``message`` whose last content block is cacheable."""
+    content = message["content"]
+    if isinstance(content, str):
+        blocks: List[Dict[str, Any]] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = [*content[:-1], dict(content[-1])]
+    else:
+        return message
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return {**message, "content": blocks}
+
+
 class LLM(BaseLLM):
     def __init__(
         self,
@@ -311,6 +330,7 @@ class LLM(BaseLLM):
         callbacks: List[Any] = [],
         reasoning_effort: Optional[Literal["none", "low", "medium", "high"]] = None,
         stream: bool = False,
+        prompt_caching: bool = False,
         **kwargs,
     ):
         self.model = model
@@ -337,6 +357,7 @@ class LLM(BaseLLM):
         self.additional_params = kwargs
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
+        self.prompt_caching = prompt_caching
 
         litellm.drop_params = True
 
@@ -367,12 +388,14 @@ class LLM(BaseLLM):
         self,
         messages: Union[str, List[Dict[str, str]]],
         tools: Optional[List[dict]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
     ) -> Dict[str, Any]:
         """Prepare parameters for the completion call.
 
         Args:
             messages: Input messages for the LLM
             tools: Optional list of tool schemas
+            response_format: Optional model overriding the LLM's response_format
             callbacks: Optional list of callback functions
             available_functions: Optional dict of available functions
 
@@ -383,6 +406,8 @@ class LLM(BaseLLM):
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
         formatted_messages = self._format_messages_for_provider(messages)
+        if self.prompt_caching:
+            formatted_messages = self._add_cache_breakpoints(formatted_messages)
 
         # --- 2) Prepare the parameters for the completion call
         params = {
@@ -397,7 +422,7 @@ class LLM(BaseLLM):
             "presence_penalty": self.presence_penalty,
             "frequency_penalty": self.frequency_penalty,
             "logit_bias": self.logit_bias,
-            "response_format": self.response_format,
+            "response_format": response_format or self.response_format,
             "seed": self.seed,
             "logprobs": self.logprobs,
             "top_logprobs": self.top_logprobs,
@@ -421,6 +446,7 @@ class LLM(BaseLLM):
         available_functions: Optional[Dict[str, Any]] = None,
         from_task: Optional[Any] = None,
         from_agent: Optional[Any] = None,
+        stream_stop: Optional[Callable[[str], Optional[str]]] = None,
     ) -> str:
         """Handle a streaming response from the LLM.
 
@@ -430,6 +456,8 @@ class LLM(BaseLLM):
             available_functions: Dict of available functions
             from_task: Optional task object
             from_agent: Optional agent object
+            stream_stop: Optional callable that can end the stream early by
+                returning the final response text for a chunk
 
         Returns:
             str: The complete response text
@@ -454,7 +482,14 @@ class LLM(BaseLLM):
 
         try:
             # --- 3) Process each chunk in the stream
-            for chunk in litellm.completion(**params):
+            cancellation_token = current_cancellation_token()
+            stream = litellm.completion(**params)
+            for chunk in stream:
+                if cancellation_token is not None and cancellation_token.is_cancelled:
+                    close = getattr(stream, "close", None)
+                    if callable(close):
+                        close()
+                    cancellation_token.raise_if_cancelled()
                 chunk_count += 1
                 last_chunk = chunk
 
@@ -530,11 +565,29 @@ class LLM(BaseLLM):
                     full_response += chunk_content
 
                     # Emit the chunk event
-                    assert hasattr(crewai_event_bus, "emit")
-                    crewai_event_bus.emit(
-                        self,
-                        event=LLMStreamChunkEvent(chunk=chunk_content, from_task=from_task, from_agent=from_agent),
-                    )
+                    if crewai_event_bus.has_handlers(LLMStreamChunkEvent):
+                        crewai_event_bus.emit(
+                            self,
+                            event=LLMStreamChunkEvent.from_chunk(
+                                chunk_content, from_task=from_task, from_agent=from_agent
+                            ),
+                        )
+
+                    if stream_stop is not None:
+                        complete_response = stream_stop(chunk_content)
+                        if complete_response is not None:
+                            # The caller has everything it needs; stop paying
+                            # for the rest of the generation. The usage chunk
+                            # comes last, so estimate what was generated so far.
+                            if not usage_info:
+                                usage_info = self._estimate_usage(
+                                    params["messages"], full_response
+                                )
+                            full_response = complete_response
+                            close = getattr(stream, "close", None)
+                            if callable(close):
+                                close()
+                            break
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
                 logging.warning(
@@ -651,6 +704,8 @@ class LLM(BaseLLM):
             # This exception is handled by CrewAgentExecutor._invoke_loop() which can then
             # decide whether to summarize the content or abort based on the respect_context_window flag.
             raise LLMContextLengthExceededException(str(e))
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             logging.error(f"Error in streaming response: {str(e)}")
             if full_response.strip():
@@ -659,11 +714,11 @@ class LLM(BaseLLM):
                 return full_response
 
             # Emit failed event and re-raise the exception
-            assert hasattr(crewai_event_bus, "emit")
-            crewai_event_bus.emit(
-                self,
-                event=LLMCallFailedEvent(error=str(e), from_task=from_task, from_agent=from_agent),
-            )
+            if crewai_event_bus.has_handlers(LLMCallFailedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMCallFailedEvent(error=str(e), from_task=from_task, from_agent=from_agent),
+                )
             raise Exception(f"Failed to get streaming response: {str(e)}")
 
     def _handle_streaming_tool_calls(
@@ -684,16 +739,16 @@ class LLM(BaseLLM):
                 current_tool_accumulator.function.arguments += (
                     tool_call.function.arguments
                 )
-            assert hasattr(crewai_event_bus, "emit")
-            crewai_event_bus.emit(
-                self,
-                event=LLMStreamChunkEvent(
-                    tool_call=tool_call.to_dict(),
-                    chunk=tool_call.function.arguments,
-                    from_task=from_task,
-                    from_agent=from_agent,
-                ),
-            )
+            if crewai_event_bus.has_handlers(LLMStreamChunkEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMStreamChunkEvent.from_chunk(
+                        tool_call.function.arguments,
+                        tool_call=tool_call.to_dict(),
+                        from_task=from_task,
+                        from_agent=from_agent,
+                    ),
+                )
 
             if (
                 current_tool_accumulator.function.name
@@ -711,6 +766,23 @@ class LLM(BaseLLM):
                     continue
         return None
 
+    def _estimate_usage(
+        self, messages: List[Dict[str, Any]], completion: str
+    ) -> Usage:
+        """Estimate the usage of a call whose stream ended before reporting it."""
+        try:
+            prompt_tokens = litellm.token_counter(model=self.model, messages=messages)
+            completion_tokens = litellm.token_counter(model=self.model, text=completion)
+        except Exception as e:
+            logging.debug(f"Error counting tokens, estimating from length: {e}")
+            prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+            completion_tokens = len(completion) // 4
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
     def _handle_streaming_callbacks(
         self,
         callbacks: Optional[List[Any]],
@@ -852,27 +924,28 @@ class LLM(BaseLLM):
                 fn = available_functions[function_name]
 
                 # --- 3.2) Execute function
-                assert hasattr(crewai_event_bus, "emit")
                 started_at = datetime.now()
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageStartedEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                    ),
-                )
+                if crewai_event_bus.has_handlers(ToolUsageStartedEvent):
+                    crewai_event_bus.emit(
+                        self,
+                        event=ToolUsageStartedEvent(
+                            tool_name=function_name,
+                            tool_args=function_args,
+                        ),
+                    )
 
                 result = fn(**function_args)
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageFinishedEvent(
-                        output=result,
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        started_at=started_at,
-                        finished_at=datetime.now(),
-                    ),
-                )
+                if crewai_event_bus.has_handlers(ToolUsageFinishedEvent):
+                    crewai_event_bus.emit(
+                        self,
+                        event=ToolUsageFinishedEvent(
+                            output=result,
+                            tool_name=function_name,
+                            tool_args=function_args,
+                            started_at=started_at,
+                            finished_at=datetime.now(),
+                        ),
+                    )
 
                 # --- 3.3) Emit success event
                 self._handle_emit_call_events(response=result, call_type=LLMCallType.TOOL_CALL)
@@ -906,6 +979,8 @@ class LLM(BaseLLM):
         available_functions: Optional[Dict[str, Any]] = None,
         from_task: Optional[Any] = None,
         from_agent: Optional[Any] = None,
+        stream_stop: Optional[Callable[[str], Optional[str]]] = None,
+        response_format: Optional[Type[BaseModel]] = None,
     ) -> Union[str, Any]:
         """High-level LLM call method.
 
@@ -922,6 +997,12 @@ class LLM(BaseLLM):
                                that can be invoked by the LLM.
             from_task: Optional Task that invoked the LLM
             from_agent: Optional Agent that invoked the LLM
+            stream_stop: Optional callable invoked with each streamed chunk.
+                         When it returns a string, the stream is closed early
+                         and that string is used as the response. Only used
+                         when streaming is enabled.
+            response_format: Optional Pydantic model the response must follow,
+                             overriding the LLM's response_format for this call.
 
         Returns:
             Union[str, Any]: Either a text response from the LLM (str) or
@@ -932,22 +1013,25 @@ class LLM(BaseLLM):
             ValueError: If response format is not supported
             LLMContextLengthExceededException: If input exceeds model's context limit
         """
+        # --- 0) Don't start a request for work that was already cancelled
+        check_cancelled()
+
         # --- 1) Emit call started event
-        assert hasattr(crewai_event_bus, "emit")
-        crewai_event_bus.emit(
-            self,
-            event=LLMCallStartedEvent(
-                messages=messages,
-                tools=tools,
-                callbacks=callbacks,
-                available_functions=available_functions,
-                from_task=from_task,
-                from_agent=from_agent,
-            ),
-        )
+        if crewai_event_bus.has_handlers(LLMCallStartedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=LLMCallStartedEvent(
+                    messages=messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                ),
+            )
 
         # --- 2) Validate parameters before proceeding with the call
-        self._validate_call_params()
+        self._validate_call_params(response_format)
 
         # --- 3) Convert string messages to proper format if needed
         if isinstance(messages, str):
@@ -966,12 +1050,19 @@ class LLM(BaseLLM):
 
             try:
                 # --- 6) Prepare parameters for the completion call
-                params = self._prepare_completion_params(messages, tools)
+                params = self._prepare_completion_params(
+                    messages, tools, response_format
+                )
 
                 # --- 7) Make the completion call and handle response
                 if self.stream:
                     return self._handle_streaming_response(
-                        params, callbacks, available_functions, from_task, from_agent
+                        params,
+                        callbacks,
+                        available_functions,
+                        from_task,
+                        from_agent,
+                        stream_stop,
                     )
                 else:
                     return self._handle_non_streaming_response(
@@ -984,11 +1075,11 @@ class LLM(BaseLLM):
                 # whether to summarize the content or abort based on the respect_context_window flag
                 raise
             except Exception as e:
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=str(e), from_task=from_task, from_agent=from_agent),
-                )
+                if crewai_event_bus.has_handlers(LLMCallFailedEvent):
+                    crewai_event_bus.emit(
+                        self,
+                        event=LLMCallFailedEvent(error=str(e), from_task=from_task, from_agent=from_agent),
+                    )
                 logging.error(f"LiteLLM call failed: {str(e)}")
                 raise
 
@@ -1002,7 +1093,8 @@ class LLM(BaseLLM):
             from_agent: Optional agent object
             messages: Optional messages object
         """
-        assert hasattr(crewai_event_bus, "emit")
+        if not crewai_event_bus.has_handlers(LLMCallCompletedEvent):
+            return
         crewai_event_bus.emit(
             self,
             event=LLMCallCompletedEvent(messages=messages, response=response, call_type=call_type, from_task=from_task, from_agent=from_agent),
@@ -1069,6 +1161,50 @@ class LLM(BaseLLM):
 
         return messages
 
+    def _add_cache_breakpoints(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Mark the stable prefix of a conversation for provider prompt caching.
+
+        OpenAI-style providers cache repeated prefixes automatically, so the
+        messages are left as they are. Anthropic models only cache up to
+        explicit ``cache_control`` breakpoints, so one is placed after the
+        last system message, after the first user message (the task prompt)
+        and on the last message, letting the next iteration of an agent loop
+        reuse everything sent so far. Anthropic allows at most four
+        breakpoints per request.
+
+        Args:
+            messages: Messages already formatted for the provider.
+
+        Returns:
+            A new list of messages with cache breakpoints added.
+        """
+        if not self.is_anthropic or not messages:
+            return messages
+
+        breakpoints = {len(messages) - 1}
+        system_indexes = [
+            i for i, msg in enumerate(messages) if msg["role"] == "system"
+        ]
+        if system_indexes:
+            breakpoints.add(system_indexes[-1])
+        first_user = next(
+            (
+                i
+                for i, msg in enumerate(messages)
+                if msg["role"] == "user" and msg["content"] != "."
+            ),
+            None,
+        )
+        if first_user is not None:
+            breakpoints.add(first_user)
+
+        return [
+            _with_cache_control(msg) if i in breakpoints else msg
+            for i, msg in enumerate(messages)
+        ]
+
     def _get_custom_llm_provider(self) -> Optional[str]:
         """
         Derives the custom_llm_provider from the model string.
@@ -1080,7 +1216,9 @@ class LLM(BaseLLM):
             return self.model.split("/")[0]
         return None
 
-    def _validate_call_params(self) -> None:
+    def _validate_call_params(
+        self, response_format: Optional[Type[BaseModel]] = None
+    ) -> None:
         """
         Validate parameters before making a call. Currently this only checks if
         a response_format is provided and whether the model supports it.
@@ -1090,7 +1228,9 @@ class LLM(BaseLLM):
           - If no slash is present, "openai" is assumed.
         """
         provider = self._get_custom_llm_provider()
-        if self.response_format is not None and not supports_response_schema(
+        if (
+            response_format or self.response_format
+        ) is not None and not supports_response_schema(
             model=self.model,
             custom_llm_provider=provider,
         ):
@@ -1109,6 +1249,16 @@ class LLM(BaseLLM):
             logging.error(f"Failed to check function calling support: {str(e)}")
             return False
 
+    def supports_response_schema(self) -> bool:
+        """Whether the model accepts a JSON schema as its response_format."""
+        try:
+            return supports_response_schema(
+                model=self.model, custom_llm_provider=self._get_custom_llm_provider()
+            )
+        except Exception as e:
+            logging.error(f"Failed to check response schema support: {str(e)}")
+            return False
+
     def supports_stop_words(self) -> bool:
         try:
             params = get_supported_openai_params(model=self.model)
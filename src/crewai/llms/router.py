@@ -0,0 +1,322 @@
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from crewai.llm import LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.cancellation import ExecutionCancelledError, check_cancelled
+from crewai.utilities.exceptions.context_window_exceeding_exception import (
+    LLMContextLengthExceededException,
+)
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_SECONDS = 60.0
+
+
+class LLMDeployment:
+    """One deployment a :class:`RouterLLM` can send requests to.
+
+    Args:
+        llm: The LLM to call. A string is used as the model name and a dict as
+            keyword arguments for :class:`~crewai.llm.LLM`, so deployments can
+            differ only by ``api_key`` or ``base_url``.
+        rpm: Requests per minute this deployment accepts, if limited.
+        tpm: Tokens per minute this deployment accepts, if limited. Tokens are
+            estimated from the length of the messages and the response.
+        name: Name used in logs. Defaults to the model name.
+    """
+
+    def __init__(
+        self,
+        llm: Union[str, Dict[str, Any], BaseLLM],
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        if isinstance(llm, str):
+            llm = LLM(model=llm)
+        elif isinstance(llm, dict):
+            llm = LLM(**llm)
+        self.llm: BaseLLM = llm
+        self.rpm = rpm
+        self.tpm = tpm
+        self.name = name or llm.model
+
+        self._latencies: Deque[float] = deque(maxlen=100)
+        # [start time, tokens] per request; response tokens are added on success
+        self._requests: Deque[List[float]] = deque()
+        self._cooldown_until = 0.0
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of recent successful call latencies."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def headroom(self, now: float) -> float:
+        """Fraction of the tightest RPM/TPM limit still available this minute."""
+        while self._requests and self._requests[0][0] <= now - _WINDOW_SECONDS:
+            self._requests.popleft()
+        remaining = 1.0
+        if self.rpm:
+            remaining = min(remaining, 1 - len(self._requests) / self.rpm)
+        if self.tpm:
+            used = sum(tokens for _, tokens in self._requests)
+            remaining = min(remaining, 1 - used / self.tpm)
+        return max(remaining, 0.0)
+
+
+class RouterLLM(BaseLLM):
+    """Routes calls across several equivalent LLM deployments.
+
+    Each call goes to the available deployment with the lowest observed p95
+    latency, weighted by how much of its RPM/TPM budget is already used.
+    Deployments without any observed latency are tried first so every one of
+    them gets measured. If a call fails, the deployment is put on cooldown
+    and the next one is tried.
+
+    With ``hedge=True``, if the chosen deployment has not answered after its
+    p95 latency (or ``hedge_after`` seconds), a duplicate request is sent to
+    the next deployment and the first successful answer wins. The slower
+    request is left to finish in the background, so hedging trades extra
+    token spend for lower tail latency.
+
+    Args:
+        deployments: Deployments to route between, in order of preference.
+        hedge: Whether to send hedged duplicate requests.
+        hedge_after: Fixed delay in seconds before hedging. Defaults to the
+            primary deployment's p95 latency.
+        min_samples: Latencies to observe on a deployment before its p95 is
+            used for hedging.
+        cooldown: Seconds a deployment is skipped after a failed call.
+    """
+
+    def __init__(
+        self,
+        deployments: List[Union[LLMDeployment, BaseLLM, str, Dict[str, Any]]],
+        hedge: bool = False,
+        hedge_after: Optional[float] = None,
+        min_samples: int = 5,
+        cooldown: float = 30.0,
+        temperature: Optional[float] = None,
+    ) -> None:
+        if not deployments:
+            raise ValueError("RouterLLM needs at least one deployment")
+
+        self.deployments = [
+            d if isinstance(d, LLMDeployment) else LLMDeployment(d)
+            for d in deployments
+        ]
+        super().__init__(model=self.deployments[0].llm.model, temperature=temperature)
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        kwargs = {
+            "tools": tools,
+            "callbacks": callbacks,
+            "available_functions": available_functions,
+            "from_task": from_task,
+            "from_agent": from_agent,
+        }
+        prompt_tokens = _estimate_tokens(messages)
+        candidates = self._ranked_deployments()
+        last_error: Optional[Exception] = None
+
+        while candidates:
+            check_cancelled()
+            primary = candidates.pop(0)
+            hedge_delay = self._hedge_delay(primary) if candidates else None
+            attempts = [primary]
+            try:
+                if hedge_delay is None:
+                    return self._call_deployment(
+                        primary, messages, prompt_tokens, kwargs
+                    )
+                return self._call_hedged(
+                    primary,
+                    candidates,
+                    hedge_delay,
+                    attempts,
+                    messages,
+                    prompt_tokens,
+                    kwargs,
+                )
+            except (LLMContextLengthExceededException, ExecutionCancelledError):
+                # Equivalent deployments share the context window, and a
+                # cancelled run must not fail over to another deployment.
+                raise
+            except Exception as e:
+                last_error = e
+                candidates = [c for c in candidates if c not in attempts]
+
+        if last_error is None:
+            raise RuntimeError("No LLM deployment is available")
+        raise last_error
+
+    def _call_hedged(
+        self,
+        primary: LLMDeployment,
+        candidates: List[LLMDeployment],
+        hedge_delay: float,
+        attempts: List[LLMDeployment],
+        messages: Union[str, List[Dict[str, str]]],
+        prompt_tokens: int,
+        kwargs: Dict[str, Any],
+    ) -> Union[str, Any]:
+        executor = self._get_executor()
+        pending: Dict[Future, LLMDeployment] = {
+            executor.submit(
+                contextvars.copy_context().run,
+                self._call_deployment,
+                primary,
+                messages,
+                prompt_tokens,
+                kwargs,
+            ): primary
+        }
+        done, _ = wait(pending, timeout=hedge_delay)
+        if not done:
+            check_cancelled()
+            backup = candidates[0]
+            attempts.append(backup)
+            logger.info(
+                f"LLM deployment {primary.name} exceeded {hedge_delay:.2f}s, "
+                f"hedging with {backup.name}"
+            )
+            pending[
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._call_deployment,
+                    backup,
+                    messages,
+                    prompt_tokens,
+                    kwargs,
+                )
+            ] = backup
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                if isinstance(
+                    error, (LLMContextLengthExceededException, ExecutionCancelledError)
+                ):
+                    raise error
+        raise error  # type: ignore[misc]
+
+    def _call_deployment(
+        self,
+        deployment: LLMDeployment,
+        messages: Union[str, List[Dict[str, str]]],
+        prompt_tokens: int,
+        kwargs: Dict[str, Any],
+    ) -> Union[str, Any]:
+        llm = deployment.llm
+        if self.stop:
+            llm.stop = list(dict.fromkeys([*(llm.stop or []), *self.stop]))
+
+        request = [time.monotonic(), float(prompt_tokens)]
+        with self._lock:
+            deployment._requests.append(request)
+        started_at = time.monotonic()
+        try:
+            result = llm.call(messages, **kwargs)
+        except Exception as e:
+            if not isinstance(
+                e, (LLMContextLengthExceededException, ExecutionCancelledError)
+            ):
+                logger.warning(
+                    f"LLM deployment {deployment.name} failed, failing over: {e}"
+                )
+                with self._lock:
+                    deployment._cooldown_until = time.monotonic() + self.cooldown
+            raise
+
+        with self._lock:
+            deployment._latencies.append(time.monotonic() - started_at)
+            if isinstance(result, str):
+                request[1] += len(result) // 4
+        return result
+
+    def _ranked_deployments(self) -> List[LLMDeployment]:
+        """Order deployments by expected latency, skipping unavailable ones."""
+        now = time.monotonic()
+        with self._lock:
+            ranked = []
+            for position, deployment in enumerate(self.deployments):
+                if deployment._cooldown_until > now:
+                    continue
+                headroom = deployment.headroom(now)
+                if headroom <= 0:
+                    continue
+                p95 = deployment.latency_percentile(95)
+                score = 0.0 if p95 is None else p95 / headroom
+                ranked.append((score, position, deployment))
+
+        if not ranked:
+            # Everything is cooling down or out of budget; try them all anyway
+            # rather than failing the call outright.
+            return list(self.deployments)
+        return [deployment for _, _, deployment in sorted(ranked)]
+
+    def _hedge_delay(self, deployment: LLMDeployment) -> Optional[float]:
+        if not self.hedge:
+            return None
+        if self.hedge_after is not None:
+            return self.hedge_after
+        with self._lock:
+            if len(deployment._latencies) < self.min_samples:
+                return None
+            return deployment.latency_percentile(95)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2 * len(self.deployments),
+                    thread_name_prefix="crewai-llm-router",
+                )
+            return self._executor
+
+    def supports_function_calling(self) -> bool:
+        return all(
+            getattr(d.llm, "supports_function_calling", lambda: False)()
+            for d in self.deployments
+        )
+
+    def supports_stop_words(self) -> bool:
+        return all(d.llm.supports_stop_words() for d in self.deployments)
+
+    def get_context_window_size(self) -> int:
+        return min(d.llm.get_context_window_size() for d in self.deployments)
+
+
+def _estimate_tokens(messages: Union[str, List[Dict[str, str]]]) -> int:
+    if isinstance(messages, str):
+        return len(messages) // 4
+    return sum(len(str(message.get("content", ""))) for message in messages) // 4
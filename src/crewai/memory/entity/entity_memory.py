@@ -26,9 +26,17 @@ class EntityMemory(Memory):
 
     _memory_provider: Optional[str] = PrivateAttr()
 
-    def __init__(self, crew=None, embedder_config=None, storage=None, path=None):
+    def __init__(
+        self,
+        crew=None,
+        embedder_config=None,
+        storage=None,
+        path=None,
+        vector_backend=None,
+    ):
         if crew and hasattr(crew, "memory_config") and crew.memory_config is not None:
             memory_provider = crew.memory_config.get("provider")
+            vector_backend = vector_backend or crew.memory_config.get("vector_backend")
         else:
             memory_provider = None
 
@@ -50,6 +58,7 @@ class EntityMemory(Memory):
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    backend=vector_backend,
                 )
             )
 
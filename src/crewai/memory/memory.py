@@ -38,6 +38,24 @@ class Memory(BaseModel):
             query=query, limit=limit, score_threshold=score_threshold
         )
 
+    def enable_write_behind(
+        self, batch_size: int = 32, flush_interval: float = 1.0
+    ) -> "Memory":
+        """Queue saves and write them in batches from a background thread."""
+        from crewai.memory.storage.write_behind_storage import WriteBehindStorage
+
+        if not isinstance(self.storage, WriteBehindStorage):
+            self.storage = WriteBehindStorage(
+                self.storage, batch_size=batch_size, flush_interval=flush_interval
+            )
+        return self
+
+    def flush(self) -> None:
+        """Write any saves still queued by write-behind storage."""
+        flush = getattr(self.storage, "flush", None)
+        if callable(flush):
+            flush()
+
     def set_crew(self, crew: Any) -> "Memory":
         self.crew = crew
         return self
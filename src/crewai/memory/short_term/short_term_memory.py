@@ -28,9 +28,17 @@ class ShortTermMemory(Memory):
 
     _memory_provider: Optional[str] = PrivateAttr()
 
-    def __init__(self, crew=None, embedder_config=None, storage=None, path=None):
+    def __init__(
+        self,
+        crew=None,
+        embedder_config=None,
+        storage=None,
+        path=None,
+        vector_backend=None,
+    ):
         if crew and hasattr(crew, "memory_config") and crew.memory_config is not None:
             memory_provider = crew.memory_config.get("provider")
+            vector_backend = vector_backend or crew.memory_config.get("vector_backend")
         else:
             memory_provider = None
 
@@ -51,6 +59,7 @@ class ShortTermMemory(Memory):
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    backend=vector_backend,
                 )
             )
         super().__init__(storage=storage)
@@ -62,15 +71,16 @@ class ShortTermMemory(Memory):
         metadata: Optional[Dict[str, Any]] = None,
         agent: Optional[str] = None,
     ) -> None:
-        crewai_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=value,
-                metadata=metadata,
-                agent_role=agent,
-                source_type="short_term_memory",
-            ),
-        )
+        if crewai_event_bus.has_handlers(MemorySaveStartedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=value,
+                    metadata=metadata,
+                    agent_role=agent,
+                    source_type="short_term_memory",
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -80,16 +90,17 @@ class ShortTermMemory(Memory):
 
             super().save(value=item.data, metadata=item.metadata, agent=item.agent)
 
-            crewai_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=value,
-                    metadata=metadata,
-                    agent_role=agent,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="short_term_memory",
-                ),
-            )
+            if crewai_event_bus.has_handlers(MemorySaveCompletedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=value,
+                        metadata=metadata,
+                        agent_role=agent,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="short_term_memory",
+                    ),
+                )
         except Exception as e:
             crewai_event_bus.emit(
                 self,
@@ -109,34 +120,36 @@ class ShortTermMemory(Memory):
         limit: int = 3,
         score_threshold: float = 0.35,
     ):
-        crewai_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="short_term_memory",
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = self.storage.search(
-                query=query, limit=limit, score_threshold=score_threshold
-            )  # type: ignore # BUG? The reference is to the parent class, but the parent class does not have this parameters
-
+        if crewai_event_bus.has_handlers(MemoryQueryStartedEvent):
             crewai_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="short_term_memory",
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = self.storage.search(
+                query=query, limit=limit, score_threshold=score_threshold
+            )  # type: ignore # BUG? The reference is to the parent class, but the parent class does not have this parameters
+
+            if crewai_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="short_term_memory",
+                    ),
+                )
+
             return results
         except Exception as e:
             crewai_event_bus.emit(
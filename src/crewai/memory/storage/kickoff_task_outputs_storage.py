@@ -1,8 +1,9 @@
 import json
 import logging
 import sqlite3
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from crewai.task import Task
 from crewai.utilities import Printer
@@ -12,28 +13,42 @@ from crewai.utilities.paths import db_storage_path
 
 logger = logging.getLogger(__name__)
 
+_LATEST_KICKOFF = "(SELECT kickoff_id FROM kickoffs ORDER BY id DESC LIMIT 1)"
+
 
 class KickoffTaskOutputsSQLiteStorage:
     """
-    An updated SQLite storage class for kickoff task outputs storage.
+    SQLite storage for the task outputs of recent crew kickoffs.
+
+    Outputs are keyed by kickoff ID and task index, so a single task output
+    can be read or updated without loading the rest of the run. Only the
+    ``max_kickoffs`` most recent kickoffs are kept. Methods that take an
+    optional ``kickoff_id`` default to the latest kickoff.
     """
 
     def __init__(
-        self, db_path: Optional[str] = None
+        self, db_path: Optional[str] = None, max_kickoffs: int = 10
     ) -> None:
         if db_path is None:
             # Get the parent directory of the default db path and create our db file there
             db_path = str(Path(db_storage_path()) / "latest_kickoff_task_outputs.db")
+        if max_kickoffs < 1:
+            raise ValueError("max_kickoffs must be at least 1")
         self.db_path = db_path
+        self.max_kickoffs = max_kickoffs
         self._printer: Printer = Printer()
         self._initialize_db()
 
     def _initialize_db(self) -> None:
-        """Initialize the SQLite database and create the latest_kickoff_task_outputs table.
+        """Initialize the SQLite database and create the kickoff tables.
 
-        This method sets up the database schema for storing task outputs. It creates
-        a table with columns for task_id, expected_output, output (as JSON),
-        task_index, inputs (as JSON), was_replayed flag, and timestamp.
+        This method sets up the database schema for storing task outputs. The
+        kickoffs table records the order in which kickoffs started, and the
+        kickoff_task_outputs table holds one row per kickoff and task index
+        with the task_id, expected_output, output (as JSON), inputs (as JSON),
+        was_replayed flag, and timestamp. The outputs stored by earlier
+        versions in a single-kickoff table are moved into these tables as one
+        kickoff.
 
         Raises:
             DatabaseOperationError: If database initialization fails due to SQLite errors.
@@ -43,17 +58,35 @@ class KickoffTaskOutputsSQLiteStorage:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                    CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
-                        task_id TEXT PRIMARY KEY,
+                    CREATE TABLE IF NOT EXISTS kickoffs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        kickoff_id TEXT NOT NULL UNIQUE,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS kickoff_task_outputs (
+                        kickoff_id TEXT NOT NULL,
+                        task_index INTEGER NOT NULL,
+                        task_id TEXT NOT NULL,
                         expected_output TEXT,
                         output JSON,
-                        task_index INTEGER,
                         inputs JSON,
                         was_replayed BOOLEAN,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (kickoff_id, task_index)
                     )
                 """
                 )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_kickoff_task_outputs_task_id
+                    ON kickoff_task_outputs (task_id)
+                """
+                )
+                self._migrate_latest_kickoff(cursor)
 
                 conn.commit()
         except sqlite3.Error as e:
@@ -61,6 +94,74 @@ class KickoffTaskOutputsSQLiteStorage:
             logger.error(error_msg)
             raise DatabaseOperationError(error_msg, e)
 
+    @staticmethod
+    def _migrate_latest_kickoff(cursor: sqlite3.Cursor) -> None:
+        """Move the outputs of the single-kickoff table of earlier versions."""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'latest_kickoff_task_outputs'"
+        ).fetchone()
+        if not exists:
+            return
+        if cursor.execute(
+            "SELECT 1 FROM latest_kickoff_task_outputs WHERE task_index IS NOT NULL LIMIT 1"
+        ).fetchone():
+            kickoff_id = str(uuid.uuid4())
+            cursor.execute("INSERT INTO kickoffs (kickoff_id) VALUES (?)", (kickoff_id,))
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO kickoff_task_outputs
+                (kickoff_id, task_index, task_id, expected_output, output, inputs, was_replayed, timestamp)
+                SELECT ?, task_index, task_id, expected_output, output, inputs, was_replayed, timestamp
+                FROM latest_kickoff_task_outputs
+                WHERE task_index IS NOT NULL
+                ORDER BY task_index
+            """,
+                (kickoff_id,),
+            )
+        cursor.execute("DROP TABLE latest_kickoff_task_outputs")
+
+    def start_kickoff(self, kickoff_id: Optional[str] = None) -> str:
+        """Register a new kickoff and drop the ones beyond the retention limit.
+
+        Args:
+            kickoff_id: ID for the kickoff. A random one is generated if omitted.
+
+        Returns:
+            The ID of the registered kickoff.
+
+        Raises:
+            DatabaseOperationError: If registering the kickoff fails due to SQLite errors.
+        """
+        kickoff_id = kickoff_id or str(uuid.uuid4())
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("BEGIN TRANSACTION")
+                cursor = conn.cursor()
+                cursor.execute(
+                    "INSERT OR IGNORE INTO kickoffs (kickoff_id) VALUES (?)",
+                    (kickoff_id,),
+                )
+                cursor.execute(
+                    """
+                    DELETE FROM kickoffs WHERE id NOT IN (
+                        SELECT id FROM kickoffs ORDER BY id DESC LIMIT ?
+                    )
+                """,
+                    (self.max_kickoffs,),
+                )
+                cursor.execute(
+                    """
+                    DELETE FROM kickoff_task_outputs
+                    WHERE kickoff_id NOT IN (SELECT kickoff_id FROM kickoffs)
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+        return kickoff_id
+
     def add(
         self,
         task: Task,
@@ -68,6 +169,7 @@ class KickoffTaskOutputsSQLiteStorage:
         task_index: int,
         was_replayed: bool = False,
         inputs: Dict[str, Any] = {},
+        kickoff_id: Optional[str] = None,
     ) -> None:
         """Add a new task output record to the database.
 
@@ -77,25 +179,30 @@ class KickoffTaskOutputsSQLiteStorage:
             task_index: Integer index of the task in the sequence.
             was_replayed: Boolean indicating if this was a replay execution.
             inputs: Dictionary of input parameters used for the task.
+            kickoff_id: The kickoff the output belongs to. Defaults to the
+                latest kickoff, starting one if none exists yet.
 
         Raises:
             DatabaseOperationError: If saving the task output fails due to SQLite errors.
         """
+        if kickoff_id is None and self.latest_kickoff_id() is None:
+            kickoff_id = self.start_kickoff()
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute("BEGIN TRANSACTION")
                 cursor = conn.cursor()
                 cursor.execute(
-                    """
-                INSERT OR REPLACE INTO latest_kickoff_task_outputs
-                (task_id, expected_output, output, task_index, inputs, was_replayed)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
+                    f"""
+                INSERT OR REPLACE INTO kickoff_task_outputs
+                (kickoff_id, task_index, task_id, expected_output, output, inputs, was_replayed)
+                VALUES (COALESCE(?, {_LATEST_KICKOFF}), ?, ?, ?, ?, ?, ?)
+            """,  # nosec
                     (
+                        kickoff_id,
+                        task_index,
                         str(task.id),
                         task.expected_output,
                         json.dumps(output, cls=CrewJSONEncoder),
-                        task_index,
                         json.dumps(inputs, cls=CrewJSONEncoder),
                         was_replayed,
                     ),
@@ -109,15 +216,17 @@ class KickoffTaskOutputsSQLiteStorage:
     def update(
         self,
         task_index: int,
+        kickoff_id: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         """Update an existing task output record in the database.
 
-        Updates fields of a task output record identified by task_index. The fields
-        to update are provided as keyword arguments.
+        Updates fields of the task output record identified by kickoff and
+        task_index. The fields to update are provided as keyword arguments.
 
         Args:
             task_index: Integer index of the task to update.
+            kickoff_id: The kickoff the record belongs to. Defaults to the latest kickoff.
             **kwargs: Arbitrary keyword arguments representing fields to update.
                      Values that are dictionaries will be JSON encoded.
 
@@ -139,8 +248,8 @@ class KickoffTaskOutputsSQLiteStorage:
                         else value
                     )
 
-                query = f"UPDATE latest_kickoff_task_outputs SET {', '.join(fields)} WHERE task_index = ?"  # nosec
-                values.append(task_index)
+                query = f"UPDATE kickoff_task_outputs SET {', '.join(fields)} WHERE kickoff_id = COALESCE(?, {_LATEST_KICKOFF}) AND task_index = ?"  # nosec
+                values.extend([kickoff_id, task_index])
 
                 cursor.execute(query, tuple(values))
                 conn.commit()
@@ -152,13 +261,156 @@ class KickoffTaskOutputsSQLiteStorage:
             logger.error(error_msg)
             raise DatabaseOperationError(error_msg, e)
 
-    def load(self) -> List[Dict[str, Any]]:
-        """Load all task output records from the database.
+    def latest_kickoff_id(self) -> Optional[str]:
+        """Return the ID of the most recently started kickoff, if any."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT kickoff_id FROM kickoffs ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+                return row[0] if row else None
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def list_kickoffs(self) -> List[Dict[str, Any]]:
+        """List the retained kickoffs, most recent first.
+
+        Returns:
+            List of dictionaries with the kickoff_id, timestamp and number of
+            stored task outputs of each kickoff.
+
+        Raises:
+            DatabaseOperationError: If loading the kickoffs fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT k.kickoff_id, k.timestamp, COUNT(o.task_index)
+                    FROM kickoffs k
+                    LEFT JOIN kickoff_task_outputs o ON o.kickoff_id = k.kickoff_id
+                    GROUP BY k.id
+                    ORDER BY k.id DESC
+                """
+                )
+                return [
+                    {"kickoff_id": row[0], "timestamp": row[1], "task_count": row[2]}
+                    for row in cursor.fetchall()
+                ]
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def find(
+        self, task_id: str, kickoff_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Look up where a task ran, without reading its output.
+
+        Args:
+            task_id: ID of the task to look up.
+            kickoff_id: Kickoff to look in. Defaults to the most recent
+                retained kickoff that ran the task.
+
+        Returns:
+            Dictionary with the kickoff_id, task_index, task_id, inputs,
+            was_replayed and timestamp of the record, or None if not found.
+
+        Raises:
+            DatabaseOperationError: If loading the record fails due to SQLite errors.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if kickoff_id is None:
+                    cursor.execute(
+                        """
+                        SELECT o.kickoff_id, o.task_index, o.task_id, o.inputs, o.was_replayed, o.timestamp
+                        FROM kickoff_task_outputs o
+                        JOIN kickoffs k ON k.kickoff_id = o.kickoff_id
+                        WHERE o.task_id = ?
+                        ORDER BY k.id DESC, o.task_index
+                        LIMIT 1
+                    """,
+                        (str(task_id),),
+                    )
+                else:
+                    cursor.execute(
+                        """
+                        SELECT kickoff_id, task_index, task_id, inputs, was_replayed, timestamp
+                        FROM kickoff_task_outputs
+                        WHERE kickoff_id = ? AND task_id = ?
+                        ORDER BY task_index
+                        LIMIT 1
+                    """,
+                        (kickoff_id, str(task_id)),
+                    )
+                row = cursor.fetchone()
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+        if row is None:
+            return None
+        return {
+            "kickoff_id": row[0],
+            "task_index": row[1],
+            "task_id": row[2],
+            "inputs": json.loads(row[3]),
+            "was_replayed": row[4],
+            "timestamp": row[5],
+        }
+
+    def load_outputs(
+        self, kickoff_id: str, task_indexes: Iterable[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Load and decode the outputs of selected tasks of a kickoff.
+
+        Args:
+            kickoff_id: The kickoff to read from.
+            task_indexes: Indexes of the tasks whose outputs are needed.
+
+        Returns:
+            Dictionary mapping each stored task index to its output data.
+
+        Raises:
+            DatabaseOperationError: If loading the outputs fails due to SQLite errors.
+        """
+        indexes = sorted(set(task_indexes))
+        if not indexes:
+            return {}
+        placeholders = ", ".join("?" for _ in indexes)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT task_index, output
+                    FROM kickoff_task_outputs
+                    WHERE kickoff_id = ? AND task_index IN ({placeholders})
+                """,  # nosec
+                    (kickoff_id, *indexes),
+                )
+                return {row[0]: json.loads(row[1]) for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
+            logger.error(error_msg)
+            raise DatabaseOperationError(error_msg, e)
+
+    def load(self, kickoff_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Load all task output records of a kickoff from the database.
+
+        Args:
+            kickoff_id: The kickoff to load. Defaults to the latest kickoff.
 
         Returns:
             List of dictionaries containing task output records, ordered by task_index.
             Each dictionary contains: task_id, expected_output, output, task_index,
-            inputs, was_replayed, and timestamp.
+            inputs, was_replayed, timestamp and kickoff_id.
 
         Raises:
             DatabaseOperationError: If loading task outputs fails due to SQLite errors.
@@ -166,11 +418,15 @@ class KickoffTaskOutputsSQLiteStorage:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                SELECT *
-                FROM latest_kickoff_task_outputs
+                cursor.execute(
+                    f"""
+                SELECT task_id, expected_output, output, task_index, inputs, was_replayed, timestamp, kickoff_id
+                FROM kickoff_task_outputs
+                WHERE kickoff_id = COALESCE(?, {_LATEST_KICKOFF})
                 ORDER BY task_index
-                """)
+                """,  # nosec
+                    (kickoff_id,),
+                )
 
                 rows = cursor.fetchall()
                 results = []
@@ -183,6 +439,7 @@ class KickoffTaskOutputsSQLiteStorage:
                         "inputs": json.loads(row[4]),
                         "was_replayed": row[5],
                         "timestamp": row[6],
+                        "kickoff_id": row[7],
                     }
                     results.append(result)
 
@@ -194,9 +451,8 @@ class KickoffTaskOutputsSQLiteStorage:
             raise DatabaseOperationError(error_msg, e)
 
     def delete_all(self) -> None:
-        """Delete all task output records from the database.
+        """Delete all kickoffs and task output records from the database.
 
-        This method removes all records from the latest_kickoff_task_outputs table.
         Use with caution as this operation cannot be undone.
 
         Raises:
@@ -206,7 +462,8 @@ class KickoffTaskOutputsSQLiteStorage:
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute("BEGIN TRANSACTION")
                 cursor = conn.cursor()
-                cursor.execute("DELETE FROM latest_kickoff_task_outputs")
+                cursor.execute("DELETE FROM kickoff_task_outputs")
+                cursor.execute("DELETE FROM kickoffs")
                 conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
@@ -1,55 +1,208 @@
+import hashlib
 import json
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from crewai.utilities import Printer
 from crewai.utilities.paths import db_storage_path
 
+# Bumped whenever the table or its indexes change; see ``_migrate``.
+_SCHEMA_VERSION = 2
+
+_INSERT = """
+    INSERT INTO long_term_memories (task_hash, task_description, metadata, datetime, score, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_LOAD = """
+    SELECT metadata, datetime, score
+    FROM long_term_memories
+    WHERE task_hash = ? AND task_description = ?
+    ORDER BY datetime DESC, score ASC
+    LIMIT ?
+"""
+
+_PRUNE_TASK = """
+    DELETE FROM long_term_memories
+    WHERE task_hash = ? AND id NOT IN (
+        SELECT id FROM long_term_memories
+        WHERE task_hash = ?
+        ORDER BY datetime DESC, score ASC
+        LIMIT ?
+    )
+"""
+
+_PRUNE_AGE = """
+    DELETE FROM long_term_memories
+    WHERE created_at < ?
+"""
+
+
+def _task_hash(task_description: str) -> str:
+    return hashlib.sha256(task_description.encode("utf-8")).hexdigest()
+
+
+def _created_at(datetime: Any) -> Optional[float]:
+    """Return the datetime as a Unix timestamp, or None if it is not one."""
+    try:
+        timestamp = float(datetime)
+    except (TypeError, ValueError):
+        return None
+    return timestamp if timestamp > 0 else None
+
 
 class LTMSQLiteStorage:
     """
     An updated SQLite storage class for LTM data storage.
+
+    Rows are looked up through an index on a hash of the task description
+    and the datetime, over a single connection kept open by the storage.
+    Datetimes that are Unix timestamps are also stored in an indexed numeric
+    column, so age-based retention deletes expired rows without a scan.
+    Databases written by older versions are upgraded when they are opened.
+
+    Args:
+        db_path: Path of the SQLite file. Defaults to
+            ``long_term_memory_storage.db`` in the CrewAI storage directory.
+        max_entries_per_task: Newest rows kept for each task description.
+            Older rows are deleted as new ones are saved. Unlimited by default.
+        max_age_days: Rows older than this are deleted as new rows are
+            saved. Only applies to rows whose datetime is a Unix timestamp,
+            as written by agents. Unlimited by default.
     """
 
     def __init__(
-        self, db_path: Optional[str] = None
+        self,
+        db_path: Optional[str] = None,
+        max_entries_per_task: Optional[int] = None,
+        max_age_days: Optional[float] = None,
     ) -> None:
         if db_path is None:
             # Get the parent directory of the default db path and create our db file there
             db_path = str(Path(db_storage_path()) / "long_term_memory_storage.db")
+        if max_entries_per_task is not None and max_entries_per_task < 1:
+            raise ValueError("max_entries_per_task must be a positive integer")
+        if max_age_days is not None and max_age_days <= 0:
+            raise ValueError("max_age_days must be positive")
         self.db_path = db_path
+        self.max_entries_per_task = max_entries_per_task
+        self.max_age_days = max_age_days
         self._printer: Printer = Printer()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         # Ensure parent directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self._initialize_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Return the storage's connection, opening it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.db_path, timeout=30, check_same_thread=False
+            )
+        return self._conn
+
+    def close(self) -> None:
+        """Closes the storage's connection. It is reopened when needed."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "LTMSQLiteStorage":
+        copied = self.__class__.__new__(self.__class__)
+        copied.__setstate__(self.__getstate__())
+        return copied
+
     def _initialize_db(self):
         """
         Initializes the SQLite database and creates LTM table
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS long_term_memories (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            task_hash TEXT,
+                            task_description TEXT,
+                            metadata TEXT,
+                            datetime TEXT,
+                            score REAL,
+                            created_at REAL
+                        )
                     """
-                    CREATE TABLE IF NOT EXISTS long_term_memories (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        task_description TEXT,
-                        metadata TEXT,
-                        datetime TEXT,
-                        score REAL
                     )
-                """
-                )
-
-                conn.commit()
+                    self._migrate(conn)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred during database initialization: {e}",
                 color="red",
             )
 
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Upgrades a table written by an older version to the current schema."""
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version >= _SCHEMA_VERSION:
+            return
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(long_term_memories)")}
+        if "created_at" not in columns:
+            conn.execute("ALTER TABLE long_term_memories ADD COLUMN created_at REAL")
+            datetimes = conn.execute(
+                "SELECT id, datetime FROM long_term_memories"
+            ).fetchall()
+            conn.executemany(
+                "UPDATE long_term_memories SET created_at = ? WHERE id = ?",
+                [
+                    (_created_at(datetime), row_id)
+                    for row_id, datetime in datetimes
+                    if _created_at(datetime) is not None
+                ],
+            )
+        if "task_hash" not in columns:
+            conn.execute("ALTER TABLE long_term_memories ADD COLUMN task_hash TEXT")
+        descriptions = conn.execute(
+            "SELECT DISTINCT task_description FROM long_term_memories WHERE task_hash IS NULL"
+        ).fetchall()
+        conn.executemany(
+            "UPDATE long_term_memories SET task_hash = ? WHERE task_hash IS NULL AND task_description = ?",
+            [
+                (_task_hash(description), description)
+                for (description,) in descriptions
+                if description is not None
+            ],
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_long_term_memories_task
+            ON long_term_memories (task_hash, datetime DESC)
+        """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_long_term_memories_created_at
+            ON long_term_memories (created_at)
+        """
+        )
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
     def save(
         self,
         task_description: str,
@@ -58,17 +211,43 @@ class LTMSQLiteStorage:
         score: Union[int, float],
     ) -> None:
         """Saves data to the LTM table with error handling."""
+        self.save_many(
+            [
+                {
+                    "task_description": task_description,
+                    "metadata": metadata,
+                    "datetime": datetime,
+                    "score": score,
+                }
+            ]
+        )
+
+    def save_many(self, items: List[Dict[str, Any]]) -> None:
+        """Saves several rows to the LTM table in a single transaction.
+
+        Retention limits are applied to the saved tasks in the same
+        transaction.
+
+        Args:
+            items: Dictionaries with the keyword arguments of ``save``.
+        """
+        rows = [
+            (
+                _task_hash(item["task_description"]),
+                item["task_description"],
+                json.dumps(item["metadata"]),
+                item["datetime"],
+                item["score"],
+                _created_at(item["datetime"]),
+            )
+            for item in items
+        ]
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                INSERT INTO long_term_memories (task_description, metadata, datetime, score)
-                VALUES (?, ?, ?, ?)
-            """,
-                    (task_description, json.dumps(metadata), datetime, score),
-                )
-                conn.commit()
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.executemany(_INSERT, rows)
+                    self._apply_retention(conn, {row[0] for row in rows})
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
@@ -80,28 +259,24 @@ class LTMSQLiteStorage:
     ) -> Optional[List[Dict[str, Any]]]:
         """Queries the LTM table by task description with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"""
-                    SELECT metadata, datetime, score
-                    FROM long_term_memories
-                    WHERE task_description = ?
-                    ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec
-                    (task_description,),
+            with self._lock:
+                rows = (
+                    self._connection()
+                    .execute(
+                        _LOAD,
+                        (_task_hash(task_description), task_description, latest_n),
+                    )
+                    .fetchall()
                 )
-                rows = cursor.fetchall()
-                if rows:
-                    return [
-                        {
-                            "metadata": json.loads(row[0]),
-                            "datetime": row[1],
-                            "score": row[2],
-                        }
-                        for row in rows
-                    ]
+            if rows:
+                return [
+                    {
+                        "metadata": json.loads(row[0]),
+                        "datetime": row[1],
+                        "score": row[2],
+                    }
+                    for row in rows
+                ]
 
         except sqlite3.Error as e:
             self._printer.print(
@@ -110,15 +285,53 @@ class LTMSQLiteStorage:
             )
         return None
 
+    def _apply_retention(
+        self, conn: sqlite3.Connection, task_hashes: Iterable[str]
+    ) -> None:
+        if self.max_entries_per_task is not None:
+            conn.executemany(
+                _PRUNE_TASK,
+                [
+                    (task_hash, task_hash, self.max_entries_per_task)
+                    for task_hash in task_hashes
+                ],
+            )
+        if self.max_age_days is not None:
+            conn.execute(_PRUNE_AGE, (time.time() - self.max_age_days * 86400,))
+
+    def compact(self) -> None:
+        """Applies the retention limits to every task and reclaims free space.
+
+        Useful after lowering the limits, or for databases that grew before
+        limits were set.
+        """
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    task_hashes = [
+                        row[0]
+                        for row in conn.execute(
+                            "SELECT DISTINCT task_hash FROM long_term_memories"
+                        )
+                    ]
+                    self._apply_retention(conn, task_hashes)
+                conn.execute("VACUUM")
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: An error occurred while compacting LTM: {e}",
+                color="red",
+            )
+
     def reset(
         self,
     ) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM long_term_memories")
 
         except sqlite3.Error as e:
             self._printer.print(
@@ -12,6 +12,11 @@ from crewai.memory.storage.base_rag_storage import BaseRAGStorage
 from crewai.utilities import EmbeddingConfigurator
 from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.vector_index import (
+    CHROMADB_BACKEND,
+    create_vector_collection,
+    resolve_vector_backend,
+)
 
 
 @contextlib.contextmanager
@@ -35,12 +40,22 @@ class RAGStorage(BaseRAGStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Entries are stored in ChromaDB by default. Pass ``backend="local"`` (or set
+    ``CREWAI_VECTOR_BACKEND=local``) to use a ``LocalVectorIndex`` instead, or
+    the name of a backend added with ``register_vector_backend``.
     """
 
     app: ClientAPI | None = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        backend=None,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
         agents = crew.agents if crew else []
@@ -53,6 +68,7 @@ class RAGStorage(BaseRAGStorage):
 
         self.allow_reset = allow_reset
         self.path = path
+        self.backend = resolve_vector_backend(backend)
         self._initialize_app()
 
     def _set_embedder_config(self):
@@ -60,10 +76,23 @@ class RAGStorage(BaseRAGStorage):
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
 
     def _initialize_app(self):
+        self._set_embedder_config()
+
+        if self.backend != CHROMADB_BACKEND:
+            self.app = None
+            self.collection = create_vector_collection(
+                self.backend,
+                os.path.join(
+                    self.path if self.path else self.storage_file_name,
+                    f"{self.type}_index",
+                ),
+                self.embedder_config,
+            )
+            return
+
         import chromadb
         from chromadb.config import Settings
 
-        self._set_embedder_config()
         chroma_client = chromadb.PersistentClient(
             path=self.path if self.path else self.storage_file_name,
             settings=Settings(allow_reset=self.allow_reset),
@@ -104,6 +133,25 @@ class RAGStorage(BaseRAGStorage):
         except Exception as e:
             logging.error(f"Error during {self.type} save: {str(e)}")
 
+    def save_many(self, items: List[Dict[str, Any]]) -> None:
+        """Saves several values at once so they are embedded in a single batch.
+
+        Args:
+            items: Dictionaries with the ``value`` and ``metadata`` arguments of ``save``.
+        """
+        if not items:
+            return
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        try:
+            self.collection.add(
+                documents=[item["value"] for item in items],
+                metadatas=[item.get("metadata") or {} for item in items],
+                ids=[str(uuid.uuid4()) for _ in items],
+            )
+        except Exception as e:
+            logging.error(f"Error during {self.type} batch save: {str(e)}")
+
     def search(
         self,
         query: str,
@@ -146,7 +194,10 @@ class RAGStorage(BaseRAGStorage):
 
     def reset(self) -> None:
         try:
-            if self.app:
+            if self.backend != CHROMADB_BACKEND:
+                if self.collection is not None:
+                    self.collection.reset()
+            elif self.app:
                 self.app.reset()
                 shutil.rmtree(f"{db_storage_path()}/{self.type}")
                 self.app = None
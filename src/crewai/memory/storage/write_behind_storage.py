@@ -0,0 +1,146 @@
+import atexit
+import copy
+import inspect
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_open_storages: "weakref.WeakSet[WriteBehindStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_storages() -> None:
+    for storage in list(_open_storages):
+        storage.flush()
+
+
+class WriteBehindStorage:
+    """
+    Wraps a memory storage so that saves are queued and written in batches
+    by a background thread instead of on the caller's thread.
+
+    A batch is written once ``batch_size`` items are pending or
+    ``flush_interval`` seconds have passed. If the wrapped storage defines
+    ``save_many(items)``, each batch is written with a single call, where
+    ``items`` is a list of the keyword arguments ``save`` would have received;
+    otherwise ``save`` is called once per item.
+
+    Reads (``search`` and ``load``) flush pending items first, so they always
+    see earlier saves. All other attributes are delegated to the wrapped
+    storage.
+    """
+
+    def __init__(
+        self, storage: Any, batch_size: int = 32, flush_interval: float = 1.0
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+
+        self.storage = storage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: List[Dict[str, Any]] = []
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._save_signature = inspect.signature(storage.save)
+        _open_storages.add(self)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "storage":
+            raise AttributeError(name)
+        return getattr(self.storage, name)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "WriteBehindStorage":
+        self.flush()
+        return WriteBehindStorage(
+            copy.deepcopy(self.storage, memo),
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Queue a save; arguments are the same as the wrapped storage's save."""
+        item = dict(self._save_signature.bind(*args, **kwargs).arguments)
+        with self._condition:
+            self._pending.append(item)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="crewai-memory-write-behind", daemon=True
+                )
+                self._worker.start()
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+
+    def search(self, *args: Any, **kwargs: Any) -> Any:
+        self.flush()
+        return self.storage.search(*args, **kwargs)
+
+    def load(self, *args: Any, **kwargs: Any) -> Any:
+        self.flush()
+        return self.storage.load(*args, **kwargs)
+
+    def reset(self) -> None:
+        with self._condition:
+            self._pending = []
+            self._condition.wait_for(lambda: self._in_flight == 0)
+        self.storage.reset()
+
+    def flush(self) -> None:
+        """Write all pending items and wait for in-flight batches to finish."""
+        batch = self._take_batch(force=True)
+        if batch:
+            self._write(batch)
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight == 0)
+
+    @property
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def _take_batch(self, force: bool = False) -> List[Dict[str, Any]]:
+        with self._condition:
+            if not self._pending or (
+                not force and len(self._pending) < self.batch_size
+            ):
+                return []
+            batch, self._pending = self._pending, []
+            self._in_flight += 1
+            return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            save_many = getattr(self.storage, "save_many", None)
+            if save_many is not None:
+                save_many(batch)
+            else:
+                for item in batch:
+                    self.storage.save(**item)
+        except Exception as e:
+            logger.error(f"Error writing {len(batch)} queued memory items: {e}")
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._pending) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                if not self._pending:
+                    # Let the thread exit when idle; save() restarts it.
+                    self._worker = None
+                    return
+            batch = self._take_batch(force=True)
+            if batch:
+                self._write(batch)
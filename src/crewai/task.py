@@ -1,3 +1,4 @@
+import contextvars
 import datetime
 import inspect
 import json
@@ -41,6 +42,7 @@ from crewai.tools.base_tool import BaseTool
 from crewai.utilities.config import process_config
 from crewai.utilities.constants import NOT_SPECIFIED, _NotSpecified
 from crewai.utilities.guardrail import process_guardrail, GuardrailResult
+from crewai.utilities.cancellation import ExecutionCancelledError
 from crewai.utilities.converter import Converter, convert_to_model
 from crewai.utilities.events import (
     TaskCompletedEvent,
@@ -69,6 +71,8 @@ class Task(BaseModel):
         output_file: File path for storing task output.
         output_json: Pydantic model for structuring JSON output.
         output_pydantic: Pydantic model for task output.
+        native_structured_output: Whether to request output_pydantic or
+            output_json through the LLM's native JSON schema response format.
         security_config: Security configuration including fingerprinting.
         tools: List of tools/resources limited for task execution.
     """
@@ -143,6 +147,14 @@ class Task(BaseModel):
         description="A converter class used to export structured output",
         default=None,
     )
+    native_structured_output: bool = Field(
+        description=(
+            "Whether the agent's final answer should be requested with the LLM's "
+            "native JSON schema response format when output_pydantic or output_json "
+            "is set, instead of being converted afterwards"
+        ),
+        default=False,
+    )
     processed_by_agents: Set[str] = Field(default_factory=set)
     guardrail: Optional[Union[Callable[[TaskOutput], Tuple[bool, Any]], str]] = Field(
         default=None,
@@ -152,6 +164,13 @@ class Task(BaseModel):
         default=3, description="Maximum number of retries when guardrail fails"
     )
     retry_count: int = Field(default=0, description="Current number of retries")
+    guardrail_repair: bool = Field(
+        default=False,
+        description=(
+            "Whether a failed guardrail first asks the agent to correct its final "
+            "answer in the same conversation, before executing the task again"
+        ),
+    )
     start_time: Optional[datetime.datetime] = Field(
         default=None, description="Start time of the task execution"
     )
@@ -220,6 +239,7 @@ class Task(BaseModel):
         return v
 
     _guardrail: Optional[Callable] = PrivateAttr(default=None)
+    _reasoning: Optional[Tuple[BaseAgent, Any]] = PrivateAttr(default=None)
     _original_description: Optional[str] = PrivateAttr(default=None)
     _original_expected_output: Optional[str] = PrivateAttr(default=None)
     _original_output_file: Optional[str] = PrivateAttr(default=None)
@@ -372,10 +392,12 @@ class Task(BaseModel):
     ) -> Future[TaskOutput]:
         """Execute the task asynchronously."""
         future: Future[TaskOutput] = Future()
+        # Run in a copy of the caller's context so cancellation tokens apply.
+        ctx = contextvars.copy_context()
         threading.Thread(
             daemon=True,
-            target=self._execute_task_async,
-            args=(agent, context, tools, future),
+            target=ctx.run,
+            args=(self._execute_task_async, agent, context, tools, future),
         ).start()
         return future
 
@@ -436,6 +458,18 @@ class Task(BaseModel):
                     guardrail=self._guardrail,
                     retry_count=self.retry_count,
                 )
+                if (
+                    not guardrail_result.success
+                    and self.guardrail_repair
+                    and self.retry_count < self.max_retries
+                ):
+                    repaired = self._repair_output(agent, guardrail_result)
+                    if repaired is not None:
+                        task_output, guardrail_result = repaired
+                        result = task_output.raw
+                        pydantic_output = task_output.pydantic
+                        json_output = task_output.json_dict
+
                 if not guardrail_result.success:
                     if self.retry_count >= self.max_retries:
                         raise Exception(
@@ -498,6 +532,57 @@ class Task(BaseModel):
             crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
             raise e  # Re-raise the exception after emitting the event
 
+    def _repair_output(
+        self, agent: BaseAgent, guardrail_result: GuardrailResult
+    ) -> Optional[Tuple[TaskOutput, GuardrailResult]]:
+        """Ask the agent to correct its rejected answer and validate it again.
+
+        Returns:
+            The corrected output and its guardrail result, or None if the agent
+            could not repair its answer, in which case the task is executed
+            again.
+        """
+        printer = Printer()
+        printer.print(
+            content=f"Guardrail blocked, repairing the answer, due to: {guardrail_result.error}\n",
+            color="yellow",
+        )
+        try:
+            feedback = self.i18n.errors("guardrail_repair").format(
+                guardrail_result_error=guardrail_result.error
+            )
+            result = agent.repair_task_output(self, feedback)
+        except ExecutionCancelledError:
+            raise
+        except Exception as e:
+            printer.print(
+                content=f"Repairing the answer failed, executing the task again: {e}\n",
+                color="yellow",
+            )
+            return None
+        if result is None:
+            return None
+
+        self.retry_count += 1
+        pydantic_output, json_output = self._export_output(result)
+        task_output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+        assert self._guardrail is not None
+        guardrail_result = process_guardrail(
+            output=task_output,
+            guardrail=self._guardrail,
+            retry_count=self.retry_count,
+        )
+        return task_output, guardrail_result
+
     def _process_guardrail(self, task_output: TaskOutput) -> GuardrailResult:
         assert self._guardrail is not None
 
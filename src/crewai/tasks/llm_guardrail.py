@@ -1,9 +1,12 @@
-from typing import Any, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
 
 from pydantic import BaseModel, Field
 
-from crewai.agent import Agent, LiteAgentOutput
-from crewai.llm import BaseLLM
+from crewai.agent import LiteAgentOutput
+from crewai.lite_agent import LiteAgent
+from crewai.llm import LLM, BaseLLM
 from crewai.tasks.task_output import TaskOutput
 
 
@@ -17,34 +20,96 @@ class LLMGuardrailResult(BaseModel):
     )
 
 
+class LLMGuardrailBatchResult(BaseModel):
+    results: List[LLMGuardrailResult] = Field(
+        description="One result per task result, in the order the task results were given"
+    )
+
+
 class LLMGuardrail:
     """It validates the output of another task using an LLM.
 
     This class is used to validate the output from a Task based on specified criteria.
     It uses an LLM to validate the output and provides a feedback if the output is not valid.
 
+    Validating agents are kept in a small pool and reused across validations;
+    concurrent validations each take their own agent from it. With ``direct``
+    set, the LLM is called directly with a structured response format instead,
+    when the model supports it.
+
     Args:
         description (str): The description of the validation criteria.
         llm (LLM, optional): The language model to use for code generation.
+        direct (bool, optional): Whether to call the LLM directly instead of
+            running the validating agent. Defaults to False.
     """
 
+    role = "Guardrail Agent"
+    goal = "Validate the output of the task"
+    backstory = "You are a expert at validating the output of a task. By providing effective feedback if the output is not valid."
+
     def __init__(
         self,
         description: str,
         llm: BaseLLM,
+        direct: bool = False,
     ):
         self.description = description
 
         self.llm: BaseLLM = llm
+        self.direct = direct
+        # Idle validating agents per response format
+        self._validators: Dict[Type[BaseModel], List[LiteAgent]] = {}
+        self._lock = threading.Lock()
 
-    def _validate_output(self, task_output: TaskOutput) -> LiteAgentOutput:
-        agent = Agent(
-            role="Guardrail Agent",
-            goal="Validate the output of the task",
-            backstory="You are a expert at validating the output of a task. By providing effective feedback if the output is not valid.",
-            llm=self.llm,
-        )
+    @contextmanager
+    def _validator(self, response_format: Type[BaseModel]) -> Iterator[LiteAgent]:
+        """Borrow an idle validating agent for a response format, building one if none is idle.
 
+        A LiteAgent keeps the state of its current run on the instance, so an
+        agent is only used by one validation at a time.
+        """
+        with self._lock:
+            idle = self._validators.setdefault(response_format, [])
+            validator = idle.pop() if idle else None
+        if validator is None:
+            validator = LiteAgent(
+                role=self.role,
+                goal=self.goal,
+                backstory=self.backstory,
+                llm=self.llm,
+                response_format=response_format,
+            )
+        try:
+            yield validator
+        finally:
+            with self._lock:
+                self._validators[response_format].append(validator)
+
+    def _ask(self, query: str, response_format: Type[BaseModel]) -> Any:
+        """Run a validation query and return the response as a response_format instance."""
+        if (
+            self.direct
+            and isinstance(self.llm, LLM)
+            and self.llm.supports_response_schema()
+        ):
+            response = self.llm.call(
+                [
+                    {
+                        "role": "system",
+                        "content": f"You are {self.role}. {self.backstory}\nYour personal goal is: {self.goal}",
+                    },
+                    {"role": "user", "content": query},
+                ],
+                response_format=response_format,
+            )
+            return response_format.model_validate_json(response)
+
+        with self._validator(response_format) as validator:
+            result: LiteAgentOutput = validator.kickoff(query)
+        return result.pydantic
+
+    def _validate_output(self, task_output: TaskOutput) -> Optional[BaseModel]:
         query = f"""
         Ensure the following task result complies with the given guardrail.
 
@@ -53,7 +118,7 @@ class LLMGuardrail:
 
         Guardrail:
         {self.description}
-        
+
         Your task:
         - Confirm if the Task result complies with the guardrail.
         - If not, provide clear feedback explaining what is wrong (e.g., by how much it violates the rule, or what specific part fails).
@@ -61,9 +126,45 @@ class LLMGuardrail:
         - If the Task result complies with the guardrail, saying that is valid
         """
 
-        result = agent.kickoff(query, response_format=LLMGuardrailResult)
+        return self._ask(query, LLMGuardrailResult)
+
+    def _validate_outputs(self, outputs: Sequence[Any]) -> List[LLMGuardrailResult]:
+        results = "\n\n".join(
+            f"Task result {index}:\n{output.raw}"
+            for index, output in enumerate(outputs, start=1)
+        )
+        query = f"""
+        Ensure each of the following {len(outputs)} task results complies with the given guardrail.
 
-        return result
+        {results}
+
+        Guardrail:
+        {self.description}
+
+        Your task:
+        - Confirm, separately for each Task result, if it complies with the guardrail.
+        - If one does not, provide clear feedback explaining what is wrong with it (e.g., by how much it violates the rule, or what specific part fails).
+        - Focus only on identifying issues — do not propose corrections.
+        - Return exactly one result per Task result, in the same order.
+        """
+
+        batch = self._ask(query, LLMGuardrailBatchResult)
+        if not isinstance(batch, LLMGuardrailBatchResult):
+            raise ValueError("The guardrail result is not a valid pydantic model")
+        if len(batch.results) != len(outputs):
+            raise ValueError("The guardrail did not return one result per task result")
+        return batch.results
+
+    @staticmethod
+    def _to_tuple(result: Any, output: Any) -> Tuple[bool, Any]:
+        assert isinstance(
+            result, LLMGuardrailResult
+        ), "The guardrail result is not a valid pydantic model"
+
+        if result.valid:
+            return True, output.raw
+        else:
+            return False, result.feedback
 
     def __call__(self, task_output: TaskOutput) -> Tuple[bool, Any]:
         """Validates the output of a task based on specified criteria.
@@ -78,14 +179,36 @@ class LLMGuardrail:
         """
 
         try:
-            result = self._validate_output(task_output)
-            assert isinstance(
-                result.pydantic, LLMGuardrailResult
-            ), "The guardrail result is not a valid pydantic model"
-
-            if result.pydantic.valid:
-                return True, task_output.raw
-            else:
-                return False, result.pydantic.feedback
+            return self._to_tuple(self._validate_output(task_output), task_output)
         except Exception as e:
             return False, f"Error while validating the task output: {str(e)}"
+
+    def validate_many(
+        self, outputs: Sequence[Any], batch_size: int = 10
+    ) -> List[Tuple[bool, Any]]:
+        """Validates several outputs, asking about a whole batch at once.
+
+        Useful for the outputs of ``Crew.kickoff_for_each``. A batch whose
+        validation fails is validated again one output at a time.
+
+        Args:
+            outputs (Sequence[Any]): Outputs with a ``raw`` attribute, such as
+                TaskOutput or CrewOutput instances.
+            batch_size (int, optional): Outputs validated per LLM call.
+
+        Returns:
+            List[Tuple[bool, Any]]: One result per output, as returned by
+            calling the guardrail.
+        """
+        validated: List[Tuple[bool, Any]] = []
+        for start in range(0, len(outputs), batch_size):
+            batch = outputs[start : start + batch_size]
+            try:
+                results = self._validate_outputs(batch)
+            except Exception:
+                validated.extend(self(output) for output in batch)
+                continue
+            validated.extend(
+                self._to_tuple(result, output) for result, output in zip(results, batch)
+            )
+        return validated
@@ -106,7 +106,12 @@ class BaseAgentTool(BaseTool):
                 error=f"No agent found with role '{sanitized_name}'"
             )
 
-        agent = agent[0]
+        return self._execute_on_agent(agent[0], task, context)
+
+    def _execute_on_agent(
+        self, agent: BaseAgent, task: str, context: Optional[str] = None
+    ) -> str:
+        """Run ``task`` on a resolved coworker, returning its result or an error message."""
         try:
             task_with_assigned_agent = Task(
                 description=task,
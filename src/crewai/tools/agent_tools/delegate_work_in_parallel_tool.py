@@ -0,0 +1,137 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.tools.agent_tools.base_agent_tools import BaseAgentTool
+
+
+class ParallelDelegation(BaseModel):
+    task: str = Field(..., description="The task to delegate")
+    context: str = Field(..., description="The context for the task")
+    coworker: str = Field(
+        ..., description="The role/name of the coworker to delegate to"
+    )
+
+
+class DelegateWorkInParallelToolSchema(BaseModel):
+    delegations: List[ParallelDelegation] = Field(
+        ...,
+        description="The tasks to delegate, each with its coworker and context",
+    )
+
+
+class _CoworkerPool:
+    """Hands out instances of a coworker, up to its concurrency limit.
+
+    The coworker itself is used first. Additional concurrent delegations run
+    on copies, since an agent's executor state cannot be shared between
+    tasks running at the same time; token usage of the copies is added back
+    to the original agent.
+    """
+
+    def __init__(self, agent: BaseAgent) -> None:
+        self.agent = agent
+        self.size = max(1, getattr(agent, "max_concurrent_delegations", 1))
+        self._available: List[BaseAgent] = [agent]
+        self._created = 1
+        self._condition = threading.Condition()
+
+    def acquire(self) -> BaseAgent:
+        with self._condition:
+            while not self._available:
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._condition.wait()
+            else:
+                return self._available.pop()
+
+        copy = self.agent.copy()
+        copy.crew = self.agent.crew
+        return copy
+
+    def release(self, instance: BaseAgent) -> None:
+        if instance is not self.agent:
+            usage = instance._token_process.get_summary()
+            instance._token_process = TokenProcess()
+            target = self.agent._token_process
+            with self._condition:
+                target.sum_prompt_tokens(usage.prompt_tokens)
+                target.sum_completion_tokens(usage.completion_tokens)
+                target.sum_cached_prompt_tokens(usage.cached_prompt_tokens)
+                target.sum_successful_requests(usage.successful_requests)
+        with self._condition:
+            self._available.append(instance)
+            self._condition.notify()
+
+
+class DelegateWorkInParallelTool(BaseAgentTool):
+    """Tool for delegating several tasks to coworkers at once"""
+
+    name: str = "Delegate work to coworkers in parallel"
+    args_schema: type[BaseModel] = DelegateWorkInParallelToolSchema
+
+    _pools: Dict[int, _CoworkerPool] = PrivateAttr(default_factory=dict)
+    _pools_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _run(
+        self,
+        delegations: List[Union[ParallelDelegation, Dict[str, Any]]],
+        **kwargs,
+    ) -> str:
+        items = [ParallelDelegation.model_validate(item) for item in delegations]
+        if not items:
+            return self.i18n.errors("tool_arguments_error")
+
+        # Each delegation runs in a copy of the caller's context, so it sees
+        # the caller's cancellation token.
+        with ThreadPoolExecutor(
+            max_workers=len(items), thread_name_prefix="crewai-delegation"
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._delegate, item)
+                for item in items
+            ]
+            results = [future.result() for future in futures]
+
+        return "\n\n".join(
+            f"## {item.coworker}: {item.task}\n{result}"
+            for item, result in zip(items, results)
+        )
+
+    def _delegate(self, item: ParallelDelegation) -> str:
+        coworker = self._find_coworker(item.coworker)
+        if coworker is None:
+            # Let _execute produce the usual unknown-coworker message.
+            return self._execute(item.coworker, item.task, item.context)
+
+        pool = self._get_pool(coworker)
+        instance = pool.acquire()
+        try:
+            return self._execute_on_agent(instance, item.task, item.context)
+        finally:
+            pool.release(instance)
+
+    def _find_coworker(self, name: str) -> Optional[BaseAgent]:
+        sanitized_name = self.sanitize_agent_name(name)
+        return next(
+            (
+                agent
+                for agent in self.agents
+                if self.sanitize_agent_name(agent.role) == sanitized_name
+            ),
+            None,
+        )
+
+    def _get_pool(self, agent: BaseAgent) -> _CoworkerPool:
+        with self._pools_lock:
+            pool = self._pools.get(id(agent))
+            if pool is None or pool.agent is not agent:
+                pool = _CoworkerPool(agent)
+                self._pools[id(agent)] = pool
+            return pool
@@ -20,6 +20,7 @@ from crewai.utilities.agent_utils import (
     get_tool_names,
     render_text_description_and_args,
 )
+from crewai.utilities.cancellation import check_cancelled
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import (
     ToolSelectionErrorEvent,
@@ -107,6 +108,7 @@ class ToolUsage:
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        check_cancelled()
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             if self.agent and self.agent.verbose:
@@ -166,7 +168,7 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if self.agent:
+        if self.agent and crewai_event_bus.has_handlers(ToolUsageStartedEvent):
             event_data = {
                 "agent_key": self.agent.key,
                 "agent_role": self.agent.role,
@@ -584,6 +586,8 @@ class ToolUsage:
         tool_calling: Union[ToolCalling, InstructorToolCalling],
         e: Exception,
     ) -> None:
+        if not crewai_event_bus.has_handlers(ToolUsageErrorEvent):
+            return
         event_data = self._prepare_event_data(tool, tool_calling)
         crewai_event_bus.emit(self, ToolUsageErrorEvent(**{**event_data, "error": e}))
 
@@ -595,6 +599,8 @@ class ToolUsage:
         started_at: float,
         result: Any,
     ) -> None:
+        if not crewai_event_bus.has_handlers(ToolUsageFinishedEvent):
+            return
         finished_at = time.time()
         event_data = self._prepare_event_data(tool, tool_calling)
         event_data.update(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class UsageMetrics(BaseModel):
@@ -11,6 +11,7 @@ class UsageMetrics(BaseModel):
         cached_prompt_tokens: Number of cached prompt tokens used.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
+        cache_hit_ratio: Fraction of prompt tokens served from the prompt cache.
     """
 
     total_tokens: int = Field(default=0, description="Total number of tokens used.")
@@ -27,6 +28,14 @@ class UsageMetrics(BaseModel):
         default=0, description="Number of successful requests made."
     )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens that were served from the provider's prompt cache."""
+        if not self.prompt_tokens:
+            return 0.0
+        return self.cached_prompt_tokens / self.prompt_tokens
+
     def add_usage_metrics(self, usage_metrics: "UsageMetrics"):
         """
         Add the usage metrics from another UsageMetrics object.
@@ -1,6 +1,8 @@
 import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
 
 from crewai.agents.parser import (
     FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE,
@@ -8,6 +10,7 @@ from crewai.agents.parser import (
     AgentFinish,
     CrewAgentParser,
     OutputParserException,
+    StreamingCrewAgentParser,
 )
 from crewai.llm import LLM
 from crewai.llms.base_llm import BaseLLM
@@ -147,15 +150,44 @@ def get_llm_response(
     printer: Printer,
     from_task: Optional[Any] = None,
     from_agent: Optional[Any] = None,
+    stop_on_complete_action: bool = False,
+    response_format: Optional[Type[BaseModel]] = None,
 ) -> str:
-    """Call the LLM and return the response, handling any invalid responses."""
+    """Call the LLM and return the response, handling any invalid responses.
+
+    With ``stop_on_complete_action``, a streaming LLM stops generating as soon
+    as the response contains a complete ``Action Input`` JSON value. A
+    ``response_format`` asks the LLM for output following that model's JSON
+    schema natively.
+    """
     try:
-        answer = llm.call(
-            messages,
-            callbacks=callbacks,
-            from_task=from_task,
-            from_agent=from_agent,
-        )
+        if response_format is not None and isinstance(llm, LLM):
+            answer = llm.call(
+                messages,
+                callbacks=callbacks,
+                from_task=from_task,
+                from_agent=from_agent,
+                response_format=response_format,
+            )
+        elif (
+            stop_on_complete_action
+            and isinstance(llm, LLM)
+            and getattr(llm, "stream", False)
+        ):
+            answer = llm.call(
+                messages,
+                callbacks=callbacks,
+                from_task=from_task,
+                from_agent=from_agent,
+                stream_stop=StreamingCrewAgentParser().feed,
+            )
+        else:
+            answer = llm.call(
+                messages,
+                callbacks=callbacks,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
     except Exception as e:
         printer.print(
             content=f"Error during LLM call: {e}",
@@ -0,0 +1,124 @@
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+"""Cooperative cancellation for agent, crew and flow execution."""
+
+T = TypeVar("T")
+
+
+class ExecutionCancelledError(Exception):
+    """Raised at a cancellation checkpoint once the current operation was cancelled."""
+
+    def __init__(self, reason: Optional[str] = None):
+        self.reason = reason
+        super().__init__(reason or "Execution was cancelled.")
+
+
+class ExecutionTimeoutError(TimeoutError):
+    """Raised by :func:`run_with_timeout` when the work did not finish in time."""
+
+
+class CancellationToken:
+    """A flag that long-running work checks to stop early.
+
+    Tokens form a chain: a token created while another one is active becomes
+    its child and is cancelled whenever its parent is, so cancelling a crew
+    also stops the agents running inside it.
+    """
+
+    def __init__(self, parent: Optional["CancellationToken"] = None) -> None:
+        self.parent = parent
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        token: Optional[CancellationToken] = self
+        while token is not None:
+            if token._event.is_set():
+                return True
+            token = token.parent
+        return False
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        token: Optional[CancellationToken] = self
+        while token is not None:
+            if token._event.is_set():
+                raise ExecutionCancelledError(token.reason)
+            token = token.parent
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = (
+    contextvars.ContextVar("crewai_cancellation_token", default=None)
+)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Return the token governing the current context, if any."""
+    return _current_token.get()
+
+
+def check_cancelled() -> None:
+    """Cancellation checkpoint: raise if the current context was cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def cancellation_scope(
+    token: Optional[CancellationToken] = None,
+) -> Iterator[CancellationToken]:
+    """Make a token, chained to the current one, active for the enclosed code."""
+    if token is None:
+        token = CancellationToken(parent=_current_token.get())
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def run_with_timeout(
+    func: Callable[..., T], timeout: float, *args: Any, **kwargs: Any
+) -> T:
+    """Run ``func`` in a worker thread and give up on it after ``timeout`` seconds.
+
+    The worker runs under its own cancellation token. On timeout the token is
+    cancelled, so the worker stops at its next checkpoint, and
+    ``ExecutionTimeoutError`` is raised right away instead of waiting for the
+    worker to finish.
+    """
+    token = CancellationToken(parent=_current_token.get())
+    context = contextvars.copy_context()
+    done = threading.Event()
+    outcome: dict = {}
+
+    def _target() -> None:
+        def _run() -> None:
+            _current_token.set(token)
+            try:
+                outcome["result"] = func(*args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        context.run(_run)
+
+    worker = threading.Thread(target=_target, name="crewai-timeout-worker", daemon=True)
+    worker.start()
+
+    if not done.wait(timeout):
+        token.cancel(f"Timed out after {timeout} seconds")
+        raise ExecutionTimeoutError(f"Execution timed out after {timeout} seconds")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -0,0 +1,235 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.paths import db_storage_path
+
+"""Content-addressed cache for embedding functions."""
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement.
+_SQLITE_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """Two-level cache of embeddings: an in-memory LRU over a SQLite store.
+
+    The SQLite store is opened in WAL mode, so several processes can share it
+    while they read and write. Vectors are stored as float32. Failures of
+    the on-disk store are logged and the cache carries on in memory only.
+
+    Args:
+        db_path: Path of the SQLite file. Defaults to ``embedding_cache.db``
+            in the CrewAI storage directory.
+        max_memory_entries: Embeddings kept in the in-memory LRU.
+    """
+
+    def __init__(
+        self, db_path: Optional[str] = None, max_memory_entries: int = 4096
+    ) -> None:
+        self.db_path = db_path or str(Path(db_storage_path()) / "embedding_cache.db")
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_enabled = True
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS embeddings (
+                        key TEXT PRIMARY KEY,
+                        vector BLOB NOT NULL
+                    )
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._disable_disk(e)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return the cached embeddings for the keys that are present."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self._disk_enabled:
+            from_disk = self._read(missing)
+            self._remember(from_disk)
+            found.update(from_disk)
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Store embeddings in memory and on disk."""
+        vectors = {
+            key: np.asarray(vector, dtype=np.float32) for key, vector in vectors.items()
+        }
+        self._remember(vectors)
+        if not self._disk_enabled or not vectors:
+            return
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._disable_disk(e)
+
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        with self._lock:
+            self._memory.clear()
+        if not self._disk_enabled:
+            return
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                conn.execute("DELETE FROM embeddings")
+                conn.commit()
+        except sqlite3.Error as e:
+            self._disable_disk(e)
+
+    def _read(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                for start in range(0, len(keys), _SQLITE_BATCH_SIZE):
+                    batch = keys[start : start + _SQLITE_BATCH_SIZE]
+                    placeholders = ", ".join("?" for _ in batch)
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+        except sqlite3.Error as e:
+            self._disable_disk(e)
+        return found
+
+    def _remember(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _disable_disk(self, error: Exception) -> None:
+        logger.warning(f"Embedding cache disabled on-disk storage: {error}")
+        self._disk_enabled = False
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the cache shared by every storage in this process."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache()
+        return _default_cache
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embedding function that only embeds texts it has not seen before.
+
+    Embeddings are cached by ``namespace`` and the SHA-256 of the text; the
+    namespace must identify everything that changes the vectors, such as the
+    provider, model and dimensions. Queries are cached separately from
+    documents when the wrapped function embeds them differently. The
+    wrapped function's name and config are reported to ChromaDB unchanged,
+    so existing collections keep working.
+
+    Args:
+        embedding_function: The embedding function to wrap.
+        namespace: Identifies the embedding model in cache keys.
+        cache: Cache to use. Defaults to the cache shared by the process.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        namespace: str,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.namespace = namespace
+        self.cache = cache or get_embedding_cache()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return self._embed(input, "document", self.embedding_function)
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        embed_query = getattr(type(self.embedding_function), "embed_query", None)
+        if embed_query is None or embed_query is EmbeddingFunction.embed_query:
+            return self.__call__(input)
+        return self._embed(input, "query", self.embedding_function.embed_query)
+
+    def _embed(
+        self,
+        input: Documents,
+        kind: str,
+        embed: Callable[[Documents], Embeddings],
+    ) -> Embeddings:
+        texts = [input] if isinstance(input, str) else list(input)
+        keys = [self._key(kind, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        missing = list(
+            dict.fromkeys(
+                (key, text) for key, text in zip(keys, texts) if key not in cached
+            )
+        )
+        if missing:
+            vectors = embed([text for _, text in missing])
+            fresh = {
+                key: np.asarray(vector, dtype=np.float32)
+                for (key, _), vector in zip(missing, vectors)
+            }
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+        return [cached[key] for key in keys]
+
+    def _key(self, kind: str, text: str) -> str:
+        return hashlib.sha256(
+            f"{self.namespace}\x00{kind}\x00{text}".encode("utf-8")
+        ).hexdigest()
+
+    def name(self) -> str:  # type: ignore[override]
+        return self.embedding_function.name()
+
+    def get_config(self) -> Dict[str, Any]:
+        return self.embedding_function.get_config()
+
+    def is_legacy(self) -> bool:
+        return self.embedding_function.is_legacy()
+
+    def default_space(self) -> Any:
+        return self.embedding_function.default_space()
+
+    def supported_spaces(self) -> List[Any]:
+        return self.embedding_function.supported_spaces()
+
+    def validate_config_update(
+        self, old_config: Dict[str, Any], new_config: Dict[str, Any]
+    ) -> None:
+        self.embedding_function.validate_config_update(old_config, new_config)
@@ -4,6 +4,36 @@ from typing import Any, Dict, Optional, cast
 from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.api.types import validate_embedding_function
 
+from crewai.utilities.embedding_cache import CachedEmbeddingFunction
+
+# Config keys that change the vectors a provider returns, and therefore
+# belong in the embedding cache key.
+_CACHE_KEY_CONFIG = ("model", "dimensions", "deployment_id", "url", "api_url", "task_type")
+
+
+def embedding_namespace(embedder_config: Optional[Dict[str, Any]] = None) -> str:
+    """Return a string identifying the vectors an embedder config produces.
+
+    It names the provider and the settings that change the vectors, such as
+    the model and dimensions, but no credentials. Custom embedders are named
+    by their class.
+    """
+    if embedder_config is None:
+        return "openai:model=text-embedding-3-small"
+    provider = embedder_config.get("provider")
+    config = embedder_config.get("config", {})
+    if provider == "custom":
+        embedder = type(config.get("embedder"))
+        return f"custom:{embedder.__module__}.{embedder.__qualname__}"
+    return ":".join(
+        [str(provider)]
+        + [
+            f"{key}={config[key]}"
+            for key in _CACHE_KEY_CONFIG
+            if config.get(key) is not None
+        ]
+    )
+
 
 class EmbeddingConfigurator:
     def __init__(self):
@@ -25,9 +55,17 @@ class EmbeddingConfigurator:
         self,
         embedder_config: Optional[Dict[str, Any]] = None,
     ) -> EmbeddingFunction:
-        """Configures and returns an embedding function based on the provided config."""
+        """Configures and returns an embedding function based on the provided config.
+
+        Embedding functions of the built-in providers are wrapped in a
+        ``CachedEmbeddingFunction`` unless ``embedder_config`` sets
+        ``"cache": False``. Custom embedders are never cached.
+        """
         if embedder_config is None:
-            return self._create_default_embedding_function()
+            return CachedEmbeddingFunction(
+                self._create_default_embedding_function(),
+                namespace=embedding_namespace(None),
+            )
 
         provider = embedder_config.get("provider")
         config = embedder_config.get("config", {})
@@ -39,10 +77,14 @@ class EmbeddingConfigurator:
             )
 
         embedding_function = self.embedding_functions[provider]
-        return (
-            embedding_function(config)
-            if provider == "custom"
-            else embedding_function(config, model_name)
+        if provider == "custom":
+            return embedding_function(config)
+
+        configured = embedding_function(config, model_name)
+        if not embedder_config.get("cache", True):
+            return configured
+        return CachedEmbeddingFunction(
+            configured, namespace=embedding_namespace(embedder_config)
         )
 
     @staticmethod
@@ -48,6 +48,7 @@ from .llm_events import (
     LLMCallFailedEvent,
     LLMCallStartedEvent,
     LLMCallType,
+    LLMRateLimitWaitedEvent,
     LLMStreamChunkEvent,
 )
 
@@ -89,6 +90,7 @@ __all__ = [
     "LLMCallFailedEvent",
     "LLMCallStartedEvent",
     "LLMCallType",
+    "LLMRateLimitWaitedEvent",
     "LLMStreamChunkEvent",
     "MemorySaveStartedEvent",
     "MemorySaveCompletedEvent",
@@ -1,6 +1,6 @@
 import threading
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Type, TypeVar, cast
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, cast
 
 from blinker import Signal
 
@@ -31,13 +31,27 @@ class CrewAIEventsBus:
         """Initialize the event bus internal state"""
         self._signal = Signal("crewai_event_bus")
         self._handlers: Dict[Type[BaseEvent], List[Callable]] = {}
+        # Handlers that only want events while a condition holds, e.g.
+        # console output that is skipped unless the crew is verbose.
+        self._handler_conditions: Dict[Callable, Callable[[], bool]] = {}
+        # Handlers matching each concrete event class, resolved on first emit.
+        self._resolved: Dict[type, List[Callable]] = {}
 
     def on(
-        self, event_type: Type[EventT]
+        self,
+        event_type: Type[EventT],
+        enabled: Optional[Callable[[], bool]] = None,
     ) -> Callable[[Callable[[Any, EventT], None]], Callable[[Any, EventT], None]]:
         """
         Decorator to register an event handler for a specific event type.
 
+        Args:
+            event_type: The event class (or base class) to handle.
+            enabled: Optional condition for the handler. While it returns
+                False the handler does not count towards :meth:`has_handlers`,
+                so emitters may skip building the event. The handler is still
+                called for events that are emitted anyway.
+
         Usage:
             @crewai_event_bus.on(AgentExecutionCompletedEvent)
             def on_agent_execution_completed(
@@ -55,10 +69,43 @@ class CrewAIEventsBus:
             self._handlers[event_type].append(
                 cast(Callable[[Any, EventT], None], handler)
             )
+            if enabled is not None:
+                self._handler_conditions[handler] = enabled
+            self._resolved = {}
             return handler
 
         return decorator
 
+    def has_handlers(self, event_type: Type[BaseEvent]) -> bool:
+        """
+        Check whether emitting an event of ``event_type`` would reach anyone.
+
+        Building an event validates all of its fields, so call sites on hot
+        paths use this to skip constructing events nobody is listening to:
+
+            if crewai_event_bus.has_handlers(LLMCallStartedEvent):
+                crewai_event_bus.emit(self, LLMCallStartedEvent(...))
+        """
+        if self._signal.receivers:
+            return True
+        for handler in self._handlers_for(event_type):
+            condition = self._handler_conditions.get(handler)
+            if condition is None or condition():
+                return True
+        return False
+
+    def _handlers_for(self, event_class: type) -> List[Callable]:
+        handlers = self._resolved.get(event_class)
+        if handlers is None:
+            handlers = [
+                handler
+                for event_type, registered in self._handlers.items()
+                if issubclass(event_class, event_type)
+                for handler in registered
+            ]
+            self._resolved[event_class] = handlers
+        return handlers
+
     def emit(self, source: Any, event: BaseEvent) -> None:
         """
         Emit an event to all registered handlers
@@ -67,15 +114,13 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
-            if isinstance(event, event_type):
-                for handler in handlers:
-                    try:
-                        handler(source, event)
-                    except Exception as e:
-                        print(
-                            f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
-                        )
+        for handler in self._handlers_for(type(event)):
+            try:
+                handler(source, event)
+            except Exception as e:
+                print(
+                    f"[EventBus Error] Handler '{handler.__name__}' failed for event '{type(event).__name__}': {e}"
+                )
 
         self._signal.send(source, event=event)
 
@@ -88,6 +133,7 @@ class CrewAIEventsBus:
         self._handlers[event_type].append(
             cast(Callable[[Any, EventTypes], None], handler)
         )
+        self._resolved = {}
 
     @contextmanager
     def scoped_handlers(self):
@@ -105,10 +151,12 @@ class CrewAIEventsBus:
         """
         previous_handlers = self._handlers.copy()
         self._handlers.clear()
+        self._resolved = {}
         try:
             yield
         finally:
             self._handlers = previous_handlers
+            self._resolved = {}
 
 
 # Global instance
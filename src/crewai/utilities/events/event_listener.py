@@ -99,6 +99,11 @@ class EventListener(BaseEventListener):
 
             MemoryListener(formatter=self.formatter)
 
+    def _console_enabled(self) -> bool:
+        # Handlers registered with this condition only update the console,
+        # which does nothing unless the crew is verbose.
+        return self.formatter.verbose
+
     # ----------- CREW EVENTS -----------
 
     def setup_listeners(self, crewai_event_bus):
@@ -197,7 +202,7 @@ class EventListener(BaseEventListener):
 
         # ----------- AGENT EVENTS -----------
 
-        @crewai_event_bus.on(AgentExecutionStartedEvent)
+        @crewai_event_bus.on(AgentExecutionStartedEvent, enabled=self._console_enabled)
         def on_agent_execution_started(source, event: AgentExecutionStartedEvent):
             self.formatter.create_agent_branch(
                 self.formatter.current_task_branch,
@@ -205,7 +210,7 @@ class EventListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(AgentExecutionCompletedEvent)
+        @crewai_event_bus.on(AgentExecutionCompletedEvent, enabled=self._console_enabled)
         def on_agent_execution_completed(source, event: AgentExecutionCompletedEvent):
             self.formatter.update_agent_status(
                 self.formatter.current_agent_branch,
@@ -292,7 +297,7 @@ class EventListener(BaseEventListener):
 
         # ----------- TOOL USAGE EVENTS -----------
 
-        @crewai_event_bus.on(ToolUsageStartedEvent)
+        @crewai_event_bus.on(ToolUsageStartedEvent, enabled=self._console_enabled)
         def on_tool_usage_started(source, event: ToolUsageStartedEvent):
             if isinstance(source, LLM):
                 self.formatter.handle_llm_tool_usage_started(
@@ -306,7 +311,7 @@ class EventListener(BaseEventListener):
                     self.formatter.current_crew_tree,
                 )
 
-        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        @crewai_event_bus.on(ToolUsageFinishedEvent, enabled=self._console_enabled)
         def on_tool_usage_finished(source, event: ToolUsageFinishedEvent):
             if isinstance(source, LLM):
                 self.formatter.handle_llm_tool_usage_finished(
@@ -319,7 +324,7 @@ class EventListener(BaseEventListener):
                     self.formatter.current_crew_tree,
                 )
 
-        @crewai_event_bus.on(ToolUsageErrorEvent)
+        @crewai_event_bus.on(ToolUsageErrorEvent, enabled=self._console_enabled)
         def on_tool_usage_error(source, event: ToolUsageErrorEvent):
             if isinstance(source, LLM):
                 self.formatter.handle_llm_tool_usage_error(
@@ -336,7 +341,7 @@ class EventListener(BaseEventListener):
 
         # ----------- LLM EVENTS -----------
 
-        @crewai_event_bus.on(LLMCallStartedEvent)
+        @crewai_event_bus.on(LLMCallStartedEvent, enabled=self._console_enabled)
         def on_llm_call_started(source, event: LLMCallStartedEvent):
             # Capture the returned tool branch and update the current_tool_branch reference
             thinking_branch = self.formatter.handle_llm_call_started(
@@ -347,7 +352,7 @@ class EventListener(BaseEventListener):
             if thinking_branch is not None:
                 self.formatter.current_tool_branch = thinking_branch
 
-        @crewai_event_bus.on(LLMCallCompletedEvent)
+        @crewai_event_bus.on(LLMCallCompletedEvent, enabled=self._console_enabled)
         def on_llm_call_completed(source, event: LLMCallCompletedEvent):
             self.formatter.handle_llm_call_completed(
                 self.formatter.current_tool_branch,
@@ -355,7 +360,7 @@ class EventListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(LLMCallFailedEvent)
+        @crewai_event_bus.on(LLMCallFailedEvent, enabled=self._console_enabled)
         def on_llm_call_failed(source, event: LLMCallFailedEvent):
             self.formatter.handle_llm_call_failed(
                 self.formatter.current_tool_branch,
@@ -416,7 +421,7 @@ class EventListener(BaseEventListener):
         def on_crew_test_failed(source, event: CrewTestFailedEvent):
             self.formatter.handle_crew_test_failed(event.crew_name or "Crew")
 
-        @crewai_event_bus.on(KnowledgeRetrievalStartedEvent)
+        @crewai_event_bus.on(KnowledgeRetrievalStartedEvent, enabled=self._console_enabled)
         def on_knowledge_retrieval_started(
             source, event: KnowledgeRetrievalStartedEvent
         ):
@@ -430,7 +435,7 @@ class EventListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(KnowledgeRetrievalCompletedEvent)
+        @crewai_event_bus.on(KnowledgeRetrievalCompletedEvent, enabled=self._console_enabled)
         def on_knowledge_retrieval_completed(
             source, event: KnowledgeRetrievalCompletedEvent
         ):
@@ -444,11 +449,11 @@ class EventListener(BaseEventListener):
                 event.retrieved_knowledge,
             )
 
-        @crewai_event_bus.on(KnowledgeQueryStartedEvent)
+        @crewai_event_bus.on(KnowledgeQueryStartedEvent, enabled=self._console_enabled)
         def on_knowledge_query_started(source, event: KnowledgeQueryStartedEvent):
             pass
 
-        @crewai_event_bus.on(KnowledgeQueryFailedEvent)
+        @crewai_event_bus.on(KnowledgeQueryFailedEvent, enabled=self._console_enabled)
         def on_knowledge_query_failed(source, event: KnowledgeQueryFailedEvent):
             self.formatter.handle_knowledge_query_failed(
                 self.formatter.current_agent_branch,
@@ -456,11 +461,11 @@ class EventListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(KnowledgeQueryCompletedEvent)
+        @crewai_event_bus.on(KnowledgeQueryCompletedEvent, enabled=self._console_enabled)
         def on_knowledge_query_completed(source, event: KnowledgeQueryCompletedEvent):
             pass
 
-        @crewai_event_bus.on(KnowledgeSearchQueryFailedEvent)
+        @crewai_event_bus.on(KnowledgeSearchQueryFailedEvent, enabled=self._console_enabled)
         def on_knowledge_search_query_failed(
             source, event: KnowledgeSearchQueryFailedEvent
         ):
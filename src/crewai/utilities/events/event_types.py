@@ -27,6 +27,7 @@ from .llm_events import (
     LLMCallCompletedEvent,
     LLMCallFailedEvent,
     LLMCallStartedEvent,
+    LLMRateLimitWaitedEvent,
     LLMStreamChunkEvent,
 )
 from .llm_guardrail_events import (
@@ -96,6 +97,7 @@ EventTypes = Union[
     LLMCallCompletedEvent,
     LLMCallFailedEvent,
     LLMStreamChunkEvent,
+    LLMRateLimitWaitedEvent,
     LLMGuardrailStartedEvent,
     LLMGuardrailCompletedEvent,
     AgentReasoningStartedEvent,
@@ -17,8 +17,11 @@ class MemoryListener(BaseEventListener):
         self.memory_retrieval_in_progress = False
         self.memory_save_in_progress = False
 
+    def _console_enabled(self) -> bool:
+        return self.formatter.verbose
+
     def setup_listeners(self, crewai_event_bus):
-        @crewai_event_bus.on(MemoryRetrievalStartedEvent)
+        @crewai_event_bus.on(MemoryRetrievalStartedEvent, enabled=self._console_enabled)
         def on_memory_retrieval_started(
             source, event: MemoryRetrievalStartedEvent
         ):
@@ -32,7 +35,7 @@ class MemoryListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(MemoryRetrievalCompletedEvent)
+        @crewai_event_bus.on(MemoryRetrievalCompletedEvent, enabled=self._console_enabled)
         def on_memory_retrieval_completed(
             source, event: MemoryRetrievalCompletedEvent
         ):
@@ -47,7 +50,7 @@ class MemoryListener(BaseEventListener):
                 event.retrieval_time_ms
             )
 
-        @crewai_event_bus.on(MemoryQueryCompletedEvent)
+        @crewai_event_bus.on(MemoryQueryCompletedEvent, enabled=self._console_enabled)
         def on_memory_query_completed(source, event: MemoryQueryCompletedEvent):
             if not self.memory_retrieval_in_progress:
                 return
@@ -59,7 +62,7 @@ class MemoryListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(MemoryQueryFailedEvent)
+        @crewai_event_bus.on(MemoryQueryFailedEvent, enabled=self._console_enabled)
         def on_memory_query_failed(source, event: MemoryQueryFailedEvent):
             if not self.memory_retrieval_in_progress:
                 return
@@ -71,7 +74,7 @@ class MemoryListener(BaseEventListener):
                 event.source_type,
             )
 
-        @crewai_event_bus.on(MemorySaveStartedEvent)
+        @crewai_event_bus.on(MemorySaveStartedEvent, enabled=self._console_enabled)
         def on_memory_save_started(source, event: MemorySaveStartedEvent):
             if self.memory_save_in_progress:
                 return
@@ -83,7 +86,7 @@ class MemoryListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(MemorySaveCompletedEvent)
+        @crewai_event_bus.on(MemorySaveCompletedEvent, enabled=self._console_enabled)
         def on_memory_save_completed(source, event: MemorySaveCompletedEvent):
             if not self.memory_save_in_progress:
                 return
@@ -97,7 +100,7 @@ class MemoryListener(BaseEventListener):
                 event.source_type,
             )
 
-        @crewai_event_bus.on(MemorySaveFailedEvent)
+        @crewai_event_bus.on(MemorySaveFailedEvent, enabled=self._console_enabled)
         def on_memory_save_failed(source, event: MemorySaveFailedEvent):
             if not self.memory_save_in_progress:
                 return
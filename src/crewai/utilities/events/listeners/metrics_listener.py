@@ -0,0 +1,225 @@
+import threading
+import time
+from typing import Any, Dict, List
+
+from crewai.utilities.events.base_event_listener import BaseEventListener
+from crewai.utilities.events.knowledge_events import (
+    KnowledgeQueryFailedEvent,
+    KnowledgeRetrievalCompletedEvent,
+    KnowledgeRetrievalStartedEvent,
+    KnowledgeSearchQueryFailedEvent,
+)
+from crewai.utilities.events.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallFailedEvent,
+    LLMCallStartedEvent,
+    LLMRateLimitWaitedEvent,
+    LLMStreamChunkEvent,
+)
+from crewai.utilities.events.memory_events import (
+    MemoryQueryCompletedEvent,
+    MemoryRetrievalCompletedEvent,
+    MemorySaveCompletedEvent,
+)
+from crewai.utilities.events.task_events import (
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+)
+from crewai.utilities.events.tool_usage_events import (
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+)
+from crewai.utilities.metrics import MetricsRegistry
+
+
+class MetricsListener(BaseEventListener):
+    """Records latency histograms and counters from crewAI events.
+
+    LLM calls, knowledge retrievals and tasks report only their start and
+    end, so their durations are measured here. LLM calls and knowledge
+    retrievals run synchronously, so they are matched by thread; tasks are
+    matched by the task itself.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self._llm_requests = registry.counter(
+            "crewai_llm_requests_total",
+            "LLM calls by model and outcome.",
+            ("model", "status"),
+        )
+        self._llm_latency = registry.histogram(
+            "crewai_llm_latency_seconds",
+            "Wall time of LLM calls, including tool calls made by the LLM.",
+            ("model",),
+        )
+        self._llm_ttft = registry.histogram(
+            "crewai_llm_time_to_first_token_seconds",
+            "Time from the start of a streamed LLM call to its first chunk.",
+            ("model",),
+        )
+        self._rate_limit_wait = registry.histogram(
+            "crewai_rate_limiter_wait_seconds",
+            "Time requests spent waiting for the RPM limit.",
+        )
+        self._tool_calls = registry.counter(
+            "crewai_tool_calls_total",
+            "Tool calls by tool and whether the result came from the cache.",
+            ("tool", "cache"),
+        )
+        self._tool_errors = registry.counter(
+            "crewai_tool_errors_total", "Failed tool calls.", ("tool",)
+        )
+        self._tool_latency = registry.histogram(
+            "crewai_tool_latency_seconds", "Wall time of tool calls.", ("tool",)
+        )
+        self._memory_query = registry.histogram(
+            "crewai_memory_query_seconds",
+            "Time spent searching a memory.",
+            ("source",),
+        )
+        self._memory_save = registry.histogram(
+            "crewai_memory_save_seconds", "Time spent saving to a memory.", ("source",)
+        )
+        self._memory_retrieval = registry.histogram(
+            "crewai_memory_retrieval_seconds",
+            "Time spent building the memory context for a task.",
+        )
+        self._knowledge_retrieval = registry.histogram(
+            "crewai_knowledge_retrieval_seconds",
+            "Time spent querying knowledge sources for a task.",
+        )
+        self._task_duration = registry.histogram(
+            "crewai_task_duration_seconds",
+            "Wall time of tasks by the role of the agent running them.",
+            ("agent", "status"),
+        )
+
+        self._lock = threading.Lock()
+        # Per thread, a stack of [started_at, model, first_chunk_seen] for the
+        # LLM calls in progress; a tool run by an LLM may call an LLM itself.
+        self._llm_calls: Dict[int, List[List[Any]]] = {}
+        self._knowledge_started: Dict[int, float] = {}
+        self._tasks_started: Dict[int, float] = {}
+        super().__init__()
+
+    def setup_listeners(self, crewai_event_bus):
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def on_llm_call_started(source, event: LLMCallStartedEvent):
+            self._llm_calls.setdefault(threading.get_ident(), []).append(
+                [time.monotonic(), _model_of(source), False]
+            )
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def on_llm_stream_chunk(source, event: LLMStreamChunkEvent):
+            calls = self._llm_calls.get(threading.get_ident())
+            if not calls or calls[-1][2]:
+                return
+            call = calls[-1]
+            call[2] = True
+            self._llm_ttft.labels(model=call[1]).observe(time.monotonic() - call[0])
+
+        @crewai_event_bus.on(LLMCallCompletedEvent)
+        def on_llm_call_completed(source, event: LLMCallCompletedEvent):
+            self._finish_llm_call(source, "success")
+
+        @crewai_event_bus.on(LLMCallFailedEvent)
+        def on_llm_call_failed(source, event: LLMCallFailedEvent):
+            self._finish_llm_call(source, "error")
+
+        @crewai_event_bus.on(LLMRateLimitWaitedEvent)
+        def on_llm_rate_limit_waited(source, event: LLMRateLimitWaitedEvent):
+            self._rate_limit_wait.observe(event.wait_seconds)
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def on_tool_usage_finished(source, event: ToolUsageFinishedEvent):
+            self._tool_calls.labels(
+                tool=event.tool_name, cache="hit" if event.from_cache else "miss"
+            ).inc()
+            self._tool_latency.labels(tool=event.tool_name).observe(
+                (event.finished_at - event.started_at).total_seconds()
+            )
+
+        @crewai_event_bus.on(ToolUsageErrorEvent)
+        def on_tool_usage_error(source, event: ToolUsageErrorEvent):
+            self._tool_errors.labels(tool=event.tool_name).inc()
+
+        @crewai_event_bus.on(MemoryQueryCompletedEvent)
+        def on_memory_query_completed(source, event: MemoryQueryCompletedEvent):
+            self._memory_query.labels(source=event.source_type or "memory").observe(
+                event.query_time_ms / 1000
+            )
+
+        @crewai_event_bus.on(MemorySaveCompletedEvent)
+        def on_memory_save_completed(source, event: MemorySaveCompletedEvent):
+            self._memory_save.labels(source=event.source_type or "memory").observe(
+                event.save_time_ms / 1000
+            )
+
+        @crewai_event_bus.on(MemoryRetrievalCompletedEvent)
+        def on_memory_retrieval_completed(
+            source, event: MemoryRetrievalCompletedEvent
+        ):
+            self._memory_retrieval.observe(event.retrieval_time_ms / 1000)
+
+        @crewai_event_bus.on(KnowledgeRetrievalStartedEvent)
+        def on_knowledge_retrieval_started(
+            source, event: KnowledgeRetrievalStartedEvent
+        ):
+            self._knowledge_started[threading.get_ident()] = time.monotonic()
+
+        @crewai_event_bus.on(KnowledgeRetrievalCompletedEvent)
+        def on_knowledge_retrieval_completed(
+            source, event: KnowledgeRetrievalCompletedEvent
+        ):
+            started_at = self._knowledge_started.pop(threading.get_ident(), None)
+            if started_at is not None:
+                self._knowledge_retrieval.observe(time.monotonic() - started_at)
+
+        @crewai_event_bus.on(KnowledgeQueryFailedEvent)
+        def on_knowledge_query_failed(source, event: KnowledgeQueryFailedEvent):
+            self._knowledge_started.pop(threading.get_ident(), None)
+
+        @crewai_event_bus.on(KnowledgeSearchQueryFailedEvent)
+        def on_knowledge_search_query_failed(
+            source, event: KnowledgeSearchQueryFailedEvent
+        ):
+            self._knowledge_started.pop(threading.get_ident(), None)
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event: TaskStartedEvent):
+            with self._lock:
+                self._tasks_started[id(source)] = time.monotonic()
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event: TaskCompletedEvent):
+            self._finish_task(source, "success")
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event: TaskFailedEvent):
+            self._finish_task(source, "error")
+
+    def _finish_llm_call(self, source: Any, status: str) -> None:
+        calls = self._llm_calls.get(threading.get_ident())
+        call = calls.pop() if calls else None
+        if calls == []:
+            del self._llm_calls[threading.get_ident()]
+        model = call[1] if call else _model_of(source)
+        self._llm_requests.labels(model=model, status=status).inc()
+        if call is not None:
+            self._llm_latency.labels(model=model).observe(time.monotonic() - call[0])
+
+    def _finish_task(self, task: Any, status: str) -> None:
+        with self._lock:
+            started_at = self._tasks_started.pop(id(task), None)
+        if started_at is None:
+            return
+        agent = getattr(task, "agent", None)
+        self._task_duration.labels(
+            agent=getattr(agent, "role", None) or "none", status=status
+        ).observe(time.monotonic() - started_at)
+
+
+def _model_of(source: Any) -> str:
+    return str(getattr(source, "model", None) or "unknown")
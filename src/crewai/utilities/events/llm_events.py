@@ -87,3 +87,32 @@ class LLMStreamChunkEvent(LLMEventBase):
     type: str = "llm_stream_chunk"
     chunk: str
     tool_call: Optional[ToolCall] = None
+
+    @classmethod
+    def from_chunk(
+        cls,
+        chunk: str,
+        tool_call: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> "LLMStreamChunkEvent":
+        """Build a chunk event without validating its fields.
+
+        Streaming emits one event per token, so this skips pydantic
+        validation for the chunk text, which is always a string.
+        """
+        event = cls.model_construct(
+            chunk=chunk,
+            tool_call=ToolCall.model_validate(tool_call) if tool_call else None,
+        )
+        data = {"from_task": from_task, "from_agent": from_agent}
+        event._set_agent_params(data)
+        event._set_task_params(data)
+        return event
+
+
+class LLMRateLimitWaitedEvent(BaseEvent):
+    """Event emitted when a request passes the max_rpm limit, with the time it waited"""
+
+    type: str = "llm_rate_limit_waited"
+    wait_seconds: float
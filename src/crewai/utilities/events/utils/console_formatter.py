@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict, Optional
 
 from rich.console import Console
@@ -21,15 +22,19 @@ class ConsoleFormatter:
     _live_paused: bool = False
     current_llm_tool_tree: Optional[Tree] = None
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, refresh_per_second: float = 4):
         self.console = Console(width=None)
         self.verbose = verbose
+        self.refresh_per_second = refresh_per_second
         # Live instance to dynamically update a Tree renderable (e.g. the Crew tree)
         # When multiple Tree objects are printed sequentially we reuse this Live
         # instance so the previous render is replaced instead of writing a new one.
         # Once any non-Tree renderable is printed we stop the Live session so the
         # final Tree persists on the terminal.
         self._live: Optional[Live] = None
+        # Guards the Live session, which agents running in parallel threads
+        # may start, update and stop concurrently.
+        self._live_lock = threading.RLock()
 
     def create_panel(self, content: Text, title: str, style: str = "blue") -> Panel:
         """Create a standardized panel with consistent styling."""
@@ -89,9 +94,13 @@ class ConsoleFormatter:
         """Custom print that replaces consecutive Tree renders.
 
         * If the argument is a single ``Tree`` instance, we either start a
-          ``Live`` session (first tree) or update the existing one (subsequent
-          trees). This results in the tree being rendered in-place instead of
-          being appended repeatedly to the log.
+          ``Live`` session (first tree) or hand the tree to the existing one
+          (subsequent trees). The Live session redraws from its own refresh
+          thread at most ``refresh_per_second`` times per second, so event
+          handlers never wait on rendering and bursts of updates are drawn
+          as a single frame. Trees are skipped when the console is not a
+          terminal, since they could not be redrawn in place anyway; see
+          ``print_final_tree`` for how the final state still gets printed.
 
         * A blank call (no positional arguments) is ignored while a Live
           session is active so it does not prematurely terminate the tree
@@ -104,37 +113,61 @@ class ConsoleFormatter:
 
         # Case 1: updating / starting live Tree rendering
         if len(args) == 1 and isinstance(args[0], Tree):
-            tree = args[0]
+            if not self.console.is_terminal:
+                return
 
-            if not self._live:
-                # Start a new Live session for the first tree
-                self._live = Live(tree, console=self.console, refresh_per_second=4)
-                self._live.start()
-            else:
-                # Update existing Live session
-                self._live.update(tree, refresh=True)
+            tree = args[0]
+            with self._live_lock:
+                if not self._live:
+                    # Start a new Live session for the first tree
+                    self._live = Live(
+                        tree,
+                        console=self.console,
+                        refresh_per_second=self.refresh_per_second,
+                    )
+                    self._live.start()
+                else:
+                    # The refresh thread draws it on the next frame
+                    self._live.update(tree)
             return  # Nothing else to do
 
-        # Case 2: blank line while a live session is running – ignore so we
-        # don't break the in-place rendering behaviour
-        if len(args) == 0 and self._live:
-            return
+        with self._live_lock:
+            # Case 2: blank line while a live session is running – ignore so we
+            # don't break the in-place rendering behaviour
+            if len(args) == 0 and self._live:
+                return
 
-        # Case 3: printing something other than a Tree → terminate live session
-        if self._live:
-            self._live.stop()
-            self._live = None
+            # Case 3: printing something other than a Tree → terminate live session
+            if self._live:
+                self._live.stop()
+                self._live = None
 
-        # Finally, pass through to the regular Console.print implementation
-        self.console.print(*args, **kwargs)
+            # Finally, pass through to the regular Console.print implementation
+            self.console.print(*args, **kwargs)
+
+    def print_final_tree(self, tree: Tree) -> None:
+        """Print a tree that will not change anymore, once a run has ended.
+
+        In a terminal the Live session keeps the last frame on screen. When
+        the console is not a terminal no tree was rendered during the run,
+        so the final one is printed once as regular output (e.g. CI logs).
+        """
+        if self.console.is_terminal:
+            self.print(tree)
+            return
+
+        with self._live_lock:
+            self.console.print(tree)
+            self.console.print()
 
     def pause_live_updates(self) -> None:
         """Pause Live session updates to allow for human input without interference."""
-        if not self._live_paused:
-            if self._live:
-                self._live.stop()
-                self._live = None
-            self._live_paused = True
+        with self._live_lock:
+            if not self._live_paused:
+                if self._live:
+                    self._live.stop()
+                    self._live = None
+                self._live_paused = True
 
     def resume_live_updates(self) -> None:
         """Resume Live session updates after human input is complete."""
@@ -194,6 +227,8 @@ class ConsoleFormatter:
         )
         content.append(f"Final Output: {final_string_output}\n", style="white")
 
+        if status in ("completed", "failed"):
+            self.print_final_tree(tree)
         self.print_panel(content, title, style)
 
     def create_crew_tree(self, crew_name: str, source_id: str) -> Optional[Tree]:
@@ -401,7 +436,7 @@ class ConsoleFormatter:
             "green" if status == "completed" else "red",
             ID=flow_id,
         )
-        self.print(flow_tree)
+        self.print_final_tree(flow_tree)
         self.print_panel(
             content, "Flow Completion", "green" if status == "completed" else "red"
         )
@@ -951,8 +986,11 @@ class ConsoleFormatter:
         lite_agent_label.append(status_text, style=f"{style} bold")
         lite_agent_branch.label = lite_agent_label
 
-        self.print(lite_agent_branch)
-        self.print()
+        if status in ("completed", "failed"):
+            self.print_final_tree(lite_agent_branch)
+        else:
+            self.print(lite_agent_branch)
+            self.print()
 
         # Show status panel if additional fields are provided
         if fields:
@@ -0,0 +1,424 @@
+"""In-process metrics with Prometheus and OpenMetrics text exposition."""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = (
+    "application/openmetrics-text; version=1.0.0; charset=utf-8"
+)
+
+
+class _CounterValue:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class _HistogramValue:
+    """Distribution of observed values.
+
+    Values are counted in logarithmic buckets that are ``relative_error``
+    wide, as in an HDR histogram, so percentiles stay within that relative
+    error of the true value whether observations are milliseconds or
+    minutes apart. Counts for the fixed exposition buckets are kept
+    separately so scrapes see exact, stable ``le`` boundaries.
+    """
+
+    def __init__(self, buckets: Sequence[float], relative_error: float) -> None:
+        self._buckets = tuple(buckets)
+        self._bucket_counts = [0] * (len(self._buckets) + 1)
+        self._log_base = math.log1p(relative_error)
+        self._log_counts: Dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+            self._bucket_counts[bisect.bisect_left(self._buckets, value)] += 1
+            if value <= 0:
+                self._zero_count += 1
+            else:
+                index = math.floor(math.log(value) / self._log_base)
+                self._log_counts[index] = self._log_counts.get(index, 0) + 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of the observed values."""
+        with self._lock:
+            if not self._count:
+                return None
+            rank = max(1, math.ceil(self._count * percentile / 100))
+            seen = self._zero_count
+            if seen >= rank:
+                return max(self._min, 0.0)
+            for index in sorted(self._log_counts):
+                seen += self._log_counts[index]
+                if seen >= rank:
+                    midpoint = math.exp((index + 0.5) * self._log_base)
+                    return min(max(midpoint, self._min), self._max)
+            return self._max
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """Return ``(upper bound, cumulative count)`` pairs ending with +Inf."""
+        with self._lock:
+            counts = list(self._bucket_counts)
+        result = []
+        total = 0
+        for bound, count in zip((*self._buckets, math.inf), counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min if self._count else None,
+            "max": self._max if self._count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class _Metric(ABC):
+    type: str = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        """Return the child metric for the given label values."""
+        if values and labels:
+            raise ValueError("Pass label values either by position or by name")
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def samples(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            children = list(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in children]
+
+    def clear(self) -> None:
+        """Drop the values recorded for every label set."""
+        with self._lock:
+            self._children.clear()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the value recorded for one label set."""
+        pass
+
+    def _unlabeled(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} is labeled; call labels() first")
+        return self.labels()
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, such as requests or cache hits."""
+
+    type = "counter"
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+
+class Histogram(_Metric):
+    """A distribution of observations, such as latencies in seconds."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        relative_error: float = 0.01,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.relative_error = relative_error
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets, self.relative_error)
+
+    def observe(self, value: float) -> None:
+        self._unlabeled().observe(value)
+
+
+class MetricsRegistry:
+    """Holds metrics and exposes them for pulling or scraping.
+
+    Metrics are created on first use and returned as-is afterwards, so
+    components can look them up by name without sharing references.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str = "", labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str = "",
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Drop all recorded values.
+
+        The metrics themselves stay registered, so components holding them,
+        such as the metrics listener, keep recording into this registry.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current value of every metric.
+
+        Counters report a ``value`` per label set. Histograms report the
+        count, sum, min, max and p50/p90/p99 of each label set.
+        """
+        result = {}
+        for metric in self._sorted_metrics():
+            samples = []
+            for labels, child in metric.samples():
+                if isinstance(metric, Histogram):
+                    samples.append({"labels": labels, **child.summary()})
+                else:
+                    samples.append({"labels": labels, "value": child.value})
+            result[metric.name] = {
+                "type": metric.type,
+                "help": metric.documentation,
+                "samples": samples,
+            }
+        return result
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        return self._render(openmetrics=False)
+
+    def to_openmetrics(self) -> str:
+        """Render all metrics in the OpenMetrics text format."""
+        return self._render(openmetrics=True)
+
+    def _render(self, openmetrics: bool) -> str:
+        lines: List[str] = []
+        for metric in self._sorted_metrics():
+            family = metric.name
+            if openmetrics and isinstance(metric, Counter):
+                family = family.removesuffix("_total")
+            lines.append(f"# HELP {family} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {family} {metric.type}")
+            for labels, child in metric.samples():
+                if isinstance(metric, Counter):
+                    lines.append(
+                        f"{metric.name}{_format_labels(labels)} {_format_value(child.value)}"
+                    )
+                    continue
+                for bound, count in child.cumulative_buckets():
+                    bucket_labels = {**labels, "le": _format_value(bound)}
+                    lines.append(
+                        f"{metric.name}_bucket{_format_labels(bucket_labels)} {count}"
+                    )
+                lines.append(
+                    f"{metric.name}_count{_format_labels(labels)} {child.count}"
+                )
+                lines.append(
+                    f"{metric.name}_sum{_format_labels(labels)} {_format_value(child.sum)}"
+                )
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _sorted_metrics(self) -> List[_Metric]:
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        if cls is Counter and not name.endswith("_total"):
+            name = f"{name}_total"
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(
+                labelnames
+            ):
+                raise ValueError(
+                    f"Metric {name} is already registered as a {metric.type} "
+                    f"with labels {metric.labelnames}"
+                )
+            return metric
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\""),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+metrics_registry = MetricsRegistry()
+
+_listeners: Dict[int, Any] = {}
+_listeners_lock = threading.Lock()
+
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """Start recording crew, agent, LLM, tool, memory and knowledge metrics.
+
+    Args:
+        registry: Registry to record into. Defaults to ``metrics_registry``.
+
+    Returns:
+        The registry the metrics are recorded into.
+    """
+    from crewai.utilities.events.listeners.metrics_listener import MetricsListener
+
+    registry = registry or metrics_registry
+    with _listeners_lock:
+        if id(registry) not in _listeners:
+            _listeners[id(registry)] = MetricsListener(registry)
+    return registry
+
+
+def start_metrics_server(
+    port: int = 9464,
+    addr: str = "127.0.0.1",
+    registry: Optional[MetricsRegistry] = None,
+) -> ThreadingHTTPServer:
+    """Serve the registry over HTTP for Prometheus to scrape.
+
+    Scrapers that accept ``application/openmetrics-text`` receive the
+    OpenMetrics format, everyone else the Prometheus text format. The
+    server runs on a daemon thread; call ``shutdown()`` on the returned
+    server to stop it.
+    """
+    active: MetricsRegistry = registry or metrics_registry
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if "application/openmetrics-text" in self.headers.get("Accept", ""):
+                body, content_type = active.to_openmetrics(), OPENMETRICS_CONTENT_TYPE
+            else:
+                body, content_type = active.to_prometheus(), PROMETHEUS_CONTENT_TYPE
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="crewai-metrics-server", daemon=True
+    )
+    thread.start()
+    return server
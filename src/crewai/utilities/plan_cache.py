@@ -0,0 +1,61 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+"""In-process cache of reasoning and planning results."""
+
+
+class PlanCache:
+    """Bounded LRU cache of plans, shared across kickoffs in a process.
+
+    Plans are keyed by a hash of everything they were generated from, such
+    as the agent, the task description and the tools, so a plan is only
+    reused for an identical request. Cached models are copied on the way in
+    and out, so callers can't change them.
+
+    Args:
+        max_entries: Plans kept before the least recently used is evicted.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, BaseModel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Return the cache key of a plan generated from the given parts."""
+        return hashlib.sha256(
+            json.dumps(parts, default=str, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[BaseModel]:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                return None
+            self._plans.move_to_end(key)
+        return plan.model_copy(deep=True)
+
+    def put(self, key: str, plan: BaseModel) -> None:
+        with self._lock:
+            self._plans[key] = plan.model_copy(deep=True)
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+
+_plan_cache = PlanCache()
+
+
+def get_plan_cache() -> PlanCache:
+    """Return the plan cache shared by every agent and crew in this process."""
+    return _plan_cache
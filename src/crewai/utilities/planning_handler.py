@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from crewai.agent import Agent
 from crewai.task import Task
+from crewai.utilities.plan_cache import PlanCache, get_plan_cache
 
 """Handles planning and coordination of crew tasks."""
 logger = logging.getLogger(__name__)
@@ -28,8 +29,14 @@ class PlannerTaskPydanticOutput(BaseModel):
 
 class CrewPlanner:
     """Plans and coordinates the execution of crew tasks."""
-    def __init__(self, tasks: List[Task], planning_agent_llm: Optional[Any] = None):
+    def __init__(
+        self,
+        tasks: List[Task],
+        planning_agent_llm: Optional[Any] = None,
+        cache: bool = False,
+    ):
         self.tasks = tasks
+        self.cache = cache
 
         if planning_agent_llm is None:
             self.planning_agent_llm = "gpt-4o-mini"
@@ -41,11 +48,24 @@ class CrewPlanner:
         planning_agent = self._create_planning_agent()
         tasks_summary = self._create_tasks_summary()
 
+        cache_key = None
+        if self.cache:
+            cache_key = PlanCache.key(
+                "planning",
+                getattr(self.planning_agent_llm, "model", self.planning_agent_llm),
+                tasks_summary,
+            )
+            cached = get_plan_cache().get(cache_key)
+            if isinstance(cached, PlannerTaskPydanticOutput):
+                return cached
+
         planner_task = self._create_planner_task(planning_agent, tasks_summary)
 
         result = planner_task.execute_sync()
 
         if isinstance(result.pydantic, PlannerTaskPydanticOutput):
+            if cache_key:
+                get_plan_cache().put(cache_key, result.pydantic)
             return result.pydantic
 
         raise ValueError("Failed to get the Planning output")
@@ -1,6 +1,6 @@
 import logging
 import json
-from typing import Tuple, cast
+from typing import Optional, Tuple, cast
 
 from pydantic import BaseModel, Field
 
@@ -8,6 +8,7 @@ from crewai.agent import Agent
 from crewai.task import Task
 from crewai.utilities import I18N
 from crewai.llm import LLM
+from crewai.utilities.plan_cache import PlanCache, get_plan_cache
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.reasoning_events import (
     AgentReasoningStartedEvent,
@@ -70,7 +71,14 @@ class AgentReasoning:
             pass
 
         try:
-            output = self.__handle_agent_reasoning()
+            cache_key = self.__cache_key()
+            cached = get_plan_cache().get(cache_key) if cache_key else None
+            if isinstance(cached, AgentReasoningOutput):
+                output = cached
+            else:
+                output = self.__handle_agent_reasoning()
+                if cache_key:
+                    get_plan_cache().put(cache_key, output)
 
             # Emit reasoning completed event
             try:
@@ -105,6 +113,25 @@ class AgentReasoning:
 
             raise
 
+    def __cache_key(self) -> Optional[str]:
+        """
+        Returns the key of the plan in the plan cache, or None if the agent
+        does not cache its reasoning plans.
+        """
+        if not getattr(self.agent, "cache_reasoning_plans", False):
+            return None
+        return PlanCache.key(
+            "reasoning",
+            self.agent.role,
+            self.agent.goal,
+            self.__get_agent_backstory(),
+            getattr(self.llm, "model", str(self.llm)),
+            self.agent.max_reasoning_attempts,
+            self.task.description,
+            self.task.expected_output,
+            sorted(tool.name for tool in (self.task.tools or [])),
+        )
+
     def __handle_agent_reasoning(self) -> AgentReasoningOutput:
         """
         Private method that handles the agent reasoning process.
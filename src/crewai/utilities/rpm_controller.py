@@ -39,7 +39,9 @@ class RPMController(BaseModel):
                 self.logger.log(
                     "info", "Max RPM reached, waiting for next minute to start."
                 )
+                started_at = time.monotonic()
                 self._wait_for_next_minute()
+                self._record_wait(time.monotonic() - started_at)
                 self._current_rpm = 1
                 return True
             return True
@@ -50,6 +52,16 @@ class RPMController(BaseModel):
         else:
             return _check_and_increment()
 
+    def _record_wait(self, wait_seconds: float) -> None:
+        # Imported here, as the events package imports this module
+        from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+        from crewai.utilities.events.llm_events import LLMRateLimitWaitedEvent
+
+        if crewai_event_bus.has_handlers(LLMRateLimitWaitedEvent):
+            crewai_event_bus.emit(
+                self, LLMRateLimitWaitedEvent(wait_seconds=wait_seconds)
+            )
+
     def stop_rpm_counter(self):
         if self._timer:
             self._timer.cancel()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -29,12 +29,18 @@ class ExecutionLog(BaseModel):
 class TaskOutputStorageHandler:
     def __init__(self) -> None:
         self.storage = KickoffTaskOutputsSQLiteStorage()
+        self.kickoff_id: Optional[str] = None
 
-    def update(self, task_index: int, log: Dict[str, Any]):
-        saved_outputs = self.load()
-        if saved_outputs is None:
-            raise ValueError("Logs cannot be None")
+    def start_kickoff(self) -> str:
+        """Start recording outputs for a new kickoff."""
+        self.kickoff_id = self.storage.start_kickoff()
+        return self.kickoff_id
+
+    def use_kickoff(self, kickoff_id: str) -> None:
+        """Record further outputs, such as replayed ones, into an existing kickoff."""
+        self.kickoff_id = kickoff_id
 
+    def update(self, task_index: int, log: Dict[str, Any]):
         if log.get("was_replayed", False):
             replayed = {
                 "task_id": str(log["task"].id),
@@ -45,10 +51,11 @@ class TaskOutputStorageHandler:
             }
             self.storage.update(
                 task_index,
+                kickoff_id=self.kickoff_id,
                 **replayed,
             )
         else:
-            self.storage.add(**log)
+            self.add(**log)
 
     def add(
         self,
@@ -58,10 +65,23 @@ class TaskOutputStorageHandler:
         inputs: Dict[str, Any] = {},
         was_replayed: bool = False,
     ):
-        self.storage.add(task, output, task_index, was_replayed, inputs)
+        self.storage.add(
+            task, output, task_index, was_replayed, inputs, kickoff_id=self.kickoff_id
+        )
+
+    def find(
+        self, task_id: str, kickoff_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self.storage.find(task_id, kickoff_id)
+
+    def load_outputs(
+        self, kickoff_id: str, task_indexes: Iterable[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        return self.storage.load_outputs(kickoff_id, task_indexes)
 
     def reset(self):
         self.storage.delete_all()
+        self.kickoff_id = None
 
-    def load(self) -> Optional[List[Dict[str, Any]]]:
-        return self.storage.load()
+    def load(self, kickoff_id: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        return self.storage.load(kickoff_id or self.kickoff_id)
@@ -0,0 +1,606 @@
+"""Local vector index used as a lightweight alternative to ChromaDB collections."""
+
+import json
+import os
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+CHROMADB_BACKEND = "chromadb"
+LOCAL_BACKEND = "local"
+
+# Deleted entries tolerated before the index compacts itself
+_COMPACT_MIN_DELETED = 1024
+
+
+class VectorCollection(Protocol):
+    """The subset of the ChromaDB collection API memory and knowledge storage use.
+
+    Vector backends other than ChromaDB return objects implementing it; see
+    :func:`register_vector_backend`.
+    """
+
+    def add(
+        self,
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        ids: Optional[Sequence[str]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None: ...
+
+    def upsert(
+        self,
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        ids: Optional[Sequence[str]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None: ...
+
+    def query(
+        self,
+        query_texts: Optional[Union[str, Sequence[str]]] = None,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        query_embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> Dict[str, List[List[Any]]]: ...
+
+    def delete(self, ids: Sequence[str]) -> None: ...
+
+    def count(self) -> int: ...
+
+    def reset(self) -> None: ...
+
+
+# Builds a collection from the directory it lives in and the embedding function
+VectorBackendFactory = Callable[[str, Any], VectorCollection]
+
+_VECTOR_BACKENDS: Dict[str, VectorBackendFactory] = {}
+
+
+def register_vector_backend(name: str, factory: VectorBackendFactory) -> None:
+    """Makes a vector backend available to memory and knowledge storage.
+
+    Args:
+        name: Name used to select the backend, e.g. ``backend="name"`` or
+            ``CREWAI_VECTOR_BACKEND=name``.
+        factory: Called with the storage directory and the embedding function,
+            returns the :class:`VectorCollection` to store entries in.
+
+    Raises:
+        ValueError: If ``name`` is the built-in ChromaDB backend.
+    """
+    if name == CHROMADB_BACKEND:
+        raise ValueError(f"'{CHROMADB_BACKEND}' is built in and cannot be replaced")
+    _VECTOR_BACKENDS[name] = factory
+
+
+def vector_backends() -> List[str]:
+    """Returns the names of the available vector backends."""
+    return [CHROMADB_BACKEND, *_VECTOR_BACKENDS]
+
+
+def resolve_vector_backend(backend: Optional[str] = None) -> str:
+    """Returns the vector backend to use for memory and knowledge storage.
+
+    Args:
+        backend: Explicit backend name. When None, the ``CREWAI_VECTOR_BACKEND``
+            environment variable is used, defaulting to ChromaDB.
+
+    Raises:
+        ValueError: If the backend was not registered.
+    """
+    backend = backend or os.environ.get("CREWAI_VECTOR_BACKEND") or CHROMADB_BACKEND
+    if backend not in vector_backends():
+        raise ValueError(
+            f"Unknown vector backend '{backend}'. Must be one of: {', '.join(vector_backends())}"
+        )
+    return backend
+
+
+def create_vector_collection(
+    backend: str, path: str, embedding_function: Any
+) -> VectorCollection:
+    """Builds a collection of a registered, non-ChromaDB vector backend."""
+    if backend not in _VECTOR_BACKENDS:
+        raise ValueError(f"No collection factory registered for '{backend}'")
+    return _VECTOR_BACKENDS[backend](path, embedding_function)
+
+
+class LocalVectorIndex:
+    """
+    Exact cosine-similarity index over a memory-mapped embedding matrix.
+
+    Embeddings are appended as normalized float32 rows to a flat file that is
+    memory-mapped for search, while ids, documents and metadata live in a
+    SQLite table next to it. Search is a single matrix product, so several
+    queries are answered in one pass.
+
+    The class mirrors the subset of the ChromaDB collection API used by
+    ``RAGStorage`` and ``KnowledgeStorage`` (``add``, ``upsert``, ``query``,
+    ``delete`` and ``count``); results report cosine distances
+    (``1 - similarity``). It assumes a single writing process per index
+    directory.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        embedding_function: Optional[Callable[[List[str]], Any]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.embedding_function = embedding_function
+        self._lock = threading.RLock()
+        # Bumped whenever rows are renumbered, i.e. on compaction and reset
+        self._generation = 0
+        self._initialize()
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.path / "embeddings.f32"
+
+    @property
+    def _db_file(self) -> Path:
+        return self.path / "index.db"
+
+    def _initialize(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self._db_file) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    row INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL,
+                    document TEXT,
+                    metadata JSON,
+                    deleted INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_id ON entries (id)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.commit()
+
+            dimension = conn.execute(
+                "SELECT value FROM settings WHERE key = 'dimension'"
+            ).fetchone()
+            rows = conn.execute(
+                "SELECT row, id, deleted FROM entries ORDER BY row"
+            ).fetchall()
+
+        self._dimension: Optional[int] = int(dimension[0]) if dimension else None
+        self._ids: List[str] = [row[1] for row in rows]
+        self._alive = np.array([not row[2] for row in rows], dtype=bool)
+        self._row_by_id: Dict[str, int] = {
+            row[1]: row[0] for row in rows if not row[2]
+        }
+        self._metadata_index: Optional[_MetadataIndex] = None
+        self._truncate_orphaned_vectors()
+        self._map_vectors()
+
+    def _truncate_orphaned_vectors(self) -> None:
+        """Drops vectors written without their rows, e.g. by an interrupted upsert."""
+        if self._dimension is None or not self._vectors_file.exists():
+            return
+        expected = len(self._ids) * self._dimension * np.dtype(np.float32).itemsize
+        if self._vectors_file.stat().st_size > expected:
+            with open(self._vectors_file, "r+b") as f:
+                f.truncate(expected)
+
+    def _map_vectors(self) -> None:
+        if self._dimension is None or not self._ids:
+            self._matrix: Optional[np.ndarray] = None
+            return
+        self._matrix = np.memmap(
+            self._vectors_file,
+            dtype=np.float32,
+            mode="r",
+            shape=(len(self._ids), self._dimension),
+        )
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._alive.sum())
+
+    def add(
+        self,
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        ids: Optional[Sequence[str]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None:
+        """Appends documents, replacing any existing entries with the same ids."""
+        self.upsert(documents, metadatas=metadatas, ids=ids, embeddings=embeddings)
+
+    def upsert(
+        self,
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        ids: Optional[Sequence[str]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None:
+        """Inserts documents or replaces existing entries with the same ids."""
+        documents = list(documents)
+        if not documents:
+            return
+        if ids is None:
+            raise ValueError("ids are required")
+        ids = list(ids)
+        metadatas = list(metadatas) if metadatas is not None else [None] * len(ids)
+        if not len(documents) == len(ids) == len(metadatas):
+            raise ValueError("documents, metadatas and ids must have the same length")
+
+        # Keep only the last occurrence of an id repeated within the batch
+        positions = list({doc_id: i for i, doc_id in enumerate(ids)}.values())
+        if len(positions) != len(ids):
+            ids = [ids[i] for i in positions]
+            documents = [documents[i] for i in positions]
+            metadatas = [metadatas[i] for i in positions]
+            if embeddings is not None:
+                embeddings = [embeddings[i] for i in positions]
+
+        vectors = self._normalize(
+            embeddings if embeddings is not None else self._embed(documents)
+        )
+        # Serialize before touching the files, so bad metadata changes nothing
+        serialized = [json.dumps(metadata) for metadata in metadatas]
+
+        with self._lock:
+            dimension = self._dimension or vectors.shape[1]
+            if vectors.shape[1] != dimension:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match "
+                    f"index dimension {dimension}"
+                )
+
+            start = len(self._ids)
+            replaced = [self._row_by_id[i] for i in ids if i in self._row_by_id]
+
+            with open(self._vectors_file, "ab") as f:
+                end_of_vectors = f.tell()
+                f.write(vectors.tobytes())
+
+            try:
+                with sqlite3.connect(self._db_file) as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO settings (key, value) VALUES ('dimension', ?)",
+                        (str(dimension),),
+                    )
+                    if replaced:
+                        conn.executemany(
+                            "UPDATE entries SET deleted = 1 WHERE row = ?",
+                            [(row,) for row in replaced],
+                        )
+                    conn.executemany(
+                        "INSERT INTO entries (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                        [
+                            (start + offset, doc_id, document, metadata)
+                            for offset, (doc_id, document, metadata) in enumerate(
+                                zip(ids, documents, serialized)
+                            )
+                        ],
+                    )
+                    conn.commit()
+            except BaseException:
+                # Drop the vectors again so rows and vectors stay aligned
+                with open(self._vectors_file, "r+b") as f:
+                    f.truncate(end_of_vectors)
+                raise
+
+            self._dimension = dimension
+            self._alive[replaced] = False
+            self._alive = np.concatenate([self._alive, np.ones(len(ids), dtype=bool)])
+            for offset, doc_id in enumerate(ids):
+                self._row_by_id[doc_id] = start + offset
+            self._ids.extend(ids)
+            if self._metadata_index is not None:
+                self._metadata_index.extend(m or {} for m in metadatas)
+            self._map_vectors()
+            self._compact_if_sparse()
+
+    def query(
+        self,
+        query_texts: Optional[Union[str, Sequence[str]]] = None,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        query_embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> Dict[str, List[List[Any]]]:
+        """Returns the ``n_results`` nearest entries for each query.
+
+        Args:
+            query_texts: One or more query strings to embed.
+            n_results: Number of results per query.
+            where: Optional metadata filter using ChromaDB's operators
+                (``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``, ``$lte``,
+                ``$in``, ``$nin``, ``$and``, ``$or``).
+            query_embeddings: Precomputed query embeddings, used instead of
+                ``query_texts``.
+
+        Returns:
+            A dict with ``ids``, ``documents``, ``metadatas`` and ``distances``,
+            each holding one result list per query, nearest first.
+        """
+        if query_embeddings is None:
+            if query_texts is None:
+                raise ValueError("Either query_texts or query_embeddings is required")
+            texts = [query_texts] if isinstance(query_texts, str) else list(query_texts)
+            query_embeddings = self._embed(texts)
+        queries = self._normalize(query_embeddings)
+
+        while True:
+            with self._lock:
+                generation = self._generation
+                mask = self._alive
+                if where:
+                    mask = mask & self._load_metadata_index().mask(where)
+                candidates = np.flatnonzero(mask)
+                matrix = self._matrix
+
+            empty: Dict[str, List[List[Any]]] = {
+                "ids": [],
+                "documents": [],
+                "metadatas": [],
+                "distances": [],
+            }
+            if matrix is None or len(candidates) == 0 or n_results < 1:
+                for key in empty:
+                    empty[key] = [[] for _ in range(len(queries))]
+                return empty
+
+            if len(candidates) == matrix.shape[0]:
+                similarities = queries @ matrix.T
+            else:
+                similarities = queries @ matrix[candidates].T
+
+            k = min(n_results, similarities.shape[1])
+            top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(similarities, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            rows_per_query = [candidates[row].tolist() for row in top]
+            with self._lock:
+                # Compaction renumbers rows, so search the new layout instead
+                if generation != self._generation:
+                    continue
+                entries = self._fetch_entries(
+                    {r for rows in rows_per_query for r in rows}
+                )
+            break
+
+        results = empty
+        for rows, scores in zip(rows_per_query, top_scores):
+            results["ids"].append([entries[r][0] for r in rows])
+            results["documents"].append([entries[r][1] for r in rows])
+            results["metadatas"].append([entries[r][2] for r in rows])
+            results["distances"].append([max(0.0, float(1 - s)) for s in scores])
+        return results
+
+    def delete(self, ids: Sequence[str]) -> None:
+        """Deletes the entries with the given ids, ignoring unknown ones."""
+        with self._lock:
+            rows = [self._row_by_id.pop(i) for i in ids if i in self._row_by_id]
+            if not rows:
+                return
+            with sqlite3.connect(self._db_file) as conn:
+                conn.executemany(
+                    "UPDATE entries SET deleted = 1 WHERE row = ?",
+                    [(row,) for row in rows],
+                )
+                conn.commit()
+            self._alive[rows] = False
+            self._compact_if_sparse()
+
+    def compact(self) -> None:
+        """Rewrites the index without the entries that were deleted or replaced.
+
+        Deleted entries are only marked as such, so their vectors stay in the
+        file until the index is compacted. This happens automatically once
+        they make up most of the index.
+        """
+        with self._lock:
+            live = np.flatnonzero(self._alive)
+            if len(live) == len(self._ids):
+                return
+
+            compacted = self.path / "embeddings.f32.tmp"
+            if self._matrix is not None and len(live):
+                np.ascontiguousarray(self._matrix[live]).tofile(compacted)
+            else:
+                compacted.write_bytes(b"")
+            self._matrix = None
+
+            with sqlite3.connect(self._db_file) as conn:
+                conn.execute("DELETE FROM entries WHERE deleted = 1")
+                # Rows only move down, so renumbering in order never collides
+                conn.executemany(
+                    "UPDATE entries SET row = ? WHERE row = ?",
+                    [(new, int(old)) for new, old in enumerate(live) if new != old],
+                )
+                os.replace(compacted, self._vectors_file)
+                conn.commit()
+            self._generation += 1
+            self._initialize()
+
+    def _compact_if_sparse(self) -> None:
+        deleted = len(self._ids) - int(self._alive.sum())
+        if deleted >= _COMPACT_MIN_DELETED and deleted > len(self._ids) // 2:
+            self.compact()
+
+    def reset(self) -> None:
+        """Deletes every entry and the files backing the index."""
+        with self._lock:
+            self._matrix = None
+            shutil.rmtree(self.path, ignore_errors=True)
+            self._generation += 1
+            self._initialize()
+
+    def _embed(self, texts: List[str]) -> Any:
+        if self.embedding_function is None:
+            raise ValueError("An embedding function is required to embed texts")
+        return self.embedding_function(texts)
+
+    @staticmethod
+    def _normalize(vectors: Any) -> np.ndarray:
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        norms = np.linalg.norm(array, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return np.ascontiguousarray(array / norms)
+
+    def _fetch_entries(self, rows: set) -> Dict[int, tuple]:
+        if not rows:
+            return {}
+        placeholders = ", ".join("?" for _ in rows)
+        with sqlite3.connect(self._db_file) as conn:
+            fetched = conn.execute(
+                f"SELECT row, id, document, metadata FROM entries WHERE row IN ({placeholders})",  # nosec
+                tuple(rows),
+            ).fetchall()
+        return {
+            row: (doc_id, document, json.loads(metadata) if metadata else None)
+            for row, doc_id, document, metadata in fetched
+        }
+
+    def _load_metadata_index(self) -> "_MetadataIndex":
+        if self._metadata_index is None:
+            with sqlite3.connect(self._db_file) as conn:
+                fetched = conn.execute(
+                    "SELECT metadata FROM entries ORDER BY row"
+                ).fetchall()
+            self._metadata_index = _MetadataIndex(
+                json.loads(m[0] or "null") or {} for m in fetched
+            )
+        return self._metadata_index
+
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": lambda value, target: value == target,
+    "$ne": lambda value, target: value != target,
+    "$gt": lambda value, target: value is not None and value > target,
+    "$gte": lambda value, target: value is not None and value >= target,
+    "$lt": lambda value, target: value is not None and value < target,
+    "$lte": lambda value, target: value is not None and value <= target,
+    "$in": lambda value, target: value in target,
+    "$nin": lambda value, target: value not in target,
+}
+
+_RANGE_OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+class _MetadataIndex:
+    """Inverted index over entry metadata for evaluating ``where`` filters.
+
+    Each key maps its distinct values to the rows holding them, so equality
+    and membership filters touch only the matching rows, and range filters
+    on numbers compare a cached float column in one vectorized operation.
+    """
+
+    def __init__(self, metadatas: Any) -> None:
+        self._size = 0
+        self._postings: Dict[str, Dict[Any, List[int]]] = {}
+        # Values such as lists cannot be hashed into the postings
+        self._unhashable: Dict[str, List[tuple]] = {}
+        self._numeric: Dict[str, np.ndarray] = {}
+        self.extend(metadatas)
+
+    def extend(self, metadatas: Any) -> None:
+        for metadata in metadatas:
+            row = self._size
+            self._size += 1
+            for key, value in metadata.items():
+                try:
+                    self._postings.setdefault(key, {}).setdefault(value, []).append(row)
+                except TypeError:
+                    self._unhashable.setdefault(key, []).append((row, value))
+        self._numeric.clear()
+
+    def mask(self, where: Dict[str, Any]) -> np.ndarray:
+        mask = np.ones(self._size, dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self.mask(clause)
+            elif key == "$or":
+                matched = np.zeros(self._size, dtype=bool)
+                for clause in condition:
+                    matched |= self.mask(clause)
+                mask &= matched
+            elif isinstance(condition, dict):
+                for operator, target in condition.items():
+                    mask &= self._condition(key, operator, target)
+            else:
+                mask &= self._condition(key, "$eq", condition)
+        return mask
+
+    def _condition(self, key: str, operator: str, target: Any) -> np.ndarray:
+        if operator not in _OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {operator}")
+        if operator in ("$eq", "$ne"):
+            matched = self._rows_equal(key, [target])
+            return ~matched if operator == "$ne" else matched
+        if operator in ("$in", "$nin"):
+            matched = self._rows_equal(key, target)
+            return ~matched if operator == "$nin" else matched
+
+        if isinstance(target, (int, float)):
+            with np.errstate(invalid="ignore"):
+                return _RANGE_OPERATORS[operator](self._numeric_column(key), target)
+
+        compare = _OPERATORS[operator]
+        matched = np.zeros(self._size, dtype=bool)
+        for value, rows in self._postings.get(key, {}).items():
+            if compare(value, target):
+                matched[rows] = True
+        for row, value in self._unhashable.get(key, []):
+            matched[row] = compare(value, target)
+        return matched
+
+    def _rows_equal(self, key: str, targets: Any) -> np.ndarray:
+        matched = np.zeros(self._size, dtype=bool)
+        postings = self._postings.get(key, {})
+        for target in targets:
+            try:
+                rows = postings.get(target)
+            except TypeError:
+                rows = None
+            if rows:
+                matched[rows] = True
+            if target is None:
+                # A missing key compares equal to None
+                matched |= ~self._rows_with_key(key)
+        for row, value in self._unhashable.get(key, []):
+            matched[row] = any(value == target for target in targets)
+        return matched
+
+    def _rows_with_key(self, key: str) -> np.ndarray:
+        present = np.zeros(self._size, dtype=bool)
+        for rows in self._postings.get(key, {}).values():
+            present[rows] = True
+        for row, _ in self._unhashable.get(key, []):
+            present[row] = True
+        return present
+
+    def _numeric_column(self, key: str) -> np.ndarray:
+        if key not in self._numeric:
+            column = np.full(self._size, np.nan)
+            for value, rows in self._postings.get(key, {}).items():
+                if isinstance(value, (int, float)):
+                    column[rows] = value
+            self._numeric[key] = column
+        return self._numeric[key]
+
+
+register_vector_backend(LOCAL_BACKEND, LocalVectorIndex)
@@ -259,3 +259,143 @@ def test_agent_with_function_calling_fallback():
     assert result == "4"
     assert "Reasoning Plan:" in task.description
     assert "Invalid JSON that will trigger fallback" in task.description
+
+
+@pytest.fixture
+def plan_cache():
+    from crewai.utilities.plan_cache import get_plan_cache
+
+    cache = get_plan_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def _reasoning_agent(**kwargs):
+    return Agent(
+        role="Test Agent",
+        goal="To test the reasoning feature",
+        backstory="I am a test agent created to verify the reasoning feature works correctly.",
+        llm=LLM("gpt-3.5-turbo"),
+        reasoning=True,
+        **kwargs,
+    )
+
+
+def _counting_llm_call(agent, responses, plan_calls):
+    def call(messages, *args, **kwargs):
+        if any("create a detailed plan" in msg.get("content", "") for msg in messages):
+            plan_calls.append(messages)
+            return responses["ready"]
+        return responses["execution"]
+
+    agent.llm.call = call
+
+
+def test_reasoning_plans_are_cached_for_identical_tasks(mock_llm_responses, plan_cache):
+    """Test that a cached reasoning plan is reused instead of reasoning again."""
+    agent = _reasoning_agent(cache_reasoning_plans=True)
+    plan_calls = []
+    _counting_llm_call(agent, mock_llm_responses, plan_calls)
+
+    for _ in range(2):
+        task = Task(
+            description="Simple math task: What's 2+2?",
+            expected_output="The answer should be a number.",
+            agent=agent,
+        )
+        agent.execute_task(task)
+        assert "Reasoning Plan:" in task.description
+
+    other_task = Task(
+        description="Simple math task: What's 3+3?",
+        expected_output="The answer should be a number.",
+        agent=agent,
+    )
+    agent.execute_task(other_task)
+
+    assert len(plan_calls) == 2
+
+
+def test_reasoning_plans_are_not_cached_by_default(mock_llm_responses, plan_cache):
+    """Test that agents reason before every task unless caching is enabled."""
+    agent = _reasoning_agent()
+    plan_calls = []
+    _counting_llm_call(agent, mock_llm_responses, plan_calls)
+
+    for _ in range(2):
+        agent.execute_task(
+            Task(
+                description="Simple math task: What's 2+2?",
+                expected_output="The answer should be a number.",
+                agent=agent,
+            )
+        )
+
+    assert len(plan_calls) == 2
+
+
+def test_crew_reasons_about_tasks_concurrently_up_front(mock_llm_responses):
+    """Test that parallel_reasoning plans every task before the first one runs."""
+    import threading
+
+    from crewai import Crew
+
+    barrier = threading.Barrier(2, timeout=5)
+    events = []
+
+    def call(messages, *args, **kwargs):
+        if any("create a detailed plan" in msg.get("content", "") for msg in messages):
+            barrier.wait()
+            events.append("plan")
+            return mock_llm_responses["ready"]
+        events.append("execute")
+        return f"Final Answer: {mock_llm_responses['execution']}"
+
+    agents = [_reasoning_agent(), _reasoning_agent()]
+    tasks = [
+        Task(
+            description=f"Simple math task: What's {n}+{n}?",
+            expected_output="The answer should be a number.",
+            agent=agent,
+        )
+        for n, agent in zip((2, 3), agents)
+    ]
+    for agent in agents:
+        agent.llm.call = call
+
+    Crew(agents=agents, tasks=tasks, parallel_reasoning=True).kickoff()
+
+    assert events == ["plan", "plan", "execute", "execute"]
+    assert all("Reasoning Plan:" in task.description for task in tasks)
+
+
+def test_crew_drops_plans_left_over_from_an_earlier_run(mock_llm_responses):
+    """Test that a plan made up front but never used is not reused by a later kickoff."""
+    from crewai import Crew
+    from crewai.utilities.reasoning_handler import AgentReasoningOutput, ReasoningPlan
+
+    agent = _reasoning_agent()
+    plan_calls = []
+
+    def call(messages, *args, **kwargs):
+        if any("create a detailed plan" in msg.get("content", "") for msg in messages):
+            plan_calls.append(messages)
+            return mock_llm_responses["ready"]
+        return f"Final Answer: {mock_llm_responses['execution']}"
+
+    agent.llm.call = call
+    task = Task(
+        description="Simple math task: What's 2+2?",
+        expected_output="The answer should be a number.",
+        agent=agent,
+    )
+    task._reasoning = (
+        agent,
+        AgentReasoningOutput(plan=ReasoningPlan(plan="Stale plan", ready=True)),
+    )
+
+    Crew(agents=[agent], tasks=[task]).kickoff()
+
+    assert len(plan_calls) == 1
+    assert "Stale plan" not in task.description
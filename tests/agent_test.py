@@ -18,6 +18,7 @@ from crewai.tools import tool
 from crewai.tools.tool_calling import InstructorToolCalling
 from crewai.tools.tool_usage import ToolUsage
 from crewai.utilities import RPMController
+from crewai.utilities.agent_utils import parse_tools
 from crewai.utilities.errors import AgentRepositoryError
 from crewai.utilities.events import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import ToolUsageFinishedEvent
@@ -2350,3 +2351,72 @@ def test_agent_from_repository_without_org_set(
         "No organization currently set. We recommend setting one before using: `crewai org switch <org_id>` command.",
         style="yellow",
     )
+
+
+def test_agent_reuses_executor_setup_for_unchanged_toolset():
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+    )
+    first_task = Task(description="first", expected_output="out", agent=agent)
+    second_task = Task(description="second", expected_output="out", agent=agent)
+
+    agent.create_agent_executor(task=first_task)
+    first_executor = agent.agent_executor
+    first_executor.messages.append({"role": "user", "content": "in progress"})
+    first_executor.iterations = 3
+
+    with patch("crewai.agent.parse_tools", wraps=parse_tools) as parse_tools_spy:
+        agent.create_agent_executor(task=second_task)
+
+    parse_tools_spy.assert_not_called()
+    second_executor = agent.agent_executor
+    assert second_executor is not first_executor
+    assert second_executor.tools is first_executor.tools
+    assert second_executor.prompt is first_executor.prompt
+    assert second_executor.task is second_task
+    assert second_executor.messages == []
+    # The first executor may still be running its task
+    assert first_executor.task is first_task
+    assert first_executor.iterations == 3
+    assert len(first_executor.messages) == 1
+
+
+def test_agent_rebuilds_executor_when_toolset_or_prompt_changes():
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+
+    agent.create_agent_executor()
+    no_tools_executor = agent.agent_executor
+
+    agent.create_agent_executor(tools=[multiplier])
+    tools_executor = agent.agent_executor
+    assert tools_executor.tools is not no_tools_executor.tools
+    assert "multiplier" in tools_executor.tools_names
+
+    agent.goal = "a new goal"
+    agent.create_agent_executor(tools=[multiplier])
+    assert agent.agent_executor.prompt is not tools_executor.prompt
+    assert "a new goal" in agent.agent_executor.prompt["prompt"]
+
+
+def test_agent_reuses_delegation_tools_for_same_coworkers():
+    agent = Agent(role="manager", goal="test goal", backstory="test backstory")
+    coworker = Agent(role="coworker", goal="test goal", backstory="test backstory")
+
+    tools = agent.get_delegation_tools([coworker])
+    assert agent.get_delegation_tools([coworker]) is tools
+
+    coworker.role = "renamed coworker"
+    assert agent.get_delegation_tools([coworker]) is not tools
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from crewai.agents.crew_agent_executor import (
@@ -5,7 +7,7 @@ from crewai.agents.crew_agent_executor import (
     AgentFinish,
     OutputParserException,
 )
-from crewai.agents.parser import CrewAgentParser
+from crewai.agents.parser import CrewAgentParser, StreamingCrewAgentParser
 
 
 @pytest.fixture
@@ -365,6 +367,53 @@ def test_integration_valid_and_invalid(parser):
     assert isinstance(results[3], OutputParserException)
 
 
+def _feed_in_chunks(text, size):
+    parser = StreamingCrewAgentParser()
+    for start in range(0, len(text), size):
+        result = parser.feed(text[start : start + size])
+        if result is not None:
+            return result, start
+    return None, None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_streaming_parser_stops_after_complete_action_input(chunk_size):
+    text = (
+        "Thought: I need to search\n"
+        "Action: search\n"
+        'Action Input: {"query": "temperature {in} SF", "nested": {"a": [1, "]"]}}\n'
+        "Observation: it is hot"
+    )
+
+    result, _ = _feed_in_chunks(text, chunk_size)
+
+    assert result == text.split("\nObservation")[0]
+    action = CrewAgentParser().parse(result)
+    assert isinstance(action, AgentAction)
+    assert action.tool == "search"
+    assert json.loads(action.tool_input) == {
+        "query": "temperature {in} SF",
+        "nested": {"a": [1, "]"]},
+    }
+
+
+def test_streaming_parser_handles_escaped_quotes():
+    text = 'Action: echo\nAction Input: {"text": "say \\"}\\" now"} trailing'
+
+    result, _ = _feed_in_chunks(text, 2)
+
+    assert result == 'Action: echo\nAction Input: {"text": "say \\"}\\" now"}'
+
+
+def test_streaming_parser_does_not_stop_early():
+    final_answer = "Thought: done\nFinal Answer: {\"answer\": 42}\nMore text"
+    plain_input = "Action: search\nAction Input: temperature in SF\nMore text"
+    unfinished = 'Action: search\nAction Input: {"query": "temp'
+
+    for text in (final_answer, plain_input, unfinished):
+        assert _feed_in_chunks(text, 4) == (None, None)
+
+
 class MockAgent:
     def increment_formatting_errors(self):
         pass
@@ -3,6 +3,7 @@
 import hashlib
 import json
 from concurrent.futures import Future
+from contextlib import contextmanager
 from unittest import mock
 from unittest.mock import ANY, MagicMock, patch
 from collections import defaultdict
@@ -3258,6 +3259,22 @@ def test_replay_task_with_context():
         db_handler.reset()
 
 
+@contextmanager
+def stored_task_outputs(crew, records):
+    """Store ``records`` as the task outputs of a new kickoff of ``crew``."""
+    handler = crew._task_output_handler
+    handler.start_kickoff()
+    tasks = {str(task.id): task for task in crew.tasks}
+    for index, record in enumerate(records):
+        handler.add(
+            tasks[record["task_id"]], record["output"], index, inputs=record["inputs"]
+        )
+    try:
+        yield
+    finally:
+        handler.reset()
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_replay_with_context():
     agent = Agent(role="test_agent", backstory="Test Description", goal="Test Goal")
@@ -3280,9 +3297,9 @@ def test_replay_with_context():
 
     crew = Crew(agents=[agent], tasks=[task1, task2], process=Process.sequential)
 
-    with patch(
-        "crewai.utilities.task_output_storage_handler.TaskOutputStorageHandler.load",
-        return_value=[
+    with stored_task_outputs(
+        crew,
+        [
             {
                 "task_id": str(task1.id),
                 "output": {
@@ -3362,9 +3379,9 @@ def test_replay_with_invalid_task_id():
 
     crew = Crew(agents=[agent], tasks=[task1, task2], process=Process.sequential)
 
-    with patch(
-        "crewai.utilities.task_output_storage_handler.TaskOutputStorageHandler.load",
-        return_value=[
+    with stored_task_outputs(
+        crew,
+        [
             {
                 "task_id": str(task1.id),
                 "output": {
@@ -3425,9 +3442,9 @@ def test_replay_interpolates_inputs_properly(mock_interpolate_inputs):
     crew = Crew(agents=[agent], tasks=[task1, task2], process=Process.sequential)
     crew.kickoff(inputs={"name": "John"})
 
-    with patch(
-        "crewai.utilities.task_output_storage_handler.TaskOutputStorageHandler.load",
-        return_value=[
+    with stored_task_outputs(
+        crew,
+        [
             {
                 "task_id": str(task1.id),
                 "output": {
@@ -3480,9 +3497,9 @@ def test_replay_setup_context():
     )
     task1.output = context_output
     crew = Crew(agents=[agent], tasks=[task1, task2], process=Process.sequential)
-    with patch(
-        "crewai.utilities.task_output_storage_handler.TaskOutputStorageHandler.load",
-        return_value=[
+    with stored_task_outputs(
+        crew,
+        [
             {
                 "task_id": str(task1.id),
                 "output": {
@@ -4461,6 +4478,32 @@ def test_crew_kickoff_for_each_works_with_manager_agent_copy():
     assert crew_copy.manager_agent.goal == crew.manager_agent.goal
 
 
+def test_crew_memory_write_behind_config():
+    from crewai.memory.storage.write_behind_storage import WriteBehindStorage
+
+    agent = Agent(role="Test Agent", goal="Test Goal", backstory="Test Backstory")
+    task = Task(description="Test Task", expected_output="Test Output", agent=agent)
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        memory=True,
+        memory_config={"write_behind": {"batch_size": 8, "flush_interval": 0.5}},
+    )
+
+    for memory in (
+        crew._short_term_memory,
+        crew._entity_memory,
+        crew._long_term_memory,
+    ):
+        assert isinstance(memory.storage, WriteBehindStorage)
+        assert memory.storage.batch_size == 8
+        assert memory.storage.flush_interval == 0.5
+
+    with patch.object(WriteBehindStorage, "flush") as flush:
+        crew.flush_memories()
+    assert flush.call_count == 3
+
+
 def test_crew_copy_with_memory():
     """Test that copying a crew with memory enabled does not raise validation errors and copies memory correctly."""
     agent = Agent(role="Test Agent", goal="Test Goal", backstory="Test Backstory")
@@ -0,0 +1,124 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from crewai.evaluation import TraceStore
+from crewai.evaluation.evaluation_listener import EvaluationTraceCallback
+
+
+def _trace(agent_id="agent-1", task_id="task-1", kickoff_id="kickoff-1"):
+    return {
+        "agent_id": agent_id,
+        "task_id": task_id,
+        "kickoff_id": kickoff_id,
+        "tool_uses": [],
+        "llm_calls": [],
+    }
+
+
+def test_evicts_least_recently_used_trace():
+    store = TraceStore(max_traces=2)
+    store["a"] = _trace(task_id="task-a")
+    store["b"] = _trace(task_id="task-b")
+
+    assert store.get("a") is not None
+    store["c"] = _trace(task_id="task-c")
+
+    assert len(store) == 2
+    assert "a" in store
+    assert "b" not in store
+    assert store.get("b") is None
+
+
+def test_evicts_expired_traces():
+    store = TraceStore(max_traces=None, ttl_seconds=0.05)
+    store["a"] = _trace()
+
+    time.sleep(0.1)
+
+    assert "a" not in store
+    assert store.find(agent_id="agent-1") == []
+
+
+def test_rewriting_a_trace_restarts_its_ttl():
+    store = TraceStore(max_traces=None, ttl_seconds=0.2)
+    store["a"] = _trace()
+    store["b"] = _trace()
+    time.sleep(0.15)
+    store["a"] = _trace()
+
+    time.sleep(0.1)
+
+    assert "a" in store
+    assert "b" not in store
+
+
+def test_find_uses_indexes():
+    store = TraceStore()
+    store["a"] = _trace(agent_id="agent-1", task_id="task-1", kickoff_id="k1")
+    store["b"] = _trace(agent_id="agent-1", task_id="task-2", kickoff_id="k2")
+    store["c"] = _trace(agent_id="agent-2", task_id="task-1", kickoff_id="k2")
+
+    assert [t["task_id"] for t in store.find(agent_id="agent-1")] == ["task-1", "task-2"]
+    assert [t["agent_id"] for t in store.find(kickoff_id="k2")] == ["agent-1", "agent-2"]
+    assert store.find(agent_id="agent-2", task_id="task-2") == []
+    assert len(store.find()) == 3
+
+
+def test_spills_evicted_traces_to_sqlite(tmp_path):
+    store = TraceStore(max_traces=1, spill_path=str(tmp_path / "traces.db"))
+    store["a"] = _trace(task_id="task-a", kickoff_id="k1")
+    store["b"] = _trace(task_id="task-b", kickoff_id="k1")
+
+    assert len(store) == 1
+    assert "a" in store
+    spilled = store.get("a")
+    assert spilled is not None
+    assert spilled["task_id"] == "task-a"
+
+    assert [t["task_id"] for t in store.find(kickoff_id="k1")] == ["task-b", "task-a"]
+
+    store.clear()
+    assert store.get("a") is None
+    assert store.find() == []
+
+
+def test_spilled_traces_are_restored_for_updates(tmp_path):
+    store = TraceStore(max_traces=1, spill_path=str(tmp_path / "traces.db"))
+    store["a"] = _trace(task_id="task-a")
+    store["b"] = _trace(task_id="task-b")
+
+    store["a"]["tool_uses"].append({"tool": "search"})
+
+    assert store.get("a")["tool_uses"] == [{"tool": "search"}]
+    assert store.get("b")["task_id"] == "task-b"
+    assert len(store.find()) == 2
+
+
+def test_listener_keeps_a_trace_per_kickoff(tmp_path):
+    # Bypass the singleton so the test does not change the shared listener
+    listener = object.__new__(EvaluationTraceCallback)
+    listener.traces = TraceStore(max_traces=1, spill_path=str(tmp_path / "traces.db"))
+    listener.current_agent_id = listener.current_task_id = None
+    agent = SimpleNamespace(id="agent-1")
+    task = SimpleNamespace(id="task-1")
+
+    for kickoff_id, answer in (("k1", "first"), ("k2", "second")):
+        listener.current_kickoff_id = kickoff_id
+        listener.on_agent_start(agent, task)
+        listener.on_tool_use("search", {"query": answer}, answer)
+        listener.on_agent_finish(agent, task, answer)
+
+    assert listener.get_trace("agent-1", "task-1")["final_output"] == "second"
+    first = listener.get_trace("agent-1", "task-1", kickoff_id="k1")
+    assert first["final_output"] == "first"
+    assert first["tool_uses"][0]["result"] == "first"
+    assert len(listener.get_traces(agent_id="agent-1")) == 2
+
+
+def test_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        TraceStore(max_traces=0)
+    with pytest.raises(ValueError):
+        TraceStore(ttl_seconds=0)
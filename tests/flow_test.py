@@ -755,3 +755,149 @@ def test_multiple_routers_from_same_trigger():
     assert execution_order.index("anemia_analysis") > execution_order.index(
         "anemia_router"
     )
+
+
+def test_flow_compiles_trigger_index():
+    """Test that FlowMeta indexes listeners and routers by trigger method."""
+
+    class IndexedFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @router(begin)
+        def route(self):
+            return "next"
+
+        @listen(or_(begin, "next"))
+        def handle(self):
+            pass
+
+        @listen(and_(begin, handle))
+        def join(self):
+            pass
+
+    assert IndexedFlow._router_triggers == {"begin": ["route"]}
+    assert IndexedFlow._listener_triggers == {
+        "begin": ["handle", "join"],
+        "next": ["handle"],
+        "handle": ["join"],
+    }
+
+
+def test_flow_max_listener_concurrency():
+    """Test that listener fan-out respects max_listener_concurrency."""
+    running = 0
+    peak = 0
+
+    class FanOutFlow(Flow):
+        max_listener_concurrency = 2
+
+        @start()
+        def begin(self):
+            pass
+
+        async def _work(self):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        @listen(begin)
+        async def a(self):
+            await self._work()
+
+        @listen(begin)
+        async def b(self):
+            await self._work()
+
+        @listen(begin)
+        async def c(self):
+            await self._work()
+
+        @listen(begin)
+        async def d(self):
+            await self._work()
+
+    FanOutFlow().kickoff()
+
+    assert peak == 2
+
+
+def test_flow_method_timeout():
+    """Test that per-method and flow-wide timeouts fail slow methods."""
+
+    class SlowListenerFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin, timeout=0.05)
+        async def slow(self):
+            await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        SlowListenerFlow().kickoff()
+
+    class SlowSyncFlow(Flow):
+        method_timeout = 0.05
+
+        @start()
+        def begin(self):
+            import time
+
+            time.sleep(0.5)
+
+    with pytest.raises(asyncio.TimeoutError):
+        SlowSyncFlow().kickoff()
+
+
+class _ProcessState(BaseModel):
+    total: int = 0
+    pid: int = 0
+    untouched: str = "keep"
+
+
+class _ProcessFlow(Flow[_ProcessState]):
+    @start()
+    def begin(self):
+        return 10
+
+    @listen(begin, run_in_process=True)
+    def crunch(self, n):
+        import os
+
+        self.state.total = sum(range(n))
+        self.state.pid = os.getpid()
+        return "crunched"
+
+    @listen(crunch)
+    def finish(self, result):
+        return f"{result}:{self.state.total}"
+
+
+class _ProcessDictFlow(Flow):
+    @start(run_in_process=True)
+    async def begin(self):
+        self.state["value"] = 42
+        self.state.pop("drop", None)
+        return "done"
+
+
+def test_flow_method_runs_in_process():
+    """Test that run_in_process methods execute in a worker and merge state."""
+    import os
+
+    flow = _ProcessFlow()
+    assert flow.kickoff() == "crunched:45"
+    assert flow.state.total == 45
+    assert flow.state.pid != os.getpid()
+    assert flow.state.untouched == "keep"
+    assert flow._process_pool is None
+
+    dict_flow = _ProcessDictFlow()
+    assert dict_flow.kickoff(inputs={"drop": True}) == "done"
+    assert dict_flow.state["value"] == 42
+    assert "drop" not in dict_flow.state
+    assert "id" in dict_flow.state
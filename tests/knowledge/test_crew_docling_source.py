@@ -0,0 +1,106 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("docling")
+
+from docling.datamodel.base_models import InputFormat  # noqa: E402
+from docling.document_converter import DocumentConverter  # noqa: E402
+
+from crewai.knowledge.source import crew_docling_source  # noqa: E402
+from crewai.knowledge.source.crew_docling_source import CrewDoclingSource  # noqa: E402
+
+
+def _crashing_convert(source, allowed_formats, format_options, config_key):
+    if os.path.basename(source).startswith("crash"):
+        os._exit(1)
+    return crew_docling_source.DocumentConverter(
+        allowed_formats=allowed_formats
+    ).convert(source).document.model_dump_json()
+
+
+@pytest.fixture
+def documents(tmp_path):
+    paths = []
+    for name in ("first", "second"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(f"# {name.title()}\n\nThe {name} document.\n")
+        paths.append(path)
+    return paths
+
+
+def _source(paths, tmp_path, **kwargs):
+    source = CrewDoclingSource(
+        file_paths=paths, cache_dir=tmp_path / "cache", **kwargs
+    )
+    source.storage = MagicMock()
+    return source
+
+
+def test_chunks_are_saved_per_document(documents, tmp_path):
+    source = _source(documents, tmp_path)
+    source.add()
+
+    assert source.storage.save.call_count == 2
+    assert source.content == []
+    assert any("first document" in chunk for chunk in source.chunks)
+    assert any("second document" in chunk for chunk in source.chunks)
+
+
+def test_conversions_are_cached_by_file_content(documents, tmp_path):
+    _source(documents, tmp_path).add()
+
+    source = _source(documents, tmp_path)
+    with patch.object(source.document_converter, "convert") as convert:
+        source.add()
+
+    convert.assert_not_called()
+    assert source.storage.save.call_count == 2
+
+
+def test_failed_documents_are_skipped(documents, tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    source = _source([broken, *documents], tmp_path)
+    source.add()
+
+    assert source.failed_file_paths == [broken]
+    assert source.storage.save.call_count == 2
+
+
+def test_documents_are_converted_in_worker_processes(documents, tmp_path):
+    source = _source(documents, tmp_path, max_workers=2)
+    with patch.object(source.document_converter, "convert") as convert:
+        source.add()
+
+    convert.assert_not_called()
+    assert source.storage.save.call_count == 2
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+
+def test_a_crashing_document_only_fails_itself(documents, tmp_path, monkeypatch):
+    monkeypatch.setattr(crew_docling_source, "_convert_in_worker", _crashing_convert)
+    crash = tmp_path / "crash.md"
+    crash.write_text("# Crash\n")
+    third = tmp_path / "third.md"
+    third.write_text("# Third\n\nThe third document.\n")
+    source = _source([crash, *documents, third], tmp_path, max_workers=2)
+    source.add()
+
+    assert source.failed_file_paths == [crash]
+    assert source.storage.save.call_count == 3
+
+
+def test_cache_is_keyed_by_converter_config(documents, tmp_path):
+    default = _source(documents, tmp_path)
+    markdown_only = _source(
+        documents,
+        tmp_path,
+        document_converter=DocumentConverter(allowed_formats=[InputFormat.MD]),
+    )
+
+    assert default._cache_path(documents[0]) != markdown_only._cache_path(documents[0])
+    assert default._cache_path(documents[0]) == _source(
+        documents, tmp_path
+    )._cache_path(documents[0])
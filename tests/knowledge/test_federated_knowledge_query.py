@@ -0,0 +1,61 @@
+import threading
+from unittest.mock import MagicMock
+
+from crewai.knowledge.knowledge import Knowledge, query_knowledge_sources
+
+
+def _knowledge(*results):
+    knowledge = MagicMock(spec=Knowledge)
+    knowledge.query.return_value = [
+        {"id": context, "context": context, "score": score, "metadata": {}}
+        for context, score in results
+    ]
+    return knowledge
+
+
+def test_results_are_merged_into_a_global_top_k():
+    agent = _knowledge(("agent a", 0.4), ("agent b", 0.7))
+    crew = _knowledge(("crew a", 0.5), ("crew b", 0.9))
+
+    results = query_knowledge_sources(
+        {"agent": agent, "crew": crew}, ["query"], results_limit=3
+    )
+
+    assert [(r["context"], r["knowledge"]) for r in results] == [
+        ("agent a", "agent"),
+        ("crew a", "crew"),
+        ("agent b", "agent"),
+    ]
+    agent.query.assert_called_once_with(
+        ["query"], results_limit=3, score_threshold=0.35
+    )
+
+
+def test_duplicate_chunks_are_kept_once():
+    agent = _knowledge(("shared", 0.6), ("agent only", 0.8))
+    crew = _knowledge(("shared", 0.4))
+    docs = _knowledge(("shared", 0.5), ("docs only", 0.7))
+
+    results = query_knowledge_sources(
+        {"agent": agent, "crew": crew, "docs": docs}, ["query"], results_limit=5
+    )
+
+    assert [(r["context"], r["knowledge"]) for r in results] == [
+        ("shared", "crew"),
+        ("docs only", "docs"),
+        ("agent only", "agent"),
+    ]
+
+
+def test_knowledge_bases_are_searched_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(*args, **kwargs):
+        barrier.wait()
+        return []
+
+    agent, crew = _knowledge(), _knowledge()
+    agent.query.side_effect = search
+    crew.query.side_effect = search
+
+    assert query_knowledge_sources({"agent": agent, "crew": crew}, ["query"]) == []
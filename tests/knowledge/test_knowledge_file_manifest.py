@@ -0,0 +1,182 @@
+import os
+from pathlib import Path
+from typing import Dict
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.embedding_configurator import embedding_namespace
+
+
+class CharacterEmbedder(EmbeddingFunction):
+    def __init__(self):
+        pass
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [
+            np.array([text.count(c) for c in "abcdefgh"] + [0.01], dtype=np.float32)
+            for text in input
+        ]
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    for module in ("knowledge_storage", "knowledge_file_manifest_storage"):
+        monkeypatch.setattr(
+            f"crewai.knowledge.storage.{module}.db_storage_path",
+            lambda: str(tmp_path / "db"),
+        )
+    (tmp_path / "db").mkdir()
+    storage = KnowledgeStorage(
+        embedder={"provider": "custom", "config": {"embedder": CharacterEmbedder()}},
+        collection_name="test",
+        backend="local",
+    )
+    storage.initialize_knowledge_storage()
+    return storage
+
+
+def _write(path: Path, text: str, mtime: int) -> Path:
+    path.write_text(text)
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def _add(storage, *paths):
+    source = TextFileKnowledgeSource(file_paths=list(paths), storage=storage)
+    source.add()
+    return source
+
+
+def test_unchanged_files_are_not_loaded_again(storage, tmp_path):
+    first = _write(tmp_path / "first.txt", "abc", 1_000)
+    second = _write(tmp_path / "second.txt", "def", 1_000)
+    _add(storage, first, second)
+    assert storage.collection.count() == 2
+
+    with (
+        patch.object(
+            TextFileKnowledgeSource, "load_content", autospec=True
+        ) as load_content,
+        patch.object(KnowledgeStorage, "save") as save,
+    ):
+        source = _add(storage, first, second)
+
+    load_content.assert_not_called()
+    save.assert_not_called()
+    assert source.content == {}
+
+
+def test_only_changed_files_are_reloaded_and_their_old_chunks_removed(
+    storage, tmp_path
+):
+    first = _write(tmp_path / "first.txt", "abc", 1_000)
+    second = _write(tmp_path / "second.txt", "def", 1_000)
+    _add(storage, first, second)
+
+    _write(second, "ggh", 2_000)
+    source = _add(storage, first, second)
+
+    assert list(source.content) == [second]
+    assert source.chunks == ["ggh"]
+    results = storage.search(["abcdefgh"], limit=10, score_threshold=0)
+    assert sorted(result["context"] for result in results) == ["abc", "ggh"]
+
+
+def test_touched_file_with_same_content_is_not_reloaded(storage, tmp_path):
+    path = _write(tmp_path / "file.txt", "abc", 1_000)
+    _add(storage, path)
+
+    _write(path, "abc", 2_000)
+    assert _add(storage, path).content == {}
+
+    records = storage.load_file_records()
+    assert records[str(path.resolve())]["mtime_ns"] == 2_000
+
+
+def test_changing_chunk_settings_reingests_files(storage, tmp_path):
+    path = _write(tmp_path / "file.txt", "abcdef", 1_000)
+    _add(storage, path)
+
+    source = TextFileKnowledgeSource(
+        file_paths=[path], storage=storage, chunk_size=4, chunk_overlap=1
+    )
+    source.add()
+
+    assert source.chunks == ["abcd", "def"]
+    assert storage.collection.count() == 2
+
+
+class OtherCharacterEmbedder(CharacterEmbedder):
+    pass
+
+
+def test_changing_the_embedder_reingests_files(storage, tmp_path):
+    path = _write(tmp_path / "file.txt", "abcdef", 1_000)
+    _add(storage, path)
+
+    storage._set_embedder_config(
+        {"provider": "custom", "config": {"embedder": OtherCharacterEmbedder()}}
+    )
+    source = _add(storage, path)
+
+    assert source.chunks == ["abcdef"]
+    assert storage.collection.count() == 1
+
+
+def test_embedding_namespace_ignores_credentials():
+    base = {"provider": "openai", "config": {"model": "text-embedding-3-large"}}
+    keyed = {
+        "provider": "openai",
+        "config": {"model": "text-embedding-3-large", "api_key": "secret"},
+    }
+
+    assert embedding_namespace(base) == embedding_namespace(keyed)
+    assert embedding_namespace(base) != embedding_namespace(None)
+    assert "secret" not in embedding_namespace(keyed)
+
+
+def test_deleted_files_are_purged_when_sources_are_added(storage, tmp_path):
+    kept = _write(tmp_path / "kept.txt", "abc", 1_000)
+    deleted = _write(tmp_path / "deleted.txt", "def", 1_000)
+    _add(storage, kept, deleted)
+    deleted.unlink()
+
+    knowledge = Knowledge(
+        collection_name="test",
+        sources=[TextFileKnowledgeSource(file_paths=[kept])],
+        storage=storage,
+    )
+    knowledge.add_sources()
+
+    results = storage.search(["abcdef"], limit=10, score_threshold=0)
+    assert [result["context"] for result in results] == ["abc"]
+    assert list(storage.load_file_records()) == [str(kept.resolve())]
+
+
+def test_reset_clears_the_manifest(storage, tmp_path):
+    path = _write(tmp_path / "file.txt", "abc", 1_000)
+    _add(storage, path)
+
+    storage.reset()
+
+    assert _add(storage, path).chunks == ["abc"]
+
+
+def test_sources_with_their_own_add_load_content_up_front(tmp_path):
+    path = _write(tmp_path / "file.txt", "abc", 1_000)
+
+    class UppercaseSource(BaseFileKnowledgeSource):
+        def load_content(self) -> Dict[Path, str]:
+            return {p: p.read_text().upper() for p in self.safe_file_paths}
+
+        def add(self) -> None:
+            self.chunks.extend(self.content.values())
+
+    assert UppercaseSource(file_paths=[path]).content == {path: "ABC"}
@@ -0,0 +1,119 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.knowledge.source import json_knowledge_source
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+
+
+def _saved(storage):
+    documents, metadatas = [], []
+    for call in storage.save.call_args_list:
+        documents.extend(call.args[0])
+        metadatas.extend(call.args[1])
+    return documents, metadatas
+
+
+def _add(source):
+    source.storage = MagicMock()
+    source.add()
+    return source.storage
+
+
+def test_csv_rows_are_packed_into_record_aligned_chunks(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("name,role\nAda,engineer\nGrace,admiral\nAlan,scientist\n")
+    source = CSVKnowledgeSource(file_paths=[path], chunk_size=30)
+    storage = _add(source)
+
+    documents, metadatas = _saved(storage)
+    assert documents == [
+        "name role\nAda engineer\n",
+        "Grace admiral\nAlan scientist\n",
+    ]
+    assert metadatas == [
+        {"source": str(path), "record_start": 0, "record_end": 1},
+        {"source": str(path), "record_start": 2, "record_end": 3},
+    ]
+    assert source.content == {}
+
+
+def test_records_larger_than_a_chunk_are_split_on_their_own(tmp_path):
+    path = tmp_path / "notes.csv"
+    path.write_text("short\n" + "x" * 25 + "\nend\n")
+    storage = _add(
+        CSVKnowledgeSource(file_paths=[path], chunk_size=10, chunk_overlap=0)
+    )
+
+    documents, metadatas = _saved(storage)
+    assert documents == ["short\n", "x" * 10, "x" * 10, "x" * 5 + "\n", "end\n"]
+    assert [(m["record_start"], m["record_end"]) for m in metadatas] == [
+        (0, 0),
+        (1, 1),
+        (1, 1),
+        (1, 1),
+        (2, 2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "file_name, text",
+    [
+        ("records.json", json.dumps([{"name": "Ada"}, {"name": "Grace"}, [1, 2]])),
+        ("records.jsonl", '{"name": "Ada"}\n{"name": "Grace"}\n[1, 2]\n'),
+    ],
+)
+def test_json_arrays_and_json_lines_are_streamed_per_record(
+    tmp_path, monkeypatch, file_name, text
+):
+    monkeypatch.setattr(json_knowledge_source, "_READ_SIZE", 4)
+    path = tmp_path / file_name
+    path.write_text(text)
+    with patch.object(JSONKnowledgeSource, "load_content") as load_content:
+        storage = _add(JSONKnowledgeSource(file_paths=[path], chunk_size=14))
+
+    load_content.assert_not_called()
+    documents, metadatas = _saved(storage)
+    assert documents == ["name: Ada\n\n", "name: Grace\n\n", "- 1\n- 2\n\n"]
+    assert [m["record_start"] for m in metadatas] == [0, 1, 2]
+
+
+def test_empty_json_array_has_no_records(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text("  [ ]  \n")
+    storage = _add(JSONKnowledgeSource(file_paths=[path]))
+
+    assert _saved(storage) == ([], [])
+
+
+def test_json_object_is_a_single_record(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"team": {"lead": "Ada"}, "size": 3}))
+    source = JSONKnowledgeSource(file_paths=[path])
+    storage = _add(source)
+
+    documents, _ = _saved(storage)
+    assert documents == ["team:   lead: Ada\n\nsize: 3\n\n"]
+    assert source.load_content() == {path: "team:   lead: Ada\n\nsize: 3\n"}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[{"name": "Ada"}, ',
+        "[1,,,2]",
+        "[,1]",
+        "[1, 2,]",
+        "[1 2]",
+        "[1, 2]\n[3, 4]\n",
+    ],
+)
+def test_malformed_json_array_raises(tmp_path, monkeypatch, text):
+    monkeypatch.setattr(json_knowledge_source, "_READ_SIZE", 4)
+    path = tmp_path / "broken.json"
+    path.write_text(text)
+
+    with pytest.raises(json.JSONDecodeError):
+        _add(JSONKnowledgeSource(file_paths=[path]))
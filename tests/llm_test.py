@@ -6,7 +6,9 @@ import pytest
 from pydantic import BaseModel
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.agents.parser import StreamingCrewAgentParser
 from crewai.llm import CONTEXT_WINDOW_USAGE_RATIO, LLM
+from crewai.types.usage_metrics import UsageMetrics
 from crewai.utilities.events import (
     LLMCallCompletedEvent,
     LLMStreamChunkEvent,
@@ -495,6 +497,96 @@ def test_anthropic_message_formatting(anthropic_llm, system_message, user_messag
     assert formatted[0] == system_message
 
 
+def test_prompt_caching_adds_anthropic_cache_breakpoints():
+    llm = LLM(model="anthropic/claude-3-5-sonnet-20241022", prompt_caching=True)
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": "Task prompt"},
+        {"role": "assistant", "content": "Thought: I should search"},
+        {"role": "user", "content": "Observation: found it"},
+    ]
+
+    params = llm._prepare_completion_params(messages)
+    formatted = params["messages"]
+
+    assert formatted[0] == {"role": "user", "content": "."}
+    cached = [
+        msg["content"][-1]["text"]
+        for msg in formatted
+        if isinstance(msg["content"], list)
+        and msg["content"][-1].get("cache_control") == {"type": "ephemeral"}
+    ]
+    assert cached == ["You are a researcher.", "Task prompt", "Observation: found it"]
+    assert formatted[3] == {"role": "assistant", "content": "Thought: I should search"}
+    # The caller's messages are left untouched
+    assert messages[0] == {"role": "system", "content": "You are a researcher."}
+
+
+def test_prompt_caching_leaves_other_providers_and_default_unchanged():
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": "Task prompt"},
+    ]
+
+    openai_llm = LLM(model="gpt-4o", prompt_caching=True)
+    assert openai_llm._prepare_completion_params(messages)["messages"] == messages
+    assert "prompt_caching" not in openai_llm._prepare_completion_params(messages)
+
+    anthropic_llm = LLM(model="anthropic/claude-3-5-sonnet-20241022")
+    formatted = anthropic_llm._prepare_completion_params(messages)["messages"]
+    assert formatted[1:] == messages
+
+
+def test_streaming_call_stops_when_stream_stop_returns_response():
+    chunks = ["Action: search\n", 'Action Input: {"q": ', '"sf"}\nObs', "ervation: hot"]
+    consumed = []
+
+    def fake_stream():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield {"choices": [{"delta": {"content": chunk}}]}
+
+    llm = LLM(model="gpt-4o", stream=True)
+    with patch("crewai.llm.litellm.completion", return_value=fake_stream()):
+        response = llm.call(
+            "search", stream_stop=StreamingCrewAgentParser().feed
+        )
+
+    assert response == 'Action: search\nAction Input: {"q": "sf"}'
+    assert consumed == chunks[:3]
+
+
+def test_streaming_call_stopped_early_still_records_usage():
+    chunks = ["Action: search\n", 'Action Input: {"q": "sf"}\nObs', "ervation: hot"]
+
+    def fake_stream():
+        for chunk in chunks:
+            yield {"choices": [{"delta": {"content": chunk}}]}
+        yield {"choices": [], "usage": None}
+
+    token_process = TokenProcess()
+    llm = LLM(model="gpt-4o", stream=True)
+    with patch("crewai.llm.litellm.completion", return_value=fake_stream()):
+        llm.call(
+            "search the weather in san francisco",
+            callbacks=[TokenCalcHandler(token_process)],
+            stream_stop=StreamingCrewAgentParser().feed,
+        )
+
+    usage = token_process.get_summary()
+    assert usage.successful_requests == 1
+    assert usage.prompt_tokens > 0
+    assert usage.completion_tokens > 0
+    assert usage.total_tokens == usage.prompt_tokens + usage.completion_tokens
+
+
+def test_usage_metrics_cache_hit_ratio():
+    assert UsageMetrics().cache_hit_ratio == 0.0
+    metrics = UsageMetrics(prompt_tokens=200, cached_prompt_tokens=150)
+    assert metrics.cache_hit_ratio == 0.75
+    assert metrics.model_dump()["cache_hit_ratio"] == 0.75
+
+
 def test_deepseek_r1_with_open_router():
     if not os.getenv("OPEN_ROUTER_API_KEY"):
         pytest.skip("OPEN_ROUTER_API_KEY not set; skipping test.")
@@ -566,7 +658,9 @@ def assert_event_count(
 def mock_emit() -> MagicMock:
     from crewai.utilities.events.crewai_event_bus import CrewAIEventsBus
 
-    with patch.object(CrewAIEventsBus, "emit") as mock_emit:
+    with patch.object(CrewAIEventsBus, "emit") as mock_emit, patch.object(
+        CrewAIEventsBus, "has_handlers", return_value=True
+    ):
         yield mock_emit
 
 
@@ -0,0 +1,192 @@
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from crewai.agent import Agent
+from crewai.crew import Crew
+from crewai.memory.storage.kickoff_task_outputs_storage import (
+    KickoffTaskOutputsSQLiteStorage,
+)
+from crewai.task import Task
+from crewai.tasks.task_output import TaskOutput
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return KickoffTaskOutputsSQLiteStorage(db_path=str(tmp_path / "outputs.db"))
+
+
+@pytest.fixture
+def tasks():
+    return [
+        Task(description=f"Task {i}", expected_output=f"Output {i}")
+        for i in range(3)
+    ]
+
+
+def _output(raw):
+    return {
+        "description": raw,
+        "summary": None,
+        "raw": raw,
+        "pydantic": None,
+        "json_dict": None,
+        "output_format": "raw",
+        "agent": "agent",
+    }
+
+
+def test_outputs_are_kept_per_kickoff(storage, tasks):
+    first = storage.start_kickoff()
+    storage.add(tasks[0], _output("first run"), 0, kickoff_id=first)
+    second = storage.start_kickoff()
+    storage.add(tasks[0], _output("second run"), 0, kickoff_id=second)
+
+    assert [r["output"]["raw"] for r in storage.load()] == ["second run"]
+    assert [r["output"]["raw"] for r in storage.load(first)] == ["first run"]
+    assert [k["kickoff_id"] for k in storage.list_kickoffs()] == [second, first]
+
+
+def test_outputs_of_the_single_kickoff_table_are_migrated(tmp_path):
+    db_path = str(tmp_path / "outputs.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE latest_kickoff_task_outputs (
+                task_id TEXT PRIMARY KEY,
+                expected_output TEXT,
+                output JSON,
+                task_index INTEGER,
+                inputs JSON,
+                was_replayed BOOLEAN,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+        conn.executemany(
+            "INSERT INTO latest_kickoff_task_outputs VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (f"task-{i}", f"Output {i}", '{"raw": "old %d"}' % i, i, "{}", False, "2024-01-01")
+                for i in (1, 0)
+            ],
+        )
+
+    storage = KickoffTaskOutputsSQLiteStorage(db_path=db_path)
+
+    records = storage.load()
+    assert [r["task_id"] for r in records] == ["task-0", "task-1"]
+    assert records[1]["output"] == {"raw": "old 1"}
+    assert len(storage.list_kickoffs()) == 1
+    with sqlite3.connect(db_path) as conn:
+        assert not conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'latest_kickoff_task_outputs'"
+        ).fetchall()
+    assert KickoffTaskOutputsSQLiteStorage(db_path=db_path).load() == records
+
+
+def test_old_kickoffs_are_pruned(tmp_path, tasks):
+    storage = KickoffTaskOutputsSQLiteStorage(
+        db_path=str(tmp_path / "outputs.db"), max_kickoffs=2
+    )
+    kickoff_ids = []
+    for i in range(3):
+        kickoff_ids.append(storage.start_kickoff())
+        storage.add(tasks[0], _output(f"run {i}"), 0)
+
+    assert [k["kickoff_id"] for k in storage.list_kickoffs()] == kickoff_ids[:0:-1]
+    assert storage.load(kickoff_ids[0]) == []
+    with sqlite3.connect(storage.db_path) as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM kickoff_task_outputs").fetchone()
+    assert count == 2
+
+
+def test_update_only_touches_one_kickoff(storage, tasks):
+    first = storage.start_kickoff()
+    storage.add(tasks[0], _output("first"), 0)
+    second = storage.start_kickoff()
+    storage.add(tasks[0], _output("second"), 0)
+
+    storage.update(0, kickoff_id=first, output=_output("replayed"), was_replayed=True)
+
+    assert storage.load(first)[0]["output"]["raw"] == "replayed"
+    assert storage.load(first)[0]["was_replayed"]
+    assert storage.load(second)[0]["output"]["raw"] == "second"
+
+
+def test_find_returns_most_recent_kickoff_that_ran_the_task(storage, tasks):
+    first = storage.start_kickoff()
+    storage.add(tasks[0], _output("a"), 0, inputs={"topic": "AI"})
+    storage.add(tasks[1], _output("b"), 1, inputs={"topic": "AI"})
+    second = storage.start_kickoff()
+    storage.add(tasks[0], _output("c"), 0)
+
+    found = storage.find(str(tasks[1].id))
+    assert found["kickoff_id"] == first
+    assert found["task_index"] == 1
+    assert found["inputs"] == {"topic": "AI"}
+    assert "output" not in found
+
+    assert storage.find(str(tasks[0].id))["kickoff_id"] == second
+    assert storage.find(str(tasks[1].id), kickoff_id=second) is None
+    assert storage.find("unknown") is None
+
+
+def test_load_outputs_reads_only_requested_tasks(storage, tasks):
+    kickoff_id = storage.start_kickoff()
+    for index, task in enumerate(tasks):
+        storage.add(task, _output(f"output {index}"), index)
+
+    outputs = storage.load_outputs(kickoff_id, [2, 0])
+
+    assert {index: output["raw"] for index, output in outputs.items()} == {
+        0: "output 0",
+        2: "output 2",
+    }
+    assert storage.load_outputs(kickoff_id, []) == {}
+
+
+def test_replay_reads_only_the_context_it_needs(tmp_path):
+    agent = Agent(role="test_agent", backstory="Test Description", goal="Test Goal")
+    tasks = [
+        Task(description=f"Task {i}", expected_output="Say Hi", agent=agent)
+        for i in range(4)
+    ]
+    tasks[3].context = [tasks[0]]
+    crew = Crew(agents=[agent], tasks=tasks)
+    crew._task_output_handler.storage = KickoffTaskOutputsSQLiteStorage(
+        db_path=str(tmp_path / "outputs.db")
+    )
+
+    with patch.object(Task, "execute_sync") as execute:
+        execute.side_effect = [
+            TaskOutput(description=f"Task {i}", raw=f"first {i}", agent="test_agent")
+            for i in range(4)
+        ]
+        crew.kickoff()
+    first_kickoff = crew._task_output_handler.kickoff_id
+
+    with patch.object(Task, "execute_sync") as execute:
+        execute.return_value = TaskOutput(
+            description="Task", raw="second", agent="test_agent"
+        )
+        crew.kickoff()
+
+    for task in tasks:
+        task.output = None
+    storage = crew._task_output_handler.storage
+    with patch.object(
+        storage, "load_outputs", wraps=storage.load_outputs
+    ) as load_outputs, patch.object(Task, "execute_sync") as execute:
+        execute.return_value = TaskOutput(
+            description="Task 3", raw="replayed", agent="test_agent"
+        )
+        crew.replay(str(tasks[3].id), kickoff_id=first_kickoff)
+
+    load_outputs.assert_called_once()
+    assert sorted(load_outputs.call_args.args[1]) == [0, 2]
+    assert tasks[0].output.raw == "first 0"
+    assert tasks[1].output is None
+    assert tasks[2].output.raw == "first 2"
+    assert storage.load(first_kickoff)[3]["output"]["raw"] == "replayed"
+    assert storage.load()[3]["output"]["raw"] == "second"
@@ -0,0 +1,123 @@
+import sqlite3
+import time
+
+import pytest
+
+from crewai.memory.storage.ltm_sqlite_storage import _PRUNE_AGE, LTMSQLiteStorage
+
+
+def _save(storage, task, datetime, score=0.5):
+    storage.save(
+        task_description=task,
+        metadata={"task": task, "datetime": datetime},
+        datetime=datetime,
+        score=score,
+    )
+
+
+def test_load_uses_the_task_index(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    _save(storage, "write a poem", "1.0")
+
+    with sqlite3.connect(storage.db_path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+            "WHERE task_hash = ? AND task_description = ? ORDER BY datetime DESC LIMIT ?",
+            ("hash", "write a poem", 3),
+        ).fetchall()
+
+    assert "idx_long_term_memories_task" in str(plan)
+
+
+def test_load_returns_latest_rows_for_the_task_only(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    storage.save_many(
+        [
+            {
+                "task_description": task,
+                "metadata": {"n": n},
+                "datetime": str(n),
+                "score": 0.5,
+            }
+            for n, task in enumerate(["poem", "essay", "poem", "poem"], start=1)
+        ]
+    )
+
+    rows = storage.load("poem", 2)
+
+    assert [row["metadata"]["n"] for row in rows] == [4, 3]
+    assert storage.load("haiku", 2) is None
+
+
+def test_existing_databases_are_upgraded(tmp_path):
+    db_path = str(tmp_path / "ltm.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE long_term_memories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_description TEXT,
+                metadata TEXT,
+                datetime TEXT,
+                score REAL
+            )
+        """
+        )
+        conn.execute(
+            "INSERT INTO long_term_memories (task_description, metadata, datetime, score) "
+            "VALUES ('poem', '{\"old\": true}', '1.0', 0.5)"
+        )
+
+    storage = LTMSQLiteStorage(db_path=db_path)
+    _save(storage, "poem", "2.0")
+
+    rows = storage.load("poem", 5)
+    assert [row["datetime"] for row in rows] == ["2.0", "1.0"]
+    assert rows[1]["metadata"] == {"old": True}
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone() == (2,)
+        assert conn.execute(
+            "SELECT created_at FROM long_term_memories ORDER BY id"
+        ).fetchall() == [(1.0,), (2.0,)]
+
+
+def test_saves_keep_the_newest_rows_per_task(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"), max_entries_per_task=2)
+    for n in range(1, 5):
+        _save(storage, "poem", str(n))
+    _save(storage, "essay", "1")
+
+    assert [row["datetime"] for row in storage.load("poem", 10)] == ["4", "3"]
+    assert len(storage.load("essay", 10)) == 1
+
+
+def test_compact_removes_rows_older_than_max_age(tmp_path):
+    db_path = str(tmp_path / "ltm.db")
+    storage = LTMSQLiteStorage(db_path=db_path)
+    now = time.time()
+    _save(storage, "poem", str(now - 10 * 86400))
+    _save(storage, "poem", str(now))
+    _save(storage, "poem", "not-a-timestamp")
+    storage.close()
+
+    storage = LTMSQLiteStorage(db_path=db_path, max_age_days=7)
+    storage.compact()
+
+    assert sorted(row["datetime"] for row in storage.load("poem", 10)) == sorted(
+        [str(now), "not-a-timestamp"]
+    )
+
+
+def test_age_retention_uses_the_created_at_index(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"), max_age_days=7)
+    _save(storage, "poem", str(time.time()))
+
+    with sqlite3.connect(storage.db_path) as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {_PRUNE_AGE}", (0.0,)).fetchall()
+
+    assert "idx_long_term_memories_created_at" in str(plan)
+
+
+def test_invalid_retention_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"), max_entries_per_task=0)
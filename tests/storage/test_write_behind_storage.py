@@ -0,0 +1,136 @@
+import copy
+import time
+
+import pytest
+
+from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.memory.storage.write_behind_storage import WriteBehindStorage
+
+
+class RecordingStorage:
+    def __init__(self):
+        self.saved = []
+        self.batches = []
+
+    def save(self, value, metadata):
+        self.saved.append((value, metadata))
+
+    def search(self, query, limit=3, score_threshold=0.35):
+        return [value for value, _ in self.saved if query in value]
+
+    def reset(self):
+        self.saved = []
+
+
+class BatchingStorage(RecordingStorage):
+    def save_many(self, items):
+        self.batches.append(items)
+        self.saved.extend((item["value"], item["metadata"]) for item in items)
+
+
+def test_saves_are_queued_until_flush():
+    storage = RecordingStorage()
+    write_behind = WriteBehindStorage(storage, batch_size=100, flush_interval=60)
+
+    write_behind.save("first", {"a": 1})
+    write_behind.save(value="second", metadata={})
+
+    assert storage.saved == []
+    assert write_behind.pending_count == 2
+
+    write_behind.flush()
+
+    assert storage.saved == [("first", {"a": 1}), ("second", {})]
+    assert write_behind.pending_count == 0
+
+
+def test_batch_size_triggers_background_write():
+    storage = BatchingStorage()
+    write_behind = WriteBehindStorage(storage, batch_size=2, flush_interval=60)
+
+    write_behind.save("one", {})
+    write_behind.save("two", {})
+
+    deadline = time.time() + 5
+    while not storage.batches and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert storage.batches == [
+        [{"value": "one", "metadata": {}}, {"value": "two", "metadata": {}}]
+    ]
+
+
+def test_flush_interval_triggers_background_write():
+    storage = BatchingStorage()
+    write_behind = WriteBehindStorage(storage, batch_size=100, flush_interval=0.05)
+
+    write_behind.save("one", {})
+
+    deadline = time.time() + 5
+    while not storage.saved and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert storage.saved == [("one", {})]
+
+
+def test_search_sees_pending_saves():
+    storage = RecordingStorage()
+    write_behind = WriteBehindStorage(storage, batch_size=100, flush_interval=60)
+
+    write_behind.save("remember this", {})
+
+    assert write_behind.search("remember") == ["remember this"]
+
+
+def test_reset_discards_pending_saves():
+    storage = RecordingStorage()
+    write_behind = WriteBehindStorage(storage, batch_size=100, flush_interval=60)
+
+    write_behind.save("forget this", {})
+    write_behind.reset()
+    write_behind.flush()
+
+    assert storage.saved == []
+
+
+def test_deepcopy_wraps_copied_storage():
+    write_behind = WriteBehindStorage(RecordingStorage(), batch_size=5)
+    copied = copy.deepcopy(write_behind)
+
+    assert isinstance(copied, WriteBehindStorage)
+    assert copied.storage is not write_behind.storage
+    assert copied.batch_size == 5
+
+
+def test_long_term_memory_write_behind(tmp_path):
+    memory = LongTermMemory(
+        storage=LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    ).enable_write_behind(batch_size=100, flush_interval=60)
+
+    for quality in (0.5, 0.9):
+        memory.save(
+            LongTermMemoryItem(
+                agent="agent",
+                task="task",
+                expected_output="output",
+                datetime=str(quality),
+                quality=quality,
+                metadata={"quality": quality},
+            )
+        )
+
+    assert memory.storage.pending_count == 2
+    memory.flush()
+    assert memory.storage.pending_count == 0
+
+    results = memory.search("task", latest_n=5)
+    assert [result["score"] for result in results] == [0.9, 0.5]
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        WriteBehindStorage(RecordingStorage(), batch_size=0)
+    with pytest.raises(ValueError):
+        WriteBehindStorage(RecordingStorage(), flush_interval=0)
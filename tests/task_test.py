@@ -593,6 +593,93 @@ def test_output_pydantic_to_another_task():
     assert pydantic_result.score == 5
 
 
+class NativeScoreOutput(BaseModel):
+    score: int
+
+
+def _scorer(**kwargs) -> Agent:
+    return Agent(
+        role="Scorer",
+        goal="Score the title",
+        backstory="You're an expert scorer, specialized in scoring titles.",
+        llm="gpt-4o-mini",
+        allow_delegation=False,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("output", ["output_pydantic", "output_json"])
+def test_native_structured_output_skips_the_converter(output):
+    from crewai.llm import LLM
+
+    task = Task(
+        description="Give me an integer score between 1-5 for 'AI at work'",
+        expected_output="The score of the title.",
+        native_structured_output=True,
+        **{output: NativeScoreOutput},
+    )
+
+    with (
+        patch.object(LLM, "call", return_value='{"score": 4}') as call,
+        patch.object(Converter, "to_pydantic") as to_pydantic,
+        patch.object(Converter, "to_json") as to_json,
+    ):
+        result = task.execute_sync(agent=_scorer())
+
+    assert call.call_count == 1
+    assert call.call_args.kwargs["response_format"] is NativeScoreOutput
+    to_pydantic.assert_not_called()
+    to_json.assert_not_called()
+    assert result.to_dict() == {"score": 4}
+
+
+def test_native_structured_output_falls_back_to_the_converter():
+    from crewai.llm import LLM
+
+    task = Task(
+        description="Give me an integer score between 1-5 for 'AI at work'",
+        expected_output="The score of the title.",
+        output_pydantic=NativeScoreOutput,
+        native_structured_output=True,
+    )
+
+    with (
+        patch.object(LLM, "call", return_value='{"score": "four"}'),
+        patch.object(
+            Converter, "to_pydantic", return_value=NativeScoreOutput(score=4)
+        ) as to_pydantic,
+    ):
+        result = task.execute_sync(agent=_scorer())
+
+    to_pydantic.assert_called_once()
+    assert result.pydantic == NativeScoreOutput(score=4)
+
+
+def test_native_structured_output_is_not_requested_when_the_agent_has_tools():
+    from crewai.llm import LLM
+    from crewai.tools import tool
+
+    @tool
+    def lookup_tool() -> str:
+        "Look something up"
+        return "nothing"
+
+    task = Task(
+        description="Give me an integer score between 1-5 for 'AI at work'",
+        expected_output="The score of the title.",
+        output_pydantic=NativeScoreOutput,
+        native_structured_output=True,
+    )
+
+    with patch.object(
+        LLM, "call", return_value='Thought: done\nFinal Answer: {"score": 4}'
+    ) as call:
+        result = task.execute_sync(agent=_scorer(tools=[lookup_tool]))
+
+    assert call.call_args.kwargs.get("response_format") is None
+    assert result.pydantic == NativeScoreOutput(score=4)
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_output_json_to_another_task():
     class ScoreOutput(BaseModel):
@@ -0,0 +1,159 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.llms.router import LLMDeployment, RouterLLM
+from crewai.utilities.cancellation import (
+    ExecutionCancelledError,
+    cancellation_scope,
+    check_cancelled,
+)
+from crewai.utilities.exceptions.context_window_exceeding_exception import (
+    LLMContextLengthExceededException,
+)
+
+
+class StandInLLM(BaseLLM):
+    """Local stand-in for a deployment with a fixed latency."""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Optional[Exception] = None):
+        super().__init__(model=name)
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return f"answer from {self.model}"
+
+
+def test_router_prefers_lowest_latency_deployment():
+    slow = StandInLLM("slow", delay=0.05)
+    fast = StandInLLM("fast", delay=0.0)
+    router = RouterLLM([slow, fast])
+
+    # Both deployments are measured first, then the fast one is preferred.
+    router.call("hi")
+    router.call("hi")
+    results = [router.call("hi") for _ in range(3)]
+
+    assert results == ["answer from fast"] * 3
+    assert slow.calls == 1
+
+
+def test_router_fails_over_and_cools_down_failed_deployment():
+    broken = StandInLLM("broken", error=RuntimeError("rate limited"))
+    healthy = StandInLLM("healthy")
+    router = RouterLLM([broken, healthy], cooldown=60)
+
+    assert router.call("hi") == "answer from healthy"
+    assert router.call("hi") == "answer from healthy"
+    assert broken.calls == 1
+
+
+def test_router_raises_last_error_when_all_deployments_fail():
+    router = RouterLLM(
+        [
+            StandInLLM("a", error=RuntimeError("a failed")),
+            StandInLLM("b", error=RuntimeError("b failed")),
+        ]
+    )
+
+    with pytest.raises(RuntimeError, match="b failed"):
+        router.call("hi")
+
+
+def test_router_does_not_fail_over_on_context_length_errors():
+    too_long = StandInLLM("a", error=LLMContextLengthExceededException("too long"))
+    other = StandInLLM("b")
+    router = RouterLLM([too_long, other])
+
+    with pytest.raises(LLMContextLengthExceededException):
+        router.call("hi")
+    assert other.calls == 0
+
+
+def test_router_skips_deployments_without_rpm_headroom():
+    limited = StandInLLM("limited")
+    spare = StandInLLM("spare", delay=0.01)
+    router = RouterLLM([LLMDeployment(limited, rpm=1), spare])
+
+    results = [router.call("hi") for _ in range(3)]
+
+    assert limited.calls == 1
+    assert results.count("answer from spare") == 2
+
+
+def test_router_counts_each_call_once_against_limits():
+    deployment = LLMDeployment(StandInLLM("limited"), rpm=4, tpm=1000)
+    router = RouterLLM([deployment])
+
+    router.call("hi")
+    router.call("hi")
+
+    assert len(deployment._requests) == 2
+    assert deployment.headroom(time.monotonic()) == pytest.approx(0.5)
+    assert deployment._requests[0][1] > 1
+
+
+def test_router_hedges_slow_primary():
+    stalled = StandInLLM("stalled", delay=1.0)
+    backup = StandInLLM("backup")
+    router = RouterLLM([stalled, backup], hedge=True, hedge_after=0.05)
+
+    started_at = time.monotonic()
+    assert router.call("hi") == "answer from backup"
+    assert time.monotonic() - started_at < 0.5
+    assert stalled.calls == 1
+    assert backup.calls == 1
+
+
+def test_router_propagates_stop_words_to_deployments():
+    deployment = StandInLLM("a")
+    router = RouterLLM([deployment])
+    router.stop = ["\nObservation:"]
+
+    router.call("hi")
+
+    assert deployment.stop == ["\nObservation:"]
+
+
+def test_router_hedged_calls_observe_cancellation():
+    class CancellableLLM(StandInLLM):
+        def call(self, messages, *args: Any, **kwargs: Any) -> Union[str, Any]:
+            with self._lock:
+                self.calls += 1
+            for _ in range(100):
+                check_cancelled()
+                time.sleep(0.01)
+            return f"answer from {self.model}"
+
+    stalled = CancellableLLM("stalled")
+    backup = CancellableLLM("backup")
+    router = RouterLLM([stalled, backup], hedge=True, hedge_after=0.05)
+
+    with cancellation_scope() as token:
+        threading.Timer(0.02, token.cancel).start()
+        started_at = time.monotonic()
+        with pytest.raises(ExecutionCancelledError):
+            router.call("hi")
+
+    assert time.monotonic() - started_at < 0.5
+    assert stalled.calls == 1
+    assert backup.calls == 0
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -252,7 +253,7 @@ def test_guardrail_emits_events(sample_agent):
 def test_guardrail_when_an_error_occurs(sample_agent, task_output):
     with (
         patch(
-            "crewai.Agent.kickoff",
+            "crewai.lite_agent.LiteAgent.kickoff",
             side_effect=Exception("Unexpected error"),
         ),
         pytest.raises(
@@ -302,3 +303,264 @@ def test_hallucination_guardrail_description_in_events():
 
     event = LLMGuardrailStartedEvent(guardrail=guardrail, retry_count=0)
     assert event.guardrail == "HallucinationGuardrail (no-op)"
+
+
+def _require_good(result: TaskOutput):
+    if result.raw == "good result":
+        return (True, result.raw)
+    return (False, "Expected a good result")
+
+
+def test_guardrail_repair_asks_for_a_corrected_answer():
+    """Test that guardrail repair fixes the answer without re-executing the task."""
+    agent = Mock()
+    agent.role = "test_agent"
+    agent.crew = None
+    agent.execute_task.return_value = "bad result"
+    agent.repair_task_output.return_value = "good result"
+
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_require_good,
+        guardrail_repair=True,
+    )
+
+    result = task.execute_sync(agent=agent)
+
+    assert result.raw == "good result"
+    assert task.retry_count == 1
+    agent.execute_task.assert_called_once()
+    repaired_task, feedback = agent.repair_task_output.call_args.args
+    assert repaired_task is task
+    assert "Expected a good result" in feedback
+
+
+@pytest.mark.parametrize("repaired", ["still bad", None])
+def test_guardrail_repair_escalates_to_a_full_rerun(repaired):
+    """Test that the task is executed again when repair does not produce a valid answer."""
+    agent = Mock()
+    agent.role = "test_agent"
+    agent.crew = None
+    agent.execute_task.side_effect = ["bad result", "good result"]
+    agent.repair_task_output.return_value = repaired
+
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_require_good,
+        guardrail_repair=True,
+    )
+
+    result = task.execute_sync(agent=agent)
+
+    assert result.raw == "good result"
+    assert agent.execute_task.call_count == 2
+    assert "Expected a good result" in agent.execute_task.call_args.kwargs["context"]
+
+
+def test_guardrail_repair_continues_the_agent_conversation():
+    """Test that the agent repairs its answer in the conversation it executed the task in."""
+    agent = Agent(
+        role="test_agent",
+        goal="Test goal",
+        backstory="Test backstory",
+        llm="gpt-4o-mini",
+    )
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_require_good,
+        guardrail_repair=True,
+    )
+
+    answers = iter(
+        [
+            "Thought: done\nFinal Answer: bad result",
+            "Thought: fixed\nFinal Answer: good result",
+        ]
+    )
+    calls = []
+
+    def call(messages, **kwargs):
+        calls.append(list(messages))
+        return next(answers)
+
+    with patch.object(LLM, "call", side_effect=call):
+        result = task.execute_sync(agent=agent)
+
+    assert result.raw == "good result"
+    assert len(calls) == 2
+    assert calls[1][: len(calls[0])] == calls[0]
+    assert calls[1][-2]["content"].endswith("Final Answer: bad result")
+    assert "Expected a good result" in calls[1][-1]["content"]
+
+
+def test_guardrail_repair_has_its_own_iteration_budget_and_saves_memory():
+    """Test that a repair after max_iter was used up still asks the LLM, and its answer is saved to memory."""
+    from crewai.agents.crew_agent_executor import CrewAgentExecutor
+
+    agent = Agent(
+        role="test_agent",
+        goal="Test goal",
+        backstory="Test backstory",
+        llm="gpt-4o-mini",
+        max_iter=1,
+    )
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_require_good,
+        guardrail_repair=True,
+    )
+
+    answers = iter(
+        [
+            "Thought: done\nFinal Answer: bad result",
+            "Thought: fixed\nFinal Answer: good result",
+        ]
+    )
+    saved = []
+
+    with (
+        patch.object(LLM, "call", side_effect=lambda *args, **kwargs: next(answers)),
+        patch.object(
+            CrewAgentExecutor,
+            "_create_short_term_memory",
+            side_effect=lambda output: saved.append(output.output),
+        ),
+        patch(
+            "crewai.agents.crew_agent_executor.handle_max_iterations_exceeded"
+        ) as forced_answer,
+    ):
+        result = task.execute_sync(agent=agent)
+
+    assert result.raw == "good result"
+    forced_answer.assert_not_called()
+    assert saved[-1] == "good result"
+
+
+def test_llm_guardrail_reuses_its_validator():
+    """Test that LLMGuardrail builds its validating agent once."""
+    from crewai.lite_agent import LiteAgent, LiteAgentOutput
+    from crewai.tasks.llm_guardrail import LLMGuardrailResult
+
+    guardrail = LLMGuardrail(description="Be short", llm=LLM(model="gpt-4o-mini"))
+    output = TaskOutput(description="Test task", raw="short", agent="test_agent")
+
+    with patch.object(
+        LiteAgent,
+        "kickoff",
+        return_value=LiteAgentOutput(
+            raw="", pydantic=LLMGuardrailResult(valid=True), agent_role="Guardrail Agent"
+        ),
+    ) as kickoff:
+        assert guardrail(output) == (True, "short")
+        assert guardrail(output) == (True, "short")
+
+    assert kickoff.call_count == 2
+    assert len(guardrail._validators[LLMGuardrailResult]) == 1
+
+
+def test_llm_guardrail_validates_concurrently_with_separate_agents():
+    """Test that concurrent validations do not wait for each other's LLM round trip."""
+    from crewai.lite_agent import LiteAgent, LiteAgentOutput
+    from crewai.tasks.llm_guardrail import LLMGuardrailResult
+
+    guardrail = LLMGuardrail(description="Be short", llm=LLM(model="gpt-4o-mini"))
+    output = TaskOutput(description="Test task", raw="short", agent="test_agent")
+    both_running = threading.Barrier(2, timeout=5)
+    agents = []
+
+    def kickoff(agent, query):
+        agents.append(agent)
+        both_running.wait()
+        return LiteAgentOutput(
+            raw="", pydantic=LLMGuardrailResult(valid=True), agent_role="Guardrail Agent"
+        )
+
+    with patch.object(LiteAgent, "kickoff", autospec=True, side_effect=kickoff):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(guardrail(output)))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == [(True, "short"), (True, "short")]
+    assert agents[0] is not agents[1]
+    assert len(guardrail._validators[LLMGuardrailResult]) == 2
+
+
+def test_llm_guardrail_can_call_the_llm_directly():
+    """Test that a direct LLMGuardrail asks the LLM for a structured response."""
+    from crewai.lite_agent import LiteAgent
+    from crewai.tasks.llm_guardrail import LLMGuardrailResult
+
+    llm = LLM(model="gpt-4o-mini")
+    guardrail = LLMGuardrail(description="Be short", llm=llm, direct=True)
+    output = TaskOutput(description="Test task", raw="too long", agent="test_agent")
+
+    with (
+        patch.object(
+            LLM, "call", return_value='{"valid": false, "feedback": "Too long"}'
+        ) as call,
+        patch.object(LiteAgent, "kickoff") as kickoff,
+    ):
+        assert guardrail(output) == (False, "Too long")
+
+    kickoff.assert_not_called()
+    assert call.call_args.kwargs["response_format"] is LLMGuardrailResult
+    assert "too long" in call.call_args.args[0][-1]["content"]
+
+
+def test_llm_guardrail_validates_outputs_in_batches():
+    """Test that validate_many asks about several outputs per LLM call."""
+    guardrail = LLMGuardrail(
+        description="Be short", llm=LLM(model="gpt-4o-mini"), direct=True
+    )
+    outputs = [
+        TaskOutput(description="Test task", raw=raw, agent="test_agent")
+        for raw in ("a", "bbbbbbbb", "c")
+    ]
+    responses = [
+        '{"results": [{"valid": true}, {"valid": false, "feedback": "Too long"}]}',
+        '{"results": [{"valid": true}]}',
+    ]
+
+    with patch.object(LLM, "call", side_effect=responses) as call:
+        results = guardrail.validate_many(outputs, batch_size=2)
+
+    assert results == [(True, "a"), (False, "Too long"), (True, "c")]
+    assert call.call_count == 2
+    assert "Task result 2:\nbbbbbbbb" in call.call_args_list[0].args[0][-1]["content"]
+
+
+def test_llm_guardrail_batches_fall_back_to_single_validations():
+    """Test that a batch with the wrong number of results is validated one output at a time."""
+    guardrail = LLMGuardrail(
+        description="Be short", llm=LLM(model="gpt-4o-mini"), direct=True
+    )
+    outputs = [
+        TaskOutput(description="Test task", raw=raw, agent="test_agent")
+        for raw in ("a", "b")
+    ]
+    responses = [
+        '{"results": [{"valid": true}]}',
+        '{"valid": true}',
+        '{"valid": false, "feedback": "Not a"}',
+    ]
+
+    with patch.object(LLM, "call", side_effect=responses):
+        results = guardrail.validate_many(outputs)
+
+    assert results == [(True, "a"), (False, "Not a")]
+
+    with (
+        patch.object(LLM, "call", return_value='{"results": [{"valid": true}]}'),
+        pytest.raises(ValueError, match="one result per task result"),
+    ):
+        guardrail._validate_outputs(outputs)
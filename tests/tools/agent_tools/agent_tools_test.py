@@ -1,9 +1,14 @@
 """Test Agent creation and execution basic functionality."""
 
+import threading
+import time
+from unittest.mock import patch
+
 import pytest
 
 from crewai.agent import Agent
 from crewai.tools.agent_tools.agent_tools import AgentTools
+from crewai.utilities.cancellation import cancellation_scope, current_cancellation_token
 
 researcher = Agent(
     role="researcher",
@@ -131,3 +136,124 @@ def test_ask_question_to_wrong_agent():
         result
         == "\nError executing tool. coworker mentioned not found, it must be one of the following options:\n- researcher\n"
     )
+
+
+def _track_concurrency(delay=0.1):
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+    seen = []
+
+    def fake_execute_task(agent, task, context=None, tools=None):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            seen.append(agent)
+        time.sleep(delay)
+        with lock:
+            active["now"] -= 1
+        return f"{agent.role} did {task.description}"
+
+    return fake_execute_task, active, seen
+
+
+def test_parallel_delegation_runs_different_coworkers_concurrently():
+    writer = Agent(role="writer", goal="write", backstory="writes")
+    parallel_tool = AgentTools(
+        agents=[researcher, writer], parallel_delegation=True
+    ).tools()[2]
+    fake_execute_task, active, _ = _track_concurrency()
+
+    with patch.object(
+        Agent, "execute_task", autospec=True, side_effect=fake_execute_task
+    ):
+        result = parallel_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": "research", "context": "c"},
+                {"coworker": "Writer", "task": "write", "context": "c"},
+            ]
+        )
+
+    assert active["max"] == 2
+    assert "## researcher: research\nresearcher did research" in result
+    assert "## Writer: write\nwriter did write" in result
+
+
+def test_parallel_delegation_respects_per_coworker_limit():
+    analyst = Agent(
+        role="analyst", goal="analyze", backstory="analyzes", max_concurrent_delegations=2
+    )
+    parallel_tool = AgentTools(
+        agents=[researcher, analyst], parallel_delegation=True
+    ).tools()[2]
+
+    fake_execute_task, active, _ = _track_concurrency()
+    with patch.object(
+        Agent, "execute_task", autospec=True, side_effect=fake_execute_task
+    ):
+        parallel_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": f"task {i}", "context": "c"}
+                for i in range(3)
+            ]
+        )
+    assert active["max"] == 1
+
+    fake_execute_task, active, seen = _track_concurrency()
+    with patch.object(
+        Agent, "execute_task", autospec=True, side_effect=fake_execute_task
+    ):
+        parallel_tool.run(
+            delegations=[
+                {"coworker": "analyst", "task": f"task {i}", "context": "c"}
+                for i in range(4)
+            ]
+        )
+    assert active["max"] == 2
+    assert analyst in seen
+    assert {agent.role for agent in seen} == {"analyst"}
+    assert len({id(agent) for agent in seen}) == 2
+
+
+def test_parallel_delegation_reports_unknown_coworker():
+    parallel_tool = AgentTools(agents=[researcher], parallel_delegation=True).tools()[2]
+
+    with patch.object(Agent, "execute_task", autospec=True, return_value="done"):
+        result = parallel_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": "research", "context": "c"},
+                {"coworker": "nobody", "task": "anything", "context": "c"},
+            ]
+        )
+
+    assert "## researcher: research\ndone" in result
+    assert "## nobody: anything\n\nError executing tool. coworker mentioned not found" in result
+
+
+def test_parallel_delegation_runs_under_the_callers_cancellation_token():
+    parallel_tool = AgentTools(agents=[researcher], parallel_delegation=True).tools()[2]
+    tokens = []
+
+    def fake_execute_task(agent, task, context=None, tools=None):
+        tokens.append(current_cancellation_token())
+        return "done"
+
+    with patch.object(
+        Agent, "execute_task", autospec=True, side_effect=fake_execute_task
+    ), cancellation_scope() as token:
+        parallel_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": "research", "context": "c"}
+            ]
+        )
+
+    assert tokens == [token]
+
+
+def test_parallel_delegation_tool_only_added_when_enabled():
+    assert len(AgentTools(agents=[researcher]).tools()) == 2
+
+    manager = Agent(
+        role="manager", goal="manage", backstory="manages", parallel_delegation=True
+    )
+    tool_names = [tool.name for tool in manager.get_delegation_tools([researcher])]
+    assert "Delegate work to coworkers in parallel" in tool_names
@@ -1,7 +1,8 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from crewai.utilities.events.base_events import BaseEvent
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
 
 
 class TestEvent(BaseEvent):
@@ -45,3 +46,131 @@ def test_event_bus_error_handling(capfd):
     out, err = capfd.readouterr()
     assert "Simulated handler failure" in out
     assert "Handler 'broken_handler' failed" in out
+
+
+class OtherEvent(BaseEvent):
+    pass
+
+
+def test_has_handlers():
+    with crewai_event_bus.scoped_handlers():
+        assert not crewai_event_bus.has_handlers(TestEvent)
+
+        @crewai_event_bus.on(TestEvent)
+        def handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_handlers(TestEvent)
+        assert not crewai_event_bus.has_handlers(OtherEvent)
+
+
+def test_has_handlers_matches_base_classes():
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+
+        @crewai_event_bus.on(BaseEvent)
+        def handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_handlers(TestEvent)
+        assert crewai_event_bus.has_handlers(OtherEvent)
+
+
+def test_conditional_handlers_only_count_while_enabled():
+    enabled = False
+    received = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent, enabled=lambda: enabled)
+        def handler(source, event):
+            received.append(event)
+
+        assert not crewai_event_bus.has_handlers(TestEvent)
+        enabled = True
+        assert crewai_event_bus.has_handlers(TestEvent)
+
+        # Events that are emitted anyway still reach the handler.
+        enabled = False
+        event = TestEvent(type="test_event")
+        crewai_event_bus.emit("source_object", event)
+        assert received == [event]
+
+
+def test_handlers_registered_after_an_emit_are_called():
+    calls = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent)
+        def first(source, event):
+            calls.append("first")
+
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+
+        @crewai_event_bus.on(BaseEvent)
+        def second(source, event):
+            calls.append("second")
+
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+
+    assert calls == ["first", "first", "second"]
+
+
+def test_scoped_handlers_restore_previous_handlers():
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(OtherEvent)
+        def outer(source, event):
+            pass
+
+        with crewai_event_bus.scoped_handlers():
+            assert not crewai_event_bus.has_handlers(OtherEvent)
+
+        assert crewai_event_bus.has_handlers(OtherEvent)
+
+
+def test_llm_call_skips_events_without_handlers():
+    from crewai.llm import LLM
+
+    llm = LLM(model="gpt-4o-mini")
+    with crewai_event_bus.scoped_handlers(), patch(
+        "crewai.llm.LLMCallStartedEvent"
+    ) as started_event, patch(
+        "crewai.llm.LLMCallCompletedEvent"
+    ) as completed_event, patch(
+        "litellm.completion"
+    ) as completion:
+        completion.return_value = Mock(
+            choices=[Mock(message=Mock(content="Hello", tool_calls=None))],
+            usage=None,
+        )
+        assert llm.call("Hi") == "Hello"
+
+    started_event.assert_not_called()
+    completed_event.assert_not_called()
+
+
+def test_stream_chunk_event_from_chunk():
+    agent = Mock(id="agent-id", role="Researcher")
+    task = Mock(id="task-id", agent=agent)
+    task.name = "Research"
+
+    event = LLMStreamChunkEvent.from_chunk(
+        "Hel",
+        tool_call={
+            "id": "call_1",
+            "function": {"arguments": "{}", "name": "search"},
+            "type": "function",
+            "index": 0,
+        },
+        from_task=task,
+    )
+
+    assert event.chunk == "Hel"
+    assert event.type == "llm_stream_chunk"
+    assert event.timestamp is not None
+    assert event.tool_call.function.name == "search"
+    assert event.agent_role == "Researcher"
+    assert event.task_id == "task-id"
+    assert event.task_name == "Research"
@@ -0,0 +1,150 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from crewai import Agent, Task
+from crewai.flow.flow import Flow, listen, start
+from crewai.llm import LLM
+from crewai.utilities.cancellation import (
+    CancellationToken,
+    ExecutionCancelledError,
+    ExecutionTimeoutError,
+    cancellation_scope,
+    check_cancelled,
+    current_cancellation_token,
+    run_with_timeout,
+)
+
+
+def test_child_token_is_cancelled_with_parent():
+    parent = CancellationToken()
+    child = CancellationToken(parent=parent)
+
+    parent.cancel("stop")
+
+    assert child.is_cancelled
+    with pytest.raises(ExecutionCancelledError, match="stop"):
+        child.raise_if_cancelled()
+
+
+def test_cancellation_scope_sets_and_restores_current_token():
+    assert current_cancellation_token() is None
+    with cancellation_scope() as outer:
+        with cancellation_scope() as inner:
+            assert current_cancellation_token() is inner
+            assert inner.parent is outer
+            outer.cancel()
+            with pytest.raises(ExecutionCancelledError):
+                check_cancelled()
+        assert current_cancellation_token() is outer
+    assert current_cancellation_token() is None
+
+
+def test_run_with_timeout_returns_immediately_and_cancels_worker():
+    stopped = threading.Event()
+
+    def work():
+        while True:
+            try:
+                check_cancelled()
+            except ExecutionCancelledError:
+                stopped.set()
+                raise
+            time.sleep(0.01)
+
+    started_at = time.monotonic()
+    with pytest.raises(ExecutionTimeoutError):
+        run_with_timeout(work, 0.1)
+
+    assert time.monotonic() - started_at < 0.5
+    assert stopped.wait(1)
+
+
+def test_run_with_timeout_returns_result_and_propagates_errors():
+    assert run_with_timeout(lambda x: x * 2, 1, 21) == 42
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_with_timeout(fail, 1)
+
+
+def test_llm_call_is_skipped_when_cancelled():
+    llm = LLM(model="gpt-4o-mini")
+    with patch("crewai.llm.litellm.completion") as completion:
+        with cancellation_scope() as token:
+            token.cancel()
+            with pytest.raises(ExecutionCancelledError):
+                llm.call("Hello")
+    completion.assert_not_called()
+
+
+def test_timed_out_agent_stops_calling_the_llm():
+    calls = []
+
+    def slow_llm_call(*args, **kwargs):
+        calls.append(time.monotonic())
+        time.sleep(1.5)
+        return "Thought: keep going\nAction: missing tool\nAction Input: {}"
+
+    agent = Agent(
+        role="researcher",
+        goal="research",
+        backstory="researches",
+        max_execution_time=1,
+        max_retry_limit=0,
+    )
+    task = Task(description="research", expected_output="notes", agent=agent)
+
+    with patch.object(LLM, "call", side_effect=slow_llm_call):
+        started_at = time.monotonic()
+        with pytest.raises(TimeoutError):
+            agent.execute_task(task)
+        assert time.monotonic() - started_at < 1.5
+
+        # Give the worker time to finish its in-flight call and reach a checkpoint.
+        time.sleep(2)
+
+    assert len(calls) == 1
+
+
+def test_flow_cancel_skips_remaining_methods():
+    executed = []
+
+    class CancellingFlow(Flow):
+        @start()
+        def begin(self):
+            executed.append("begin")
+            self.cancel("no longer needed")
+
+        @listen(begin)
+        def follow_up(self):
+            executed.append("follow_up")
+
+    with pytest.raises(ExecutionCancelledError, match="no longer needed"):
+        CancellingFlow().kickoff()
+
+    assert executed == ["begin"]
+
+
+def test_flow_method_timeout_cancels_worker_thread():
+    stopped = threading.Event()
+
+    class SlowFlow(Flow):
+        @start(timeout=0.1)
+        def slow(self):
+            while True:
+                try:
+                    check_cancelled()
+                except ExecutionCancelledError:
+                    stopped.set()
+                    raise
+                time.sleep(0.01)
+
+    with pytest.raises(TimeoutError):
+        SlowFlow().kickoff()
+
+    assert stopped.wait(1)
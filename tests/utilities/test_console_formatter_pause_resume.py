@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock, patch
+from rich.console import Console
 from rich.tree import Tree
 from rich.live import Live
 from crewai.utilities.events.utils.console_formatter import ConsoleFormatter
@@ -67,6 +68,7 @@ class TestConsoleFormatterPauseResume:
     def test_print_after_resume_restarts_live_session(self):
         """Test that printing a Tree after resume creates new Live session."""
         formatter = ConsoleFormatter()
+        formatter.console = Console(force_terminal=True)
         
         formatter._live_paused = True
         formatter._live = None
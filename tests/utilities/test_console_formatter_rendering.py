@@ -0,0 +1,105 @@
+import io
+from unittest.mock import MagicMock, patch
+
+from rich.console import Console
+from rich.live import Live
+from rich.tree import Tree
+
+from crewai.utilities.events.utils.console_formatter import ConsoleFormatter
+
+
+def _formatter(is_terminal: bool) -> ConsoleFormatter:
+    formatter = ConsoleFormatter(verbose=True)
+    formatter.console = Console(file=io.StringIO(), force_terminal=is_terminal)
+    return formatter
+
+
+def test_trees_are_skipped_when_output_is_not_a_terminal():
+    formatter = _formatter(is_terminal=False)
+
+    with patch(
+        "crewai.utilities.events.utils.console_formatter.Live"
+    ) as mock_live_class:
+        formatter.print(Tree("Crew"))
+
+    mock_live_class.assert_not_called()
+    assert formatter._live is None
+    assert formatter.console.file.getvalue() == ""
+
+
+def test_panels_are_still_printed_when_output_is_not_a_terminal():
+    formatter = _formatter(is_terminal=False)
+
+    formatter.print("Task completed")
+
+    assert "Task completed" in formatter.console.file.getvalue()
+
+
+def test_tree_updates_are_left_to_the_refresh_thread():
+    formatter = _formatter(is_terminal=True)
+    mock_live = MagicMock(spec=Live)
+    formatter._live = mock_live
+
+    tree = Tree("Crew")
+    formatter.print(tree)
+    formatter.print(tree)
+
+    assert mock_live.update.call_count == 2
+    for call in mock_live.update.call_args_list:
+        assert call.kwargs.get("refresh", False) is False
+    mock_live.refresh.assert_not_called()
+
+
+def test_live_session_uses_configured_frame_rate():
+    formatter = _formatter(is_terminal=True)
+    formatter.refresh_per_second = 10
+
+    with patch(
+        "crewai.utilities.events.utils.console_formatter.Live"
+    ) as mock_live_class:
+        formatter.print(Tree("Crew"))
+
+    assert mock_live_class.call_args.kwargs["refresh_per_second"] == 10
+    mock_live_class.return_value.start.assert_called_once()
+
+
+def test_printing_other_content_stops_the_live_session():
+    formatter = _formatter(is_terminal=True)
+    formatter.print(Tree("Crew"))
+    live = formatter._live
+
+    formatter.print("Task completed")
+
+    assert formatter._live is None
+    assert not live.is_started
+    output = formatter.console.file.getvalue()
+    assert "Crew" in output
+    assert "Task completed" in output
+
+
+def test_final_crew_tree_is_printed_once_when_output_is_not_a_terminal():
+    formatter = _formatter(is_terminal=False)
+    tree = formatter.create_crew_tree("Research Crew", "crew-1")
+    formatter.create_task_branch(tree, "task-1")
+    output = formatter.console.file
+
+    formatter.print(tree)
+    assert "task-1" not in output.getvalue()
+
+    formatter.update_crew_tree(tree, "Research Crew", "crew-1", "completed", "done")
+
+    rendered = output.getvalue()
+    assert rendered.count("Task: task-1") == 1
+    assert rendered.index("Task: task-1") < rendered.index("Crew Completion")
+    assert formatter._live is None
+
+
+def test_final_tree_is_left_to_the_live_session_in_a_terminal():
+    formatter = _formatter(is_terminal=True)
+    mock_live = MagicMock(spec=Live)
+    formatter._live = mock_live
+    tree = Tree("Flow")
+
+    formatter.print_final_tree(tree)
+
+    mock_live.update.assert_called_once_with(tree)
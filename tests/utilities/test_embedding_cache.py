@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+from crewai.utilities.embedding_configurator import EmbeddingConfigurator
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [np.array([len(text), 1.0], dtype=np.float32) for text in input]
+
+
+class QueryAwareEmbedder(CountingEmbedder):
+    def embed_query(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [np.array([-len(text), 1.0], dtype=np.float32) for text in input]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EmbeddingCache(db_path=str(tmp_path / "embeddings.db"))
+
+
+def test_only_unseen_texts_are_embedded(cache):
+    inner = CountingEmbedder()
+    embedder = CachedEmbeddingFunction(inner, namespace="test", cache=cache)
+
+    first = embedder(["a", "bb"])
+    second = embedder(["bb", "ccc", "ccc"])
+
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    assert [vector.tolist() for vector in first] == [[1, 1], [2, 1]]
+    assert [vector.tolist() for vector in second] == [[2, 1], [3, 1], [3, 1]]
+
+
+def test_cache_is_shared_through_disk(cache, tmp_path):
+    CachedEmbeddingFunction(CountingEmbedder(), namespace="test", cache=cache)(["a"])
+
+    inner = CountingEmbedder()
+    other_process = EmbeddingCache(db_path=str(tmp_path / "embeddings.db"))
+    result = CachedEmbeddingFunction(inner, namespace="test", cache=other_process)(
+        ["a"]
+    )
+
+    assert inner.calls == []
+    assert result[0].tolist() == [1, 1]
+
+
+def test_namespaces_do_not_share_embeddings(cache):
+    inner = CountingEmbedder()
+    CachedEmbeddingFunction(inner, namespace="model-a", cache=cache)(["a"])
+    CachedEmbeddingFunction(inner, namespace="model-b", cache=cache)(["a"])
+
+    assert inner.calls == [["a"], ["a"]]
+
+
+def test_queries_are_cached_apart_only_when_embedded_differently(cache):
+    plain = CountingEmbedder()
+    embedder = CachedEmbeddingFunction(plain, namespace="plain", cache=cache)
+    embedder(["a"])
+    embedder.embed_query(["a"])
+    assert plain.calls == [["a"]]
+
+    query_aware = QueryAwareEmbedder()
+    embedder = CachedEmbeddingFunction(query_aware, namespace="aware", cache=cache)
+    embedder(["a"])
+    query = embedder.embed_query(["a"])
+    embedder.embed_query(["a"])
+    assert query_aware.calls == [["a"], ["a"]]
+    assert query[0].tolist() == [-1, 1]
+
+
+def test_memory_lru_is_bounded(tmp_path):
+    cache = EmbeddingCache(db_path=str(tmp_path / "embeddings.db"), max_memory_entries=2)
+    cache.put_many({key: np.ones(2) for key in ("a", "b", "c")})
+
+    assert list(cache._memory) == ["b", "c"]
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "b", "c"}
+
+
+def test_configurator_wraps_providers_but_not_custom_embedders(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    configurator = EmbeddingConfigurator()
+
+    cached = configurator.configure_embedder(
+        {"provider": "openai", "config": {"model": "text-embedding-3-large"}}
+    )
+    uncached = configurator.configure_embedder(
+        {
+            "provider": "openai",
+            "config": {"model": "text-embedding-3-large"},
+            "cache": False,
+        }
+    )
+    custom = CountingEmbedder()
+
+    assert isinstance(cached, CachedEmbeddingFunction)
+    assert cached.namespace == "openai:model=text-embedding-3-large"
+    assert cached.name() == "openai"
+    assert not isinstance(uncached, CachedEmbeddingFunction)
+    assert (
+        configurator.configure_embedder(
+            {"provider": "custom", "config": {"embedder": custom}}
+        )
+        is custom
+    )
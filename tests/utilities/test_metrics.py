@@ -0,0 +1,256 @@
+import urllib.request
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.listeners.metrics_listener import MetricsListener
+from crewai.utilities.events.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+    LLMStreamChunkEvent,
+)
+from crewai.utilities.events.memory_events import MemoryQueryCompletedEvent
+from crewai.utilities.events.task_events import TaskFailedEvent, TaskStartedEvent
+from crewai.utilities.events.tool_usage_events import ToolUsageFinishedEvent
+from crewai.utilities.metrics import (
+    MetricsRegistry,
+    enable_metrics,
+    start_metrics_server,
+)
+from crewai.utilities.rpm_controller import RPMController
+
+
+def _sample(snapshot, name, **labels):
+    return next(
+        sample
+        for sample in snapshot[name]["samples"]
+        if sample["labels"] == labels
+    )
+
+
+def test_counter_appends_total_suffix_and_counts_per_label_set():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests", "Requests.", ("status",))
+
+    requests.labels(status="ok").inc()
+    requests.labels("ok").inc(2)
+    requests.labels(status="error").inc()
+
+    assert requests.name == "requests_total"
+    assert registry.counter("requests_total", "", ("status",)) is requests
+    snapshot = registry.snapshot()
+    assert _sample(snapshot, "requests_total", status="ok")["value"] == 3
+    assert _sample(snapshot, "requests_total", status="error")["value"] == 1
+
+
+def test_registering_a_metric_twice_with_other_labels_fails():
+    registry = MetricsRegistry()
+    registry.histogram("latency_seconds", "", ("model",))
+
+    with pytest.raises(ValueError):
+        registry.histogram("latency_seconds", "", ("tool",))
+    with pytest.raises(ValueError):
+        registry.histogram("latency_seconds").observe(1)
+
+
+def test_histogram_percentiles_stay_within_relative_error():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds")
+
+    for value in range(1, 1001):
+        histogram.observe(value / 1000)
+
+    summary = registry.snapshot()["latency_seconds"]["samples"][0]
+    assert summary["count"] == 1000
+    assert summary["sum"] == pytest.approx(500.5)
+    assert summary["min"] == 0.001
+    assert summary["max"] == 1.0
+    assert summary["p50"] == pytest.approx(0.5, rel=0.01)
+    assert summary["p90"] == pytest.approx(0.9, rel=0.01)
+    assert summary["p99"] == pytest.approx(0.99, rel=0.01)
+
+
+def test_prometheus_exposition():
+    registry = MetricsRegistry()
+    registry.counter("crewai_llm_requests", "LLM calls.", ("model",)).labels(
+        model='gpt "4"'
+    ).inc()
+    latency = registry.histogram("crewai_tool_latency_seconds", "Tool time.", buckets=(0.1, 1))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(2)
+
+    text = registry.to_prometheus()
+
+    assert "# TYPE crewai_llm_requests_total counter" in text
+    assert 'crewai_llm_requests_total{model="gpt \\"4\\""} 1.0' in text
+    assert "# TYPE crewai_tool_latency_seconds histogram" in text
+    assert 'crewai_tool_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'crewai_tool_latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'crewai_tool_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "crewai_tool_latency_seconds_count 3" in text
+    assert "crewai_tool_latency_seconds_sum 2.55" in text
+    assert "# EOF" not in text
+
+
+def test_openmetrics_exposition_names_counter_families_without_suffix():
+    registry = MetricsRegistry()
+    registry.counter("crewai_tool_calls", "Tool calls.").inc()
+
+    text = registry.to_openmetrics()
+
+    assert "# TYPE crewai_tool_calls counter" in text
+    assert "crewai_tool_calls_total 1.0" in text
+    assert text.endswith("# EOF\n")
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_metrics_server_negotiates_format():
+    registry = MetricsRegistry()
+    registry.counter("crewai_tool_calls").inc()
+    server = start_metrics_server(port=0, registry=registry)
+    url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+    try:
+        with urllib.request.urlopen(url) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "# EOF" not in response.read().decode()
+
+        request = urllib.request.Request(
+            url, headers={"Accept": "application/openmetrics-text"}
+        )
+        with urllib.request.urlopen(request) as response:
+            assert response.headers["Content-Type"].startswith(
+                "application/openmetrics-text"
+            )
+            assert response.read().decode().endswith("# EOF\n")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_listener_records_llm_tool_memory_and_task_metrics():
+    registry = MetricsRegistry()
+    llm = SimpleNamespace(model="gpt-4o-mini")
+    task = SimpleNamespace(agent=SimpleNamespace(role="Researcher"))
+    started_at = datetime.now()
+
+    with crewai_event_bus.scoped_handlers():
+        MetricsListener(registry)
+
+        crewai_event_bus.emit(llm, LLMCallStartedEvent(messages="hi"))
+        crewai_event_bus.emit(llm, LLMStreamChunkEvent(chunk="he"))
+        crewai_event_bus.emit(llm, LLMStreamChunkEvent(chunk="llo"))
+        crewai_event_bus.emit(
+            llm,
+            LLMCallCompletedEvent(response="hello", call_type=LLMCallType.LLM_CALL),
+        )
+        crewai_event_bus.emit(
+            None,
+            ToolUsageFinishedEvent(
+                tool_name="search",
+                tool_args={},
+                started_at=started_at,
+                finished_at=started_at + timedelta(seconds=2),
+                from_cache=True,
+                output="result",
+            ),
+        )
+        crewai_event_bus.emit(
+            None,
+            MemoryQueryCompletedEvent(
+                query="q",
+                results=[],
+                limit=3,
+                query_time_ms=250,
+                source_type="short_term_memory",
+            ),
+        )
+        crewai_event_bus.emit(task, TaskStartedEvent(context=None))
+        crewai_event_bus.emit(task, TaskFailedEvent(error="boom"))
+
+    snapshot = registry.snapshot()
+    assert (
+        _sample(
+            snapshot, "crewai_llm_requests_total", model="gpt-4o-mini", status="success"
+        )["value"]
+        == 1
+    )
+    assert _sample(snapshot, "crewai_llm_latency_seconds", model="gpt-4o-mini")[
+        "count"
+    ] == 1
+    assert _sample(
+        snapshot, "crewai_llm_time_to_first_token_seconds", model="gpt-4o-mini"
+    )["count"] == 1
+    assert (
+        _sample(snapshot, "crewai_tool_calls_total", tool="search", cache="hit")[
+            "value"
+        ]
+        == 1
+    )
+    assert _sample(snapshot, "crewai_tool_latency_seconds", tool="search")[
+        "sum"
+    ] == pytest.approx(2)
+    assert _sample(
+        snapshot, "crewai_memory_query_seconds", source="short_term_memory"
+    )["sum"] == pytest.approx(0.25)
+    assert _sample(
+        snapshot, "crewai_task_duration_seconds", agent="Researcher", status="error"
+    )["count"] == 1
+
+
+def test_reset_keeps_enabled_listeners_recording(monkeypatch):
+    monkeypatch.setattr("crewai.utilities.metrics._listeners", {})
+    registry = MetricsRegistry()
+    started_at = datetime.now()
+
+    def tool_used():
+        crewai_event_bus.emit(
+            None,
+            ToolUsageFinishedEvent(
+                tool_name="search",
+                tool_args={},
+                started_at=started_at,
+                finished_at=started_at + timedelta(seconds=1),
+                from_cache=False,
+                output="result",
+            ),
+        )
+
+    with crewai_event_bus.scoped_handlers():
+        enable_metrics(registry)
+        tool_used()
+        tool_used()
+        registry.reset()
+        assert registry.snapshot()["crewai_tool_calls_total"]["samples"] == []
+
+        tool_used()
+
+    snapshot = registry.snapshot()
+    assert (
+        _sample(snapshot, "crewai_tool_calls_total", tool="search", cache="miss")["value"]
+        == 1
+    )
+    assert (
+        'crewai_tool_calls_total{tool="search",cache="miss"} 1.0'
+        in registry.to_prometheus()
+    )
+
+
+def test_rate_limiter_records_only_actual_waits_into_enabled_registries(monkeypatch):
+    monkeypatch.setattr("crewai.utilities.rpm_controller.time.sleep", lambda _: None)
+    registry = MetricsRegistry()
+    controller = RPMController(max_rpm=1)
+    try:
+        with crewai_event_bus.scoped_handlers():
+            MetricsListener(registry)
+            controller.check_or_wait()
+            controller.check_or_wait()
+        controller.check_or_wait()
+    finally:
+        controller.stop_rpm_counter()
+
+    # Only the second call had to wait; the third ran without a listener
+    assert _sample(registry.snapshot(), "crewai_rate_limiter_wait_seconds")["count"] == 1
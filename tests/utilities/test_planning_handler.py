@@ -180,3 +180,32 @@ class InternalCrewPlanner:
                 crew_planner_different_llm.tasks
             )
             execute.assert_called_once()
+
+
+def test_crew_plans_are_cached_when_enabled():
+    from crewai.utilities.plan_cache import get_plan_cache
+
+    get_plan_cache().clear()
+    tasks = [
+        Task(
+            description="Task 1",
+            expected_output="Output 1",
+            agent=Agent(role="Agent 1", goal="Goal 1", backstory="Backstory 1"),
+        )
+    ]
+    plans = PlannerTaskPydanticOutput(
+        list_of_plans_per_task=[PlanPerTask(task="Task1", plan="Plan 1")]
+    )
+
+    with patch.object(Task, "execute_sync") as execute:
+        execute.return_value = TaskOutput(
+            description="Description", agent="agent", pydantic=plans
+        )
+        CrewPlanner(tasks, None, cache=True)._handle_crew_planning()
+        cached = CrewPlanner(tasks, None, cache=True)._handle_crew_planning()
+        CrewPlanner(tasks, None)._handle_crew_planning()
+        CrewPlanner(tasks, "gpt-4o", cache=True)._handle_crew_planning()
+
+    assert cached == plans
+    assert execute.call_count == 3
+    get_plan_cache().clear()
@@ -0,0 +1,235 @@
+import sqlite3
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.memory.short_term.short_term_memory import ShortTermMemory
+from crewai.utilities import vector_index
+from crewai.utilities.vector_index import (
+    LocalVectorIndex,
+    register_vector_backend,
+    resolve_vector_backend,
+)
+
+VOCABULARY = ["cat", "dog", "car", "bike", "sun"]
+
+
+def bag_of_words(texts):
+    return [
+        [float(text.lower().count(word)) for word in VOCABULARY] + [0.01]
+        for text in texts
+    ]
+
+
+class BagOfWordsEmbedder(EmbeddingFunction):
+    def __init__(self):
+        pass
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [np.array(vector, dtype=np.float32) for vector in bag_of_words(input)]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = LocalVectorIndex(tmp_path / "index", embedding_function=bag_of_words)
+    index.add(
+        documents=["a cat and a cat", "a dog", "a fast car", "a red bike"],
+        metadatas=[
+            {"kind": "animal", "year": 2020},
+            {"kind": "animal", "year": 2024},
+            {"kind": "vehicle", "year": 2022},
+            {"kind": "vehicle", "year": 2018},
+        ],
+        ids=["cat", "dog", "car", "bike"],
+    )
+    return index
+
+
+def test_query_returns_nearest_first(index):
+    result = index.query(query_texts="cat", n_results=2)
+
+    assert result["ids"][0][0] == "cat"
+    assert result["documents"][0][0] == "a cat and a cat"
+    assert result["metadatas"][0][0] == {"kind": "animal", "year": 2020}
+    assert result["distances"][0][0] == pytest.approx(0, abs=1e-3)
+    assert result["distances"][0][0] <= result["distances"][0][1]
+
+
+def test_batched_queries(index):
+    result = index.query(query_texts=["dog", "bike", "car"], n_results=1)
+
+    assert result["ids"] == [["dog"], ["bike"], ["car"]]
+
+
+def test_metadata_filters(index):
+    result = index.query(query_texts="cat", n_results=4, where={"kind": "vehicle"})
+    assert set(result["ids"][0]) == {"car", "bike"}
+
+    result = index.query(
+        query_texts="cat",
+        n_results=4,
+        where={"$and": [{"kind": "animal"}, {"year": {"$gte": 2021}}]},
+    )
+    assert result["ids"][0] == ["dog"]
+
+    result = index.query(
+        query_texts="cat", n_results=4, where={"kind": {"$in": ["mineral"]}}
+    )
+    assert result["ids"] == [[]]
+
+    result = index.query(
+        query_texts="cat",
+        n_results=4,
+        where={"$or": [{"year": {"$lt": 2019}}, {"kind": {"$ne": "vehicle"}}]},
+    )
+    assert set(result["ids"][0]) == {"cat", "dog", "bike"}
+
+    result = index.query(
+        query_texts="cat", n_results=4, where={"year": {"$nin": [2020, 2024]}}
+    )
+    assert set(result["ids"][0]) == {"car", "bike"}
+
+
+def test_metadata_filters_follow_upserts(index):
+    index.query(query_texts="cat", n_results=1, where={"kind": "animal"})
+    index.upsert(
+        documents=["a sun", "a dog and a cat"],
+        metadatas=[{"kind": "star", "year": 2030}, {"kind": "animal"}],
+        ids=["sun", "dog"],
+    )
+
+    result = index.query(query_texts="cat", n_results=4, where={"kind": "animal"})
+    assert set(result["ids"][0]) == {"cat", "dog"}
+    result = index.query(query_texts="sun", n_results=4, where={"year": {"$gt": 2024}})
+    assert result["ids"] == [["sun"]]
+    # The replaced dog entry has no year, which matches a None filter
+    result = index.query(query_texts="dog", n_results=4, where={"year": None})
+    assert result["ids"] == [["dog"]]
+
+
+def test_upsert_replaces_existing_entry(index):
+    index.upsert(documents=["a sun"], metadatas=[{"kind": "star"}], ids=["cat"])
+
+    assert index.count() == 4
+    result = index.query(query_texts="cat", n_results=4)
+    assert "a cat and a cat" not in result["documents"][0]
+    assert index.query(query_texts="sun", n_results=1)["ids"] == [["cat"]]
+
+
+def test_index_is_persistent(index, tmp_path):
+    reopened = LocalVectorIndex(tmp_path / "index", embedding_function=bag_of_words)
+
+    assert reopened.count() == 4
+    assert isinstance(reopened._matrix, np.memmap)
+    assert reopened.query(query_texts="bike", n_results=1)["ids"] == [["bike"]]
+
+
+def test_failed_upsert_leaves_vectors_aligned(index, tmp_path):
+    with pytest.raises(TypeError):
+        index.add(documents=["a sun"], metadatas=[{"when": object()}], ids=["sun"])
+    with pytest.raises(sqlite3.Error):
+        index.add(documents=["a sun"], metadatas=[{"kind": "star"}], ids=[None])
+    index.add(documents=["a dog and a dog"], ids=["dogs"])
+
+    for reopened in (index, LocalVectorIndex(tmp_path / "index", bag_of_words)):
+        assert reopened.count() == 5
+        assert reopened.query(query_texts="sun", n_results=1)["distances"][0][0] > 0.5
+        assert reopened.query(query_texts="dog dog", n_results=1)["ids"] == [["dogs"]]
+
+
+def test_compact_drops_deleted_entries(index, tmp_path):
+    index.delete(["cat", "car"])
+    index.upsert(documents=["a sun"], ids=["dog"])
+    index.compact()
+
+    assert index.count() == 2
+    assert (tmp_path / "index" / "embeddings.f32").stat().st_size == 2 * 6 * 4
+    assert index.query(query_texts="sun", n_results=1)["ids"] == [["dog"]]
+    assert index.query(query_texts="bike", n_results=1)["ids"] == [["bike"]]
+    reopened = LocalVectorIndex(tmp_path / "index", embedding_function=bag_of_words)
+    assert reopened.query(query_texts="sun", n_results=2)["ids"] == [["dog", "bike"]]
+
+
+def test_query_survives_concurrent_compaction(index, monkeypatch):
+    argpartition = np.argpartition
+    compacted = []
+
+    def compact_during_search(*args, **kwargs):
+        # Renumber rows after the candidates were snapshotted
+        if not compacted:
+            compacted.append(True)
+            index.delete(["cat", "dog"])
+            index.compact()
+        return argpartition(*args, **kwargs)
+
+    monkeypatch.setattr(np, "argpartition", compact_during_search)
+    result = index.query(query_texts="bike", n_results=1)
+
+    assert compacted
+    assert result["ids"] == [["bike"]]
+    assert result["documents"] == [["a red bike"]]
+    assert result["metadatas"] == [[{"kind": "vehicle", "year": 2018}]]
+
+
+def test_reset_and_dimension_check(index):
+    with pytest.raises(ValueError):
+        index.add(documents=["x"], ids=["x"], embeddings=[[1.0, 0.0]])
+
+    index.reset()
+    assert index.count() == 0
+    assert index.query(query_texts="cat", n_results=3)["ids"] == [[]]
+
+
+def test_resolve_vector_backend(monkeypatch):
+    monkeypatch.delenv("CREWAI_VECTOR_BACKEND", raising=False)
+    assert resolve_vector_backend() == "chromadb"
+    monkeypatch.setenv("CREWAI_VECTOR_BACKEND", "local")
+    assert resolve_vector_backend() == "local"
+    assert resolve_vector_backend("chromadb") == "chromadb"
+    with pytest.raises(ValueError):
+        resolve_vector_backend("faiss")
+
+
+def test_registered_vector_backend_is_used_by_memory(tmp_path, monkeypatch):
+    created = []
+
+    def factory(path, embedding_function):
+        created.append(path)
+        return LocalVectorIndex(path, embedding_function)
+
+    monkeypatch.setattr(vector_index, "_VECTOR_BACKENDS", dict(vector_index._VECTOR_BACKENDS))
+    register_vector_backend("custom", factory)
+    with pytest.raises(ValueError):
+        register_vector_backend("chromadb", factory)
+
+    crew = type("StubCrew", (), {"agents": [], "memory_config": {"vector_backend": "custom"}})()
+    memory = ShortTermMemory(
+        crew=crew,
+        embedder_config={"provider": "custom", "config": {"embedder": BagOfWordsEmbedder()}},
+        path=str(tmp_path),
+    )
+
+    assert memory.storage.backend == "custom"
+    assert created == [str(tmp_path / "short_term_index")]
+
+
+def test_knowledge_storage_local_backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("CREWAI_STORAGE_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+        lambda: str(tmp_path),
+    )
+    storage = KnowledgeStorage(
+        embedder={"provider": "custom", "config": {"embedder": BagOfWordsEmbedder()}},
+        collection_name="test",
+        backend="local",
+    )
+    storage.initialize_knowledge_storage()
+    storage.save(["a cat", "a car"], [{"source": "a"}, {"source": "b"}])
+
+    results = storage.search(["car"], limit=1, score_threshold=0)
+
+    assert [result["context"] for result in results] == ["a car"]
+    assert storage.app is None